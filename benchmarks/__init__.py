@@ -0,0 +1,212 @@
+"""Micro-benchmarks measuring PRAW's own processing cost.
+
+The benchmarks do not issue any network requests. Response bodies are read
+from the recorded betamax cassettes in ``tests/integration/cassettes``, and
+served to :class:`.Reddit` instances by a :class:`FakeSession`.
+
+Run the whole suite, comparing each result to ``benchmarks/baseline.json``,
+with ``python -m benchmarks``.
+
+"""
+import base64
+import gzip
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+from collections import OrderedDict
+from urllib.parse import parse_qs, urlparse
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+# This line imports from the local PRAW rather than the global installed PRAW.
+sys.path.insert(0, os.path.abspath(os.path.join(__file__, "..", "..")))
+
+import praw  # noqa: E402
+
+CASSETTES = os.path.abspath(
+    os.path.join(__file__, "..", "..", "tests", "integration", "cassettes")
+)
+
+#: The results of :func:`measure` by benchmark name, in the order run.
+RESULTS = OrderedDict()
+
+_TOKEN = json.dumps(
+    {
+        "access_token": "benchmark",
+        "expires_in": 3600,
+        "scope": "*",
+        "token_type": "bearer",
+    }
+).encode()
+
+
+def _interaction_body(interaction):
+    body = interaction["response"]["body"]
+    if body.get("string"):
+        return body["string"]
+    content = base64.b64decode(body["base64_string"])
+    headers = interaction["response"]["headers"]
+    if "gzip" in headers.get("Content-Encoding", []):
+        content = gzip.decompress(content)
+    return content.decode("utf-8")
+
+
+def cassette_interactions(cassette, uri_part=""):
+    """Return the matching interactions as ``(request, body)`` tuples.
+
+    :param cassette: The name of the cassette, without the ``.json`` suffix.
+    :param uri_part: A substring of the URI of the desired interactions
+        (default: all interactions).
+
+    Each ``request`` is the recorded request dictionary, and ``body`` the
+    decoded JSON body of the response.
+
+    """
+    with open(os.path.join(CASSETTES, cassette + ".json")) as fp:
+        interactions = json.load(fp)["http_interactions"]
+    return [
+        (interaction["request"], json.loads(_interaction_body(interaction)))
+        for interaction in interactions
+        if uri_part in interaction["request"]["uri"]
+        and "access_token" not in interaction["request"]["uri"]
+    ]
+
+
+def cassette_body(cassette, uri_part):
+    """Return the decoded JSON body of the first matching interaction.
+
+    :param cassette: The name of the cassette, without the ``.json`` suffix.
+    :param uri_part: A substring of the URI of the desired interaction.
+
+    """
+    interactions = cassette_interactions(cassette, uri_part)
+    if not interactions:
+        raise ValueError("no interaction matching {!r}".format(uri_part))
+    return interactions[0][1]
+
+
+class FakeSession:
+    """A ``requests.Session`` replacement answering without a network.
+
+    :param route: A callable passed the method, path, query parameters and
+        form data of each request. It returns the JSON encoded response body
+        as bytes. Encode bodies ahead of time so that the cost of encoding is
+        not measured.
+
+    Access tokens are granted without calling ``route``.
+
+    """
+
+    def __init__(self, route):
+        """Initialize a FakeSession instance."""
+        self.headers = {}
+        self.route = route
+
+    def close(self):
+        """Do nothing, as there are no connections."""
+
+    def request(self, method, url, params=None, data=None, **_kwargs):
+        """Return a response with the body returned by ``route``."""
+        parsed = urlparse(url)
+        if parsed.path.endswith("access_token"):
+            content = _TOKEN
+        else:
+            if isinstance(data, list):
+                data = dict(data)
+            content = self.route(
+                method, parsed.path.strip("/"), params or {}, data or {}
+            )
+        response = Response()
+        response._content = content
+        response.encoding = "utf-8"
+        response.headers = CaseInsensitiveDict(
+            {"content-type": "application/json; charset=UTF-8"}
+        )
+        response.status_code = 200
+        response.url = url
+        return response
+
+
+def fake_reddit(route, **settings):
+    """Return a :class:`.Reddit` instance using a :class:`FakeSession`.
+
+    Additional keyword arguments are passed to :class:`.Reddit`.
+
+    """
+    return praw.Reddit(
+        check_for_updates=False,
+        client_id="dummy",
+        client_secret="dummy",
+        requestor_kwargs={"session": FakeSession(route)},
+        user_agent="benchmark",
+        **settings
+    )
+
+
+def query(request):
+    """Return the form data of a recorded ``request`` as a dictionary."""
+    body = request.get("body", {}).get("string", "")
+    return {key: values[0] for key, values in parse_qs(body).items()}
+
+
+def measure(name, function, setup=None, number=10, repeat=20, items=1):
+    """Print, record and return the best time per item of ``function``.
+
+    :param name: The name of the benchmark to print.
+    :param function: The callable to time. It is passed the value returned
+        by ``setup``, if provided.
+    :param setup: A callable run before each timed call whose result is
+        passed to ``function``. Its cost is not measured (default: None).
+    :param number: The number of calls per repetition (default: 10).
+    :param repeat: The number of repetitions (default: 20).
+    :param items: The number of items processed by each call (default: 1).
+
+    The result is also recorded in :data:`RESULTS`, together with the peak
+    memory allocated per item by a separate call of ``function``.
+
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        arguments = [setup() if setup else None for _ in range(number)]
+        start = timeit.default_timer()
+        for argument in arguments:
+            if setup:
+                function(argument)
+            else:
+                function()
+        best = min(best, timeit.default_timer() - start)
+    per_item = best / number / items
+
+    # Allocations are measured separately as tracing slows down the calls.
+    argument = setup() if setup else None
+    tracemalloc.start()
+    if setup:
+        function(argument)
+    else:
+        function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    RESULTS[name] = {
+        "peak_bytes_per_item": peak / items,
+        "us_per_item": per_item * 1e6,
+    }
+    print(
+        "{:<40} {:>10.2f} us/item {:>12.0f} items/s {:>10.0f} B/item".format(
+            name, per_item * 1e6, 1 / per_item, peak / items
+        )
+    )
+    return per_item
+
+
+def reddit():
+    """Return a :class:`.Reddit` instance that is never authenticated."""
+    return praw.Reddit(
+        check_for_updates=False,
+        client_id="dummy",
+        client_secret="dummy",
+        user_agent="benchmark",
+    )
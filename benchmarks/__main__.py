@@ -0,0 +1,122 @@
+"""Run every benchmark and compare the results to the stored baseline.
+
+Run with ``python -m benchmarks``. Use ``--save`` to replace the baseline
+with the results of the run, e.g., after an intended change in performance.
+
+The exit status is 1 when a benchmark is slower, or allocates more memory,
+than its baseline by more than the threshold. Timings vary between runs,
+and between machines, by more than the effect of most changes. Hence the
+default threshold is generous, and the baseline is only meaningful on the
+machine that stored it: run with ``--save`` on the base revision first.
+When regressions are found, the benchmarks are run again, and only those
+still slower with the better result of both runs are reported.
+
+"""
+import argparse
+import json
+import os
+import sys
+
+from . import RESULTS, decode, dedup, models, objector
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+MEMORY_SLACK = 64
+MODULES = (objector, models, dedup, decode)
+
+
+def run():
+    """Run every benchmark module and return a copy of the results."""
+    RESULTS.clear()
+    for module in MODULES:
+        print("## {}".format(module.__name__))
+        module.main()
+        print()
+    return RESULTS.copy()
+
+
+def compare(baseline, threshold, verbose=True):
+    """Print the change of each result and return the regressed names."""
+    regressions = []
+    if verbose:
+        print()
+        print(
+            "{:<40} {:>10} {:>10}".format(
+                "change from baseline", "time", "memory"
+            )
+        )
+    for name, result in RESULTS.items():
+        if name not in baseline:
+            if verbose:
+                print("{:<40} {:>10} {:>10}".format(name, "new", "new"))
+            continue
+        changes = []
+        for metric in ("us_per_item", "peak_bytes_per_item"):
+            previous = baseline[name][metric]
+            changes.append(result[metric] / previous - 1 if previous else 0)
+        # Allocations of a few bytes per item are not worth reporting.
+        memory_regressed = (
+            changes[1] > threshold
+            and result["peak_bytes_per_item"]
+            - baseline[name]["peak_bytes_per_item"]
+            > MEMORY_SLACK
+        )
+        marker = ""
+        if changes[0] > threshold or memory_regressed:
+            regressions.append(name)
+            marker = "  REGRESSION"
+        if verbose:
+            print(
+                "{:<40} {:>+9.0%} {:>+9.0%}{}".format(
+                    name, changes[0], changes[1], marker
+                )
+            )
+    return regressions
+
+
+def main():
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=__doc__.split("\n")[0]
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="replace the stored baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        default=0.5,
+        type=float,
+        help="the relative slowdown reported as a regression (default: 0.5)",
+    )
+    arguments = parser.parse_args()
+
+    results = run()
+    if arguments.save:
+        with open(BASELINE, "w") as fp:
+            json.dump(RESULTS, fp, indent=2, sort_keys=True)
+            fp.write("\n")
+        print("Saved the baseline to {}".format(BASELINE))
+        return 0
+    if not os.path.exists(BASELINE):
+        print("No baseline found. Run with --save to store one.")
+        return 0
+    with open(BASELINE) as fp:
+        baseline = json.load(fp)
+    if compare(baseline, arguments.threshold, verbose=False):
+        print("Possible regressions found. Running the benchmarks again.\n")
+        for name, result in run().items():
+            if name in results:
+                results[name] = {
+                    metric: min(value, results[name][metric])
+                    for metric, value in result.items()
+                }
+        RESULTS.clear()
+        RESULTS.update(results)
+    regressions = compare(baseline, arguments.threshold)
+    if regressions:
+        print("\n{} regression(s) found.".format(len(regressions)))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""Benchmark decoding API responses with each installed JSON backend.
+
+Run with ``python -m benchmarks.decode``.
+
+Every response body recorded in the cassettes is decoded by ``requests``, as
+prawcore did before :class:`.JSONBackend` existed, and by each backend whose
+library is installed. The fetch of a submission with 2048 comments is then
+repeated with each backend to show the share of decoding in a whole request.
+
+"""
+import glob
+import json
+import os
+
+from requests import Response
+
+from praw.util.jsonbackend import JSON_BACKENDS
+
+from . import CASSETTES, _interaction_body, cassette_body, fake_reddit, measure
+from .models import encode
+from .objector import comment_tree
+
+
+def bodies():
+    """Return the JSON response bodies of all cassettes as bytes."""
+    result = []
+    for path in sorted(glob.glob(os.path.join(CASSETTES, "*.json"))):
+        with open(path) as fp:
+            interactions = json.load(fp)["http_interactions"]
+        for interaction in interactions:
+            try:
+                body = _interaction_body(interaction)
+                json.loads(body)
+            except (KeyError, ValueError):
+                continue
+            result.append(body.encode("utf-8"))
+    return result
+
+
+def backends():
+    """Return an instance of each backend whose library is installed."""
+    result = []
+    for name in sorted(JSON_BACKENDS):
+        try:
+            result.append(JSON_BACKENDS[name]())
+        except ImportError:
+            print("{:<40} not installed".format(name))
+    return result
+
+
+def bench_bodies(contents, installed):
+    """Benchmark decoding every recorded response body."""
+    responses = []
+    for content in contents:
+        response = Response()
+        response._content = content
+        response.encoding = "utf-8"
+        responses.append(response)
+    print(
+        "{} responses, {:.0f} kB".format(
+            len(contents), sum(map(len, contents)) / 1024
+        )
+    )
+
+    def decode_requests():
+        for response in responses:
+            response.json()
+
+    measure(
+        "decode cassettes with requests",
+        decode_requests,
+        number=1,
+        repeat=5,
+        items=len(contents),
+    )
+    for backend in installed:
+
+        def decode(loads=backend.loads):
+            for content in contents:
+                loads(content)
+
+        measure(
+            "decode cassettes with {}".format(backend.name),
+            decode,
+            number=1,
+            repeat=5,
+            items=len(contents),
+        )
+
+
+def bench_fetch(installed):
+    """Benchmark fetching a submission with 2048 comments per backend."""
+    comments = cassette_body(
+        "TestSubredditStreams.comments", "/r/all/comments"
+    )
+    submission = cassette_body("TestSubmission.test_gilded", "comments/2gmzqe")
+    tree = comment_tree(comments["data"]["children"], 2048)
+    body = encode([submission[0], tree])
+    for backend in installed:
+        reddit = fake_reddit(lambda *_: body, json_backend=backend)
+        measure(
+            "fetch 2048 comments with {}".format(backend.name),
+            lambda submission: submission.comments,
+            setup=lambda reddit=reddit: reddit.submission("2gmzqe"),
+            number=2,
+            repeat=10,
+            items=2048,
+        )
+
+
+def main():
+    """Run the benchmarks."""
+    installed = backends()
+    bench_bodies(bodies(), installed)
+    bench_fetch(installed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark the containers remembering the items seen by streams.
+
+Run with ``python -m benchmarks.dedup``.
+
+"""
+import tracemalloc
+from copy import deepcopy
+
+from praw.models.util import BoundedSet, RotatingBloomFilter, TimeWindowSet
+
+from . import measure
+
+
+class ListBoundedSet:
+    """The previous BoundedSet, which evicts with ``list.pop(0)``."""
+
+    def __init__(self, max_items):
+        self.max_items = max_items
+        self._fifo = []
+        self._set = set()
+
+    def __contains__(self, item):
+        return item in self._set
+
+    def add(self, item):
+        if len(self._set) == self.max_items:
+            self._set.remove(self._fifo.pop(0))
+        self._fifo.append(item)
+        self._set.add(item)
+
+
+def fill(container, count):
+    """Add ``count`` fullnames to ``container`` and return it."""
+    for item in range(count):
+        container.add("t1_{}".format(item))
+    return container
+
+
+def memory(factory, capacity):
+    """Return the bytes allocated per item by a full container.
+
+    The allocation is divided by ``capacity``. For a RotatingBloomFilter it
+    includes both filters, the previous of which is allocated up front.
+
+    """
+    tracemalloc.start()
+    container = fill(factory(capacity), capacity)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del container
+    return size / capacity
+
+
+def main():
+    """Run the benchmarks."""
+    factories = [
+        ("list BoundedSet", ListBoundedSet),
+        ("BoundedSet", BoundedSet),
+        ("TimeWindowSet", lambda capacity: TimeWindowSet(3600, capacity)),
+        ("RotatingBloomFilter", RotatingBloomFilter),
+    ]
+    for capacity in (301, 10000, 100000):
+        items = ["t1_{}".format(capacity + x) for x in range(1000)]
+        for name, factory in factories:
+
+            def add(container):
+                for item in items:
+                    container.add(item)
+                    assert item in container
+
+            # Copying a full container is much faster than filling one, and
+            # permits enough repetitions for a stable result.
+            full = fill(factory(capacity), capacity)
+            measure(
+                "add full {} ({})".format(name, capacity),
+                add,
+                setup=lambda: deepcopy(full),
+                number=1,
+                repeat=25,
+                items=len(items),
+            )
+    print()
+    for name, factory in factories:
+        print(
+            "{:<40} {:>10.1f} bytes/item".format(
+                "memory {} (100000)".format(name), memory(factory, 100000)
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
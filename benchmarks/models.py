@@ -0,0 +1,214 @@
+"""Benchmark submissions, comment forests, listings, streams and exports.
+
+Run with ``python -m benchmarks.models``.
+
+Requests are answered by a :class:`.FakeSession` from recorded cassettes,
+scaled up with synthetic items, so that the measurements include prawcore,
+the objector and the models, but no network.
+
+"""
+import copy
+import json
+import os
+import tempfile
+
+from praw.export import to_ndjson
+
+from . import cassette_body, cassette_interactions, fake_reddit, measure, query
+from .objector import comment_tree
+
+_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def base36(number):
+    """Return ``number`` in base36."""
+    digits = []
+    while True:
+        number, remainder = divmod(number, 36)
+        digits.append(_DIGITS[remainder])
+        if not number:
+            return "".join(reversed(digits))
+
+
+def encode(data):
+    """Return ``data`` as JSON encoded bytes."""
+    return json.dumps(data).encode("utf-8")
+
+
+def listing_pages(children, pages, size, step):
+    """Return ``pages`` encoded listings of renamed copies of ``children``.
+
+    Page ``k`` contains the items with the numbers ``k * step`` through
+    ``k * step + size - 1``, newest first, and has its ``after`` set to
+    ``page{k + 1}``, except for the last page.
+
+    """
+    result = []
+    for page in range(pages):
+        items = []
+        for number in reversed(range(page * step, page * step + size)):
+            item = copy.deepcopy(children[number % len(children)])
+            item["data"]["id"] = base36(number + 36 ** 5)
+            item["data"]["name"] = "t3_" + item["data"]["id"]
+            items.append(item)
+        after = "page{}".format(page + 1) if page + 1 < pages else None
+        result.append(
+            encode(
+                {
+                    "kind": "Listing",
+                    "data": {
+                        "after": after,
+                        "before": None,
+                        "children": items,
+                    },
+                }
+            )
+        )
+    return result
+
+
+def bench_fetch(comments):
+    """Benchmark fetching a submission and building its comment forest."""
+    submission = cassette_body("TestSubmission.test_gilded", "comments/2gmzqe")
+    tree = comment_tree(comments["data"]["children"], 2048)
+    body = encode([submission[0], tree])
+    reddit = fake_reddit(lambda *_: body)
+
+    def fetched():
+        result = reddit.submission("2gmzqe")
+        result.comments
+        return result
+
+    measure(
+        "fetch submission (2048 comments)",
+        lambda submission: submission.comments,
+        setup=lambda: reddit.submission("2gmzqe"),
+        number=2,
+        repeat=10,
+        items=2048,
+    )
+    measure(
+        "comment forest list (2048)",
+        lambda submission: submission.comments.list(),
+        setup=fetched,
+        number=2,
+        repeat=10,
+        items=2048,
+    )
+
+
+def bench_replace_more():
+    """Benchmark :meth:`.CommentForest.replace_more` on a large thread."""
+    responses = {}
+    for request, body in cassette_interactions(
+        "TestCommentForest.test_replace__all_large"
+    ):
+        path = request["uri"].split("oauth.reddit.com/", 1)[1].split("?")[0]
+        key = query(request).get("children") or path.strip("/")
+        responses[key] = encode(body)
+    reddit = fake_reddit(
+        lambda method, path, params, data: responses[
+            data.get("children") or path
+        ]
+    )
+
+    def fetched():
+        submission = reddit.submission("n49rw")
+        submission.comments
+        return submission
+
+    measure(
+        "replace_more (235 requests)",
+        lambda submission: submission.comments.replace_more(limit=None),
+        setup=fetched,
+        number=1,
+        repeat=3,
+        items=len(responses) - 1,
+    )
+
+
+def bench_listing(children):
+    """Benchmark iterating a :class:`.ListingGenerator` over ten pages."""
+    pages = listing_pages(children, 10, 100, 100)
+    reddit = fake_reddit(
+        lambda method, path, params, data: pages[
+            int(params.get("after", "page0")[4:])
+        ]
+    )
+    measure(
+        "iterate listing (1000 submissions)",
+        lambda: list(reddit.subreddit("bench").new(limit=None)),
+        number=1,
+        repeat=10,
+        items=1000,
+    )
+    measure(
+        "iterate raw listing (1000 submissions)",
+        lambda: list(reddit.subreddit("bench").new(limit=None, raw=True)),
+        number=1,
+        repeat=10,
+        items=1000,
+    )
+
+
+def bench_export(children):
+    """Benchmark exporting a raw listing of ten pages to NDJSON."""
+    pages = listing_pages(children, 10, 100, 100)
+    reddit = fake_reddit(
+        lambda method, path, params, data: pages[
+            int(params.get("after", "page0")[4:])
+        ]
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "export-{index}.ndjson")
+        measure(
+            "export raw listing (1000 submissions)",
+            lambda: to_ndjson(
+                reddit.subreddit("bench").new(limit=None, raw=True), path
+            ),
+            number=1,
+            repeat=10,
+            items=1000,
+        )
+
+
+def bench_stream(children, raw=False):
+    """Benchmark the polls of a stream receiving ten new items each."""
+    number, repeat = 5, 10
+    pages = iter(listing_pages(children, number * repeat + 3, 100, 10))
+    reddit = fake_reddit(lambda *_: next(pages))
+    stream = reddit.subreddit("bench").stream.submissions(
+        pause_after=-1, raw=raw
+    )
+    for _ in iter(lambda: next(stream), None):
+        pass
+
+    def poll():
+        for _ in iter(lambda: next(stream), None):
+            pass
+
+    measure(
+        "stream poll{} (10 new of 100)".format(" raw" if raw else ""),
+        poll,
+        number=number,
+        repeat=repeat,
+        items=10,
+    )
+
+
+def main():
+    """Run the benchmarks."""
+    comments = cassette_body(
+        "TestSubredditStreams.comments", "/r/all/comments"
+    )
+    submissions = cassette_body("TestSubredditListings.test_new", "/new")
+    bench_fetch(comments)
+    bench_replace_more()
+    bench_listing(submissions["data"]["children"])
+    bench_export(submissions["data"]["children"])
+    bench_stream(submissions["data"]["children"])
+    bench_stream(submissions["data"]["children"], raw=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark :meth:`.Objector.objectify` on comment trees and modmail.
+
+Run with ``python -m benchmarks.objector``.
+
+"""
+import copy
+
+from . import cassette_body, measure, reddit
+
+
+def comment_tree(comments, size, depth=4):
+    """Return a listing of ``size`` comments nested up to ``depth`` levels."""
+    remaining = [size]
+
+    def level(current_depth):
+        children = []
+        while remaining[0] and len(children) < len(comments):
+            comment = copy.deepcopy(comments[remaining[0] % len(comments)])
+            remaining[0] -= 1
+            replies = ""
+            if current_depth < depth and remaining[0]:
+                replies = level(current_depth + 1)
+            comment["data"]["replies"] = replies
+            children.append(comment)
+            if current_depth:
+                break
+        return {"kind": "Listing", "data": {"children": children}}
+
+    listing = level(0)
+    while remaining[0]:
+        listing["data"]["children"].extend(level(0)["data"]["children"])
+    return listing
+
+
+def main():
+    """Run the benchmarks."""
+    objector = reddit()._objector
+    comments = cassette_body(
+        "TestSubredditStreams.comments", "/r/all/comments"
+    )
+    children = comments["data"]["children"]
+    tree = comment_tree(children, 2048)
+    modmail = cassette_body("TestModmailConversation.test_highlight", "ik72?")
+    messages = len(modmail["messages"]) + len(modmail["modActions"])
+
+    unmatched = dict(children[0]["data"])
+    del unmatched["parent_id"]
+    measure(
+        "objectify unmatched dict",
+        objector.objectify,
+        setup=lambda: dict(unmatched),
+        number=1000,
+    )
+    measure(
+        "objectify comment listing (100)",
+        objector.objectify,
+        setup=lambda: copy.deepcopy(comments),
+        items=len(children),
+    )
+    measure(
+        "objectify comment tree (2048)",
+        objector.objectify,
+        setup=lambda: copy.deepcopy(tree),
+        number=2,
+        items=2048,
+    )
+    measure(
+        "objectify modmail conversation",
+        objector.objectify,
+        setup=lambda: copy.deepcopy(modmail),
+        number=100,
+        items=messages,
+    )
+
+
+if __name__ == "__main__":
+    main()
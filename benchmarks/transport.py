@@ -0,0 +1,128 @@
+"""Benchmark concurrent callers sharing the connection pool of a requestor.
+
+Run with ``python -m benchmarks.transport``.
+
+Unlike the other benchmarks, this one issues HTTP requests, to a server on
+the loopback interface running in another process. The server delays each
+new connection and each response to simulate the TLS handshake and the
+network round trip. When more callers than ``pool_maxsize`` issue requests
+concurrently, the surplus connections are discarded after each request, and
+the next request pays for a new handshake. The benchmark reports the
+throughput and the number of connections opened.
+
+"""
+import logging
+import multiprocessing
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+from praw.requestor import Requestor
+
+CONNECT = 0.1
+ROUND_TRIP = 0.05
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Reply to every GET request with a small JSON body."""
+
+    connections = None
+    disable_nagle_algorithm = True
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        """Count the connection and simulate its TLS handshake."""
+        with self.connections.get_lock():
+            self.connections.value += 1
+        time.sleep(CONNECT)
+        super().setup()
+
+    def do_GET(self):  # noqa: N802
+        """Reply after :data:`ROUND_TRIP` seconds."""
+        time.sleep(ROUND_TRIP)
+        body = b'{"kind": "t1", "data": {}}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        """Do not log requests."""
+
+
+class Server(ThreadingMixIn, HTTPServer):
+    """Handle each connection in its own thread."""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def free_port():
+    """Return a port on the loopback interface that is not in use."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def serve(port, connections):
+    """Serve on ``port`` until the process is terminated."""
+    Handler.connections = connections
+    Server(("127.0.0.1", port), Handler).serve_forever()
+
+
+def run(url, callers, requests_per_caller, **requestor_kwargs):
+    """Return the requests per second of ``callers`` concurrent threads."""
+    requestor = Requestor(
+        "praw:benchmark", max_validators=0, **requestor_kwargs
+    )
+
+    def call(_):
+        for _ in range(requests_per_caller):
+            requestor.request("GET", url)
+
+    with ThreadPoolExecutor(callers) as executor:
+        start = time.time()
+        list(executor.map(call, range(callers)))
+        elapsed = time.time() - start
+    requestor.close()
+    return callers * requests_per_caller / elapsed
+
+
+def main():
+    """Run the benchmarks."""
+    # Discarded connections are otherwise logged for every request.
+    logging.getLogger("urllib3.connectionpool").setLevel(logging.ERROR)
+    port = free_port()
+    connections = multiprocessing.Value("i", 0)
+    # The server runs in its own process so as not to compete for the GIL.
+    process = multiprocessing.Process(
+        target=serve, args=(port, connections), daemon=True
+    )
+    process.start()
+    time.sleep(0.5)
+    url = "http://127.0.0.1:{}/r/redditdev/about".format(port)
+    try:
+        for callers in (1, 8, 64):
+            for name, kwargs in (
+                ("default pool", {}),
+                ("pool_maxsize=64", {"pool_maxsize": 64}),
+            ):
+                connections.value = 0
+                requests_per_caller = max(10, 640 // callers)
+                rate = run(url, callers, requests_per_caller, **kwargs)
+                print(
+                    "{:<40} {:>8.0f} requests/s {:>6} connections".format(
+                        "{} callers, {}".format(callers, name),
+                        rate,
+                        connections.value,
+                    )
+                )
+    finally:
+        process.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,376 @@
+"""Provide the AsyncReddit class."""
+import asyncio
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, IO, List, Optional, TypeVar, Union
+
+from .models.listing.generator import ListingGenerator
+from .models.util import StreamPoller
+from .reddit import Reddit
+
+CommentForest = TypeVar("CommentForest")
+MoreComments = TypeVar("MoreComments")
+RedditBase = TypeVar("RedditBase")
+
+_EXHAUSTED = object()
+
+try:
+    _get_running_loop = asyncio.get_running_loop
+except AttributeError:  # Python < 3.7
+    _get_running_loop = asyncio.get_event_loop
+
+
+def _next_or_exhausted(iterator):
+    """Return the next item of ``iterator`` or ``_EXHAUSTED``.
+
+    ``StopIteration`` cannot be propagated through a future, so it is
+    translated into a sentinel value.
+
+    """
+    try:
+        return next(iterator)
+    except StopIteration:
+        return _EXHAUSTED
+
+
+class AsyncListingGenerator:
+    """Asynchronously iterate over the items of a :class:`.ListingGenerator`.
+
+    Only the iterations that require a request to be issued are run in the
+    executor of the owning :class:`.AsyncReddit`; items of an already fetched
+    page are returned directly.
+
+    """
+
+    def __init__(self, async_reddit: "AsyncReddit", generator: Any):
+        """Initialize an AsyncListingGenerator instance.
+
+        :param async_reddit: An instance of :class:`.AsyncReddit`.
+        :param generator: The iterable to consume, typically an instance of
+            :class:`.ListingGenerator`.
+
+        """
+        self._async_reddit = async_reddit
+        self._generator = iter(generator)
+
+    def __aiter__(self) -> "AsyncListingGenerator":
+        """Permit AsyncListingGenerator to operate as an async iterator."""
+        return self
+
+    async def __anext__(self) -> Any:
+        """Return the next item, fetching the next page when needed."""
+        if self._requires_request():
+            item = await self._async_reddit.call(
+                _next_or_exhausted, self._generator
+            )
+        else:
+            item = _next_or_exhausted(self._generator)
+        if item is _EXHAUSTED:
+            raise StopAsyncIteration
+        return item
+
+    def _requires_request(self):
+        generator = self._generator
+        if not isinstance(generator, ListingGenerator):
+            return True
+        return generator._listing is None or generator._list_index >= len(
+            generator._listing
+        )
+
+
+class AsyncStream:
+    """Asynchronously yield new items from a stream.
+
+    The stream behaves as :func:`.stream_generator`, including its
+    ``poll_policy``, but the requests are run in the executor of the owning
+    :class:`.AsyncReddit`, and the delay between them is awaited with
+    :func:`asyncio.sleep` rather than blocking a thread of the executor.
+
+    """
+
+    def __init__(
+        self,
+        async_reddit: "AsyncReddit",
+        function: Callable[..., Any],
+        pause_after: Optional[int] = None,
+        skip_existing: bool = False,
+        raw: bool = False,
+        **stream_options: Any
+    ):
+        """Initialize an AsyncStream instance.
+
+        :param async_reddit: An instance of :class:`.AsyncReddit`.
+        :param function: A callable that returns a ListingGenerator, e.g.
+            ``subreddit.comments`` or ``subreddit.new``.
+        :param pause_after: See :func:`.stream_generator` (default: None).
+        :param skip_existing: See :func:`.stream_generator` (default: False).
+        :param raw: See :func:`.stream_generator` (default: False).
+
+        Additional keyword arguments are passed to :class:`.StreamPoller`.
+
+        """
+        if raw:
+            stream_options["raw"] = True
+        self._async_reddit = async_reddit
+        self._items = deque()
+        self._pause_after = pause_after
+        self._poller = StreamPoller(function, **stream_options)
+        self._response = None
+        self._responses_without_new = 0
+        self._skip_existing = skip_existing and not self._poller.resumed
+
+    def __aiter__(self) -> "AsyncStream":
+        """Permit AsyncStream to operate as an async iterator."""
+        return self
+
+    async def __anext__(self) -> Any:
+        """Return the next new item, or ``None`` when paused."""
+        valid_pause_after = self._pause_after is not None
+        while True:
+            if self._items:
+                return self._items.popleft()
+            if self._response is not None:
+                # The items of the last response were all returned.
+                items, self._response = self._response, None
+                if items:
+                    await self._async_reddit.call(self._poller.save_checkpoint)
+                if valid_pause_after and self._pause_after < 0:
+                    return None
+                delay = self._poller.delay(items)
+                if items:
+                    self._responses_without_new = 0
+                else:
+                    self._responses_without_new += 1
+                    if (
+                        valid_pause_after
+                        and self._responses_without_new > self._pause_after
+                    ):
+                        self._poller.reset_delay()
+                        self._responses_without_new = 0
+                        return None
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            items = await self._async_reddit.call(self._poller.poll)
+            if not self._skip_existing:
+                self._items.extend(items)
+            self._skip_existing = False
+            self._response = items
+
+
+class AsyncReddit:
+    """Provide awaitable access to Reddit's API.
+
+    :class:`.AsyncReddit` wraps a :class:`.Reddit` instance and runs its
+    blocking network calls in an executor so that many listings, streams and
+    fetches can make progress concurrently from a single event loop. The
+    objects it returns are the regular PRAW models:
+
+    .. code-block:: python
+
+       import asyncio
+       import praw
+
+       async def main():
+           async with praw.AsyncReddit(client_id='CLIENT_ID',
+                                       client_secret='CLIENT_SECRET',
+                                       user_agent='USERAGENT') as reddit:
+               subreddit = reddit.reddit.subreddit('redditdev')
+               async for submission in reddit.listing(subreddit.new()):
+                   print(submission.title)
+
+       asyncio.get_event_loop().run_until_complete(main())
+
+    .. note:: All calls share the underlying session of the wrapped
+       :class:`.Reddit` instance, and thus its rate limit.
+
+    """
+
+    def __init__(
+        self,
+        site_name: Optional[str] = None,
+        executor: Optional[Executor] = None,
+        reddit: Optional[Reddit] = None,
+        **reddit_kwargs: Any
+    ):
+        """Initialize an AsyncReddit instance.
+
+        :param site_name: The ``site_name`` used to initialize a new
+            :class:`.Reddit` instance (default: None).
+        :param executor: The :class:`concurrent.futures.Executor` used to run
+            blocking calls. When not provided, a ``ThreadPoolExecutor`` is
+            created and shut down by :meth:`.close` (default: None).
+        :param reddit: An existing :class:`.Reddit` instance to wrap. When
+            provided, ``site_name`` and any additional keyword arguments are
+            ignored (default: None).
+
+        Additional keyword arguments are used to initialize the wrapped
+        :class:`.Reddit` instance.
+
+        """
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor()
+        self.reddit = reddit or Reddit(site_name, **reddit_kwargs)
+        """The wrapped :class:`.Reddit` instance."""
+
+    async def __aenter__(self) -> "AsyncReddit":
+        """Handle the asynchronous context manager open."""
+        return self
+
+    async def __aexit__(self, *_args):
+        """Handle the asynchronous context manager close."""
+        self.close()
+
+    def close(self):
+        """Shut down the executor when it was created by this instance."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+
+    async def call(self, function: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run ``function`` in the executor and return its result.
+
+        This method can be used to await any blocking PRAW method, for
+        example:
+
+        .. code-block:: python
+
+           comment = reddit.reddit.comment('dkk4qjd')
+           await reddit.call(comment.reply, 'Hello')
+
+        """
+        loop = _get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(function, *args, **kwargs)
+        )
+
+    async def delete(
+        self,
+        path: str,
+        data: Optional[
+            Union[Dict[str, Union[str, Any]], bytes, IO, str]
+        ] = None,
+        params: Optional[Union[str, Dict[str, str]]] = None,
+    ) -> Any:
+        """Await :meth:`.Reddit.delete`."""
+        return await self.call(self.reddit.delete, path, data, params)
+
+    async def fetch(self, obj: RedditBase) -> RedditBase:
+        """Fetch the attributes of a lazy object and return the object.
+
+        :param obj: A lazy :class:`.RedditBase` instance, e.g., one returned
+            from :meth:`.Reddit.submission`.
+
+        .. code-block:: python
+
+           submission = await reddit.fetch(reddit.reddit.submission('8dmv8z'))
+           print(submission.title)
+
+        """
+        await self.call(obj._fetch)
+        return obj
+
+    async def get(
+        self, path: str, params: Optional[Union[str, Dict[str, str]]] = None
+    ) -> Any:
+        """Await :meth:`.Reddit.get`."""
+        return await self.call(self.reddit.get, path, params)
+
+    def listing(self, generator: ListingGenerator) -> AsyncListingGenerator:
+        """Return an async iterator over the items of ``generator``.
+
+        :param generator: An instance of :class:`.ListingGenerator`.
+
+        .. code-block:: python
+
+           subreddit = reddit.reddit.subreddit('redditdev')
+           async for comment in reddit.listing(subreddit.comments()):
+               print(comment.author)
+
+        """
+        return AsyncListingGenerator(self, generator)
+
+    async def patch(
+        self,
+        path: str,
+        data: Optional[
+            Union[Dict[str, Union[str, Any]], bytes, IO, str]
+        ] = None,
+    ) -> Any:
+        """Await :meth:`.Reddit.patch`."""
+        return await self.call(self.reddit.patch, path, data)
+
+    async def post(
+        self,
+        path: str,
+        data: Optional[
+            Union[Dict[str, Union[str, Any]], bytes, IO, str]
+        ] = None,
+        files: Optional[Dict[str, IO]] = None,
+        params: Optional[Union[str, Dict[str, str]]] = None,
+    ) -> Any:
+        """Await :meth:`.Reddit.post`."""
+        return await self.call(self.reddit.post, path, data, files, params)
+
+    async def put(
+        self,
+        path: str,
+        data: Optional[
+            Union[Dict[str, Union[str, Any]], bytes, IO, str]
+        ] = None,
+    ) -> Any:
+        """Await :meth:`.Reddit.put`."""
+        return await self.call(self.reddit.put, path, data)
+
+    async def replace_more(
+        self, comment_forest: CommentForest, **replace_more_kwargs: Any
+    ) -> List[MoreComments]:
+        """Await :meth:`.CommentForest.replace_more`.
+
+        :param comment_forest: The :class:`.CommentForest` to update.
+
+        Additional keyword arguments are passed to
+        :meth:`.CommentForest.replace_more`.
+
+        .. code-block:: python
+
+           submission = await reddit.fetch(reddit.reddit.submission('3hahrw'))
+           await reddit.replace_more(submission.comments, limit=None)
+
+        """
+        return await self.call(
+            comment_forest.replace_more, **replace_more_kwargs
+        )
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Union[str, Dict[str, str]]] = None,
+        data: Optional[
+            Union[Dict[str, Union[str, Any]], bytes, IO, str]
+        ] = None,
+        files: Optional[Dict[str, IO]] = None,
+    ) -> Any:
+        """Await :meth:`.Reddit.request`."""
+        return await self.call(
+            self.reddit.request, method, path, params, data, files
+        )
+
+    def stream(
+        self, function: Callable[..., Any], **stream_options: Any
+    ) -> AsyncStream:
+        """Return an async iterator yielding new items from ``function``.
+
+        :param function: A callable that returns a ListingGenerator, e.g.
+            ``subreddit.comments`` or ``subreddit.new``.
+
+        Keyword arguments are interpreted as by :func:`.stream_generator`.
+
+        .. code-block:: python
+
+           subreddit = reddit.reddit.subreddit('redditdev')
+           async for comment in reddit.stream(subreddit.comments):
+               print(comment)
+
+        """
+        return AsyncStream(self, function, **stream_options)
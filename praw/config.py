@@ -114,6 +114,9 @@ class Config:
         self.check_for_updates = self._config_boolean(
             self._fetch_or_not_set("check_for_updates")
         )
+        self.compact_models = self._config_boolean(
+            self._fetch_or_not_set("compact_models")
+        )
         self.kinds = {
             x: self._fetch("{}_kind".format(x))
             for x in [
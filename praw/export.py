@@ -0,0 +1,524 @@
+"""Provide writers exporting the items of listings and streams to files."""
+import bz2
+import gzip
+import json
+import lzma
+import os
+from queue import Queue
+from threading import Thread
+from typing import Any, Dict, Iterable, List, Optional, TypeVar
+
+from .models.base import PRAWBase
+from .models.listing.generator import ListingGenerator
+from .models.reddit.base import RedditBase
+from .util.checkpoint import Checkpoint
+from .util.jsonbackend import JSONBackend
+
+Schema = TypeVar("Schema")
+
+#: The policies of :class:`.ExportWriter` for calling ``os.fsync``.
+FSYNC_POLICIES = ("batch", "never", "rotate")
+
+_COMPRESSORS = {
+    "bz2": lambda fp: bz2.BZ2File(fp, "wb"),
+    "gzip": lambda fp: gzip.GzipFile(fileobj=fp, mode="wb"),
+    "lzma": lambda fp: lzma.LZMAFile(fp, "wb"),
+}
+
+
+class _ModelEncoder(json.JSONEncoder):
+    """Encode the models referenced by the attributes of exported models."""
+
+    def default(self, o):  # pylint: disable=E0202
+        if isinstance(o, RedditBase):
+            return str(o)
+        if isinstance(o, PRAWBase):
+            return _record(o)
+        return super().default(o)
+
+
+def _fullname(item):
+    """Return the fullname of a model or of a raw listing child, if any."""
+    if isinstance(item, dict):
+        return item.get("data", item).get("name")
+    return getattr(item, "fullname", None)
+
+
+def _record(item):
+    """Return the dict of attributes exported for ``item``.
+
+    Raw listing children are exported as their ``data``, and models as their
+    public attributes.
+
+    """
+    if isinstance(item, dict):
+        if "kind" in item and isinstance(item.get("data"), dict):
+            return item["data"]
+        return item
+    attributes = {
+        key: value
+        for key, value in vars(item).items()
+        if not key.startswith("_")
+    }
+    table = item.__dict__.get("_compact_table")
+    if table is not None:
+        values = item.__dict__["_compact_values"]
+        for key, index in table.items():
+            attributes.setdefault(key, values[index])
+    return attributes
+
+
+class ExportWriter:
+    """Write items to files from a background thread.
+
+    Items are collected in batches of ``batch_size``. Full batches are handed
+    to a thread that encodes and writes them, so that the requests for the
+    next items, which mostly wait on the network, overlap with the writes to
+    disk. At most ``max_pending`` batches wait to be written; :meth:`.write`
+    blocks when the disk falls further behind.
+
+    Items can be instances of :class:`.RedditBase`, exported as their public
+    attributes, or the dicts of listing children yielded by a
+    :class:`.ListingGenerator` with ``raw=True``, exported as their ``data``.
+    ``None``, yielded by paused streams, writes the pending batch.
+
+    This class is not used directly. See :class:`.NDJSONWriter` and
+    :class:`.ParquetWriter`.
+
+    """
+
+    def __init__(
+        self,
+        path: str,
+        rotate_bytes: Optional[int] = None,
+        batch_size: int = 100,
+        fsync: str = "rotate",
+        cursor: Optional[Checkpoint] = None,
+        max_pending: int = 4,
+        json_backend: Optional[JSONBackend] = None,
+    ):
+        """Initialize an ExportWriter instance.
+
+        :param path: The path of the file to write. When ``rotate_bytes`` or
+            ``cursor`` is given, it must contain an ``{index}`` replacement
+            field, e.g., ``redditdev-{index:05d}.ndjson``, numbering the files
+            from 0.
+        :param rotate_bytes: When given, a new file is started when the
+            current one reaches this size (default: None).
+        :param batch_size: The number of items written at once (default:
+            100).
+        :param fsync: When to call ``os.fsync``: after each ``batch``, when
+            each file is closed (``rotate``), or ``never`` (default:
+            ``rotate``).
+        :param cursor: A :class:`.Checkpoint`, e.g., a
+            :class:`.FileCheckpoint`, saving the fullname of the last written
+            item after each batch. When the cursor holds a state, the export
+            continues in a new file (default: None).
+        :param max_pending: The maximum number of batches waiting to be
+            written (default: 4).
+        :param json_backend: The :class:`.JSONBackend` encoding the items
+            (default: the standard library).
+
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(
+                "fsync must be one of: {}".format(", ".join(FSYNC_POLICIES))
+            )
+        if (rotate_bytes is not None or cursor is not None) and (
+            "{index" not in path
+        ):
+            raise ValueError(
+                "path must contain an {index} field to rotate or resume"
+            )
+        self.after = None
+        """The fullname of the last written item, or of the cursor."""
+        self.batch_size = batch_size
+        self.count = 0
+        """The number of items written, including before the cursor."""
+        self.cursor = cursor
+        self.fsync = fsync
+        self.index = 0
+        """The index of the current file."""
+        self.json_backend = json_backend or JSONBackend()
+        self.path = path
+        self.paths = []
+        """The paths of the files written to."""
+        self.rotate_bytes = rotate_bytes
+        self._batch = []
+        self._bytes = 0
+        self._closed = False
+        self._error = None
+        self._fp = None
+        self._queue = Queue(max_pending)
+        self._raw = None
+
+        state = None if cursor is None else cursor.load()
+        if state is not None:
+            self.after = state["after"]
+            self.count = state["count"]
+            self.index = state["index"] + 1
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        """Return the writer."""
+        return self
+
+    def __exit__(self, *_args):
+        """Write the pending items and close the current file."""
+        self.close()
+
+    def _close_file(self):
+        """Close the current file, calling ``os.fsync`` unless disabled."""
+        if self._raw is None:
+            return
+        if self._fp is not self._raw:
+            self._fp.close()
+        self._raw.flush()
+        if self.fsync != "never":
+            os.fsync(self._raw.fileno())
+        self._raw.close()
+        self._fp = self._raw = None
+
+    def _maybe_rotate(self, size: int):
+        """Close the current file if ``size`` more bytes would overflow it."""
+        if (
+            self.rotate_bytes is not None
+            and self._raw is not None
+            and self._bytes
+            and self._bytes + size > self.rotate_bytes
+        ):
+            self._close_file()
+            self.index += 1
+
+    def _open_file(self):
+        """Open the file of the current index."""
+        path = self.path.format(index=self.index)
+        self._raw = open(path, "wb")
+        self._fp = self._wrap(self._raw)
+        self._bytes = 0
+        self.paths.append(path)
+
+    def _run(self):
+        """Write the queued batches until ``None`` is received."""
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                break
+            if self._error is not None:
+                continue  # Drain the queue so that writes do not block.
+            try:
+                self._write_batch(batch)
+            except Exception as exc:
+                self._error = exc
+        try:
+            self._close_file()
+        except Exception as exc:
+            if self._error is None:
+                self._error = exc
+
+    def _wrap(self, fp):
+        """Return the file object written to in place of ``fp``."""
+        return fp
+
+    def _write_batch(self, batch):
+        """Write ``batch`` and save the cursor."""
+        self._write_records([_record(item) for item in batch])
+        self._fp.flush()
+        if self.fsync == "batch":
+            self._raw.flush()
+            os.fsync(self._raw.fileno())
+        self.count += len(batch)
+        for item in reversed(batch):
+            fullname = _fullname(item)
+            if fullname is not None:
+                self.after = fullname
+                break
+        if self.cursor is not None:
+            self.cursor.save(
+                {"after": self.after, "count": self.count, "index": self.index}
+            )
+
+    def _write_records(self, records: List[Dict[str, Any]]):
+        """Write the exported attributes of a batch of items."""
+        raise NotImplementedError("ExportWriter must be extended.")
+
+    def close(self):
+        """Write the pending items and close the current file.
+
+        Raises the first exception raised while writing, if any.
+
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._batch:
+            self._queue.put(self._batch)
+            self._batch = []
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def flush(self):
+        """Hand the pending items to the writing thread."""
+        if self._error is not None:
+            raise self._error
+        if self._batch:
+            self._queue.put(self._batch)
+            self._batch = []
+
+    def write(self, item: Any):
+        """Add ``item`` to the pending batch, writing the batch when full.
+
+        :param item: A model, a raw listing child, or ``None`` to write the
+            pending batch.
+
+        """
+        if item is None:
+            self.flush()
+            return
+        self._batch.append(item)
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+
+class NDJSONWriter(ExportWriter):
+    """Write items to files of newline-delimited JSON.
+
+    Each line holds the JSON object of a single item. With ``rotate_bytes``,
+    a new file is started before a line would make the uncompressed size of
+    the current file exceed it.
+
+    """
+
+    def __init__(self, path: str, compress: Optional[str] = None, **kwargs):
+        """Initialize an NDJSONWriter instance.
+
+        :param path: The path of the file to write. See
+            :class:`.ExportWriter`.
+        :param compress: The compression of the files: ``bz2``, ``gzip``,
+            ``lzma``, or None (default: None).
+
+        Additional keyword arguments are passed to :class:`.ExportWriter`.
+
+        """
+        if compress is not None and compress not in _COMPRESSORS:
+            raise ValueError(
+                "compress must be one of: {}".format(
+                    ", ".join(sorted(_COMPRESSORS))
+                )
+            )
+        self.compress = compress
+        super().__init__(path, **kwargs)
+
+    def _wrap(self, fp):
+        if self.compress is None:
+            return fp
+        return _COMPRESSORS[self.compress](fp)
+
+    def _write_records(self, records):
+        for record in records:
+            line = self.json_backend.dumps(record, cls=_ModelEncoder) + "\n"
+            line = line.encode("utf-8")
+            self._maybe_rotate(len(line))
+            if self._raw is None:
+                self._open_file()
+            self._fp.write(line)
+            self._bytes += len(line)
+
+
+class ParquetWriter(ExportWriter):
+    """Write items to Parquet files with ``pyarrow``.
+
+    Each batch is written as a row group. The columns are those of the items
+    of the first batch, unless ``schema`` is given: later attributes are
+    ignored, and missing ones are null. Nested values, such as lists and
+    dicts, are stored as JSON strings, and models referenced by the items,
+    such as ``author``, as their names. With ``rotate_bytes``, a new file is
+    started once the current file reaches it.
+
+    """
+
+    def __init__(
+        self,
+        path: str,
+        schema: Optional[Schema] = None,
+        compression: str = "snappy",
+        batch_size: int = 1000,
+        **kwargs
+    ):
+        """Initialize a ParquetWriter instance.
+
+        :param path: The path of the file to write. See
+            :class:`.ExportWriter`.
+        :param schema: The ``pyarrow.Schema`` of the files (default: the
+            schema inferred from the first batch, in which columns holding
+            only nulls are strings).
+        :param compression: The compression codec of the columns (default:
+            ``snappy``).
+        :param batch_size: The number of items of each row group (default:
+            1000).
+
+        Additional keyword arguments are passed to :class:`.ExportWriter`.
+
+        Raises ``ImportError`` when ``pyarrow`` is not installed.
+
+        """
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("The pyarrow package is not installed.")
+        self.compression = compression
+        self.schema = schema
+        self._parquet = None
+        self._pyarrow = pyarrow
+        super().__init__(path, batch_size=batch_size, **kwargs)
+
+    def _close_file(self):
+        if self._parquet is not None:
+            self._parquet.close()
+            self._parquet = None
+        super()._close_file()
+
+    def _row(self, record):
+        """Return ``record`` with its nested values encoded as JSON."""
+        row = {}
+        for key, value in record.items():
+            if isinstance(value, RedditBase):
+                value = str(value)
+            elif isinstance(value, (dict, list, PRAWBase)):
+                value = self.json_backend.dumps(value, cls=_ModelEncoder)
+            row[key] = value
+        return row
+
+    def _write_records(self, records):
+        pyarrow = self._pyarrow
+        # Start a new file once the current one reached ``rotate_bytes``.
+        self._maybe_rotate(1)
+        if self._raw is None:
+            self._open_file()
+        rows = [self._row(record) for record in records]
+        if self.schema is None:
+            self.schema = pyarrow.schema(
+                field.with_type(pyarrow.string())
+                if pyarrow.types.is_null(field.type)
+                else field
+                for field in pyarrow.Table.from_pylist(rows).schema
+            )
+        for field in self.schema:
+            if not pyarrow.types.is_string(field.type):
+                continue
+            for row in rows:
+                value = row.get(field.name)
+                if value is not None and not isinstance(value, str):
+                    row[field.name] = self.json_backend.dumps(value)
+        try:
+            table = pyarrow.Table.from_pylist(rows, schema=self.schema)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError) as exc:
+            raise ValueError(
+                "The items do not match the schema of the export: {}. Pass"
+                " a schema to ParquetWriter.".format(exc)
+            )
+        if self._parquet is None:
+            self._parquet = pyarrow.parquet.ParquetWriter(
+                self._raw, self.schema, compression=self.compression
+            )
+        self._parquet.write_table(table)
+        self._bytes = self._raw.tell()
+
+
+def _export(writer, generator):
+    """Write the items of ``generator`` with ``writer`` and return it."""
+    if writer.after is not None and isinstance(generator, ListingGenerator):
+        generator.params["after"] = writer.after
+        if generator.limit is not None:
+            # The limit applies to the whole export, not to each run.
+            generator.limit = max(0, generator.limit - writer.count)
+            if generator.limit:
+                generator.params["limit"] = min(
+                    generator.params["limit"], generator.limit
+                )
+    with writer:
+        for item in generator:
+            writer.write(item)
+    return writer
+
+
+def _writer_kwargs(generator, writer_kwargs):
+    if isinstance(generator, ListingGenerator):
+        writer_kwargs.setdefault(
+            "json_backend", generator._reddit.json_backend
+        )
+    return writer_kwargs
+
+
+def to_ndjson(
+    generator: Iterable[Any], path: str, **writer_kwargs: Any
+) -> NDJSONWriter:
+    """Write the items of a listing or a stream to newline-delimited JSON.
+
+    :param generator: The items to write, e.g., a :class:`.ListingGenerator`
+        or a stream.
+    :param path: The path of the file to write. It must contain an
+        ``{index}`` replacement field when the files are rotated, or when
+        the export is resumed.
+
+    Additional keyword arguments are passed to :class:`.NDJSONWriter`, e.g.,
+    ``rotate_bytes``, ``compress``, ``fsync`` and ``cursor``.
+
+    Returns the closed :class:`.NDJSONWriter`, whose ``count`` and ``paths``
+    attributes hold the number of written items and the written files.
+
+    When ``cursor`` holds the state of an interrupted export of a
+    :class:`.ListingGenerator`, the listing continues after the last written
+    item, and a finite ``limit`` of the listing counts the items written
+    before the interruption. Items written after the cursor was last saved
+    are written again.
+    Streams resume with their own ``checkpoint`` argument instead.
+
+    For example, to archive the submissions of a subreddit in compressed
+    files of at most 256 MiB, resuming after an interruption, try:
+
+    .. code-block:: python
+
+       from praw.export import to_ndjson
+       from praw.util import FileCheckpoint
+
+       submissions = reddit.subreddit('redditdev').new(limit=None, raw=True)
+       to_ndjson(submissions, 'redditdev-{index:04d}.ndjson.gz',
+                 compress='gzip', cursor=FileCheckpoint('redditdev.cursor'),
+                 rotate_bytes=256 * 1024 ** 2)
+
+    To archive the comments of a subreddit as they arrive, try:
+
+    .. code-block:: python
+
+       stream = reddit.subreddit('redditdev').stream.comments(
+           pause_after=0, raw=True)
+       to_ndjson(stream, 'comments-{index:05d}.ndjson',
+                 rotate_bytes=64 * 1024 ** 2)
+
+    """
+    writer = NDJSONWriter(path, **_writer_kwargs(generator, writer_kwargs))
+    return _export(writer, generator)
+
+
+def to_parquet(
+    generator: Iterable[Any], path: str, **writer_kwargs: Any
+) -> ParquetWriter:
+    """Write the items of a listing or a stream to Parquet files.
+
+    :param generator: The items to write, e.g., a :class:`.ListingGenerator`
+        or a stream.
+    :param path: The path of the file to write. See :func:`.to_ndjson`.
+
+    Additional keyword arguments are passed to :class:`.ParquetWriter`, e.g.,
+    ``schema``, ``rotate_bytes``, ``fsync`` and ``cursor``.
+
+    Returns the closed :class:`.ParquetWriter`. Requires ``pyarrow``.
+
+    """
+    writer = ParquetWriter(path, **_writer_kwargs(generator, writer_kwargs))
+    return _export(writer, generator)
@@ -1,7 +1,13 @@
 """Provide the PRAW models."""
 from .auth import Auth
+from .firehose import Firehose
 from .front import Front
-from .helpers import LiveHelper, MultiredditHelper, SubredditHelper
+from .helpers import (
+    LiveHelper,
+    MultiredditHelper,
+    StreamHelper,
+    SubredditHelper,
+)
 from .inbox import Inbox
 from .list.redditor import RedditorList
 from .list.trophy import TrophyList
@@ -1,4 +1,5 @@
 """Provide CommentForest for Submission comments."""
+from concurrent.futures import ThreadPoolExecutor
 from heapq import heappop, heappush
 from typing import List, Optional, TypeVar, Union
 
@@ -34,6 +35,26 @@ class CommentForest:
                     queue.append((comment, item))
         return more_comments
 
+    @staticmethod
+    def _can_coalesce(batch, more_comments):
+        """Return True if ``more_comments`` can join the request for batch."""
+        if not more_comments.children or more_comments._comments is not None:
+            return False
+        if not batch[0].children or batch[0]._comments is not None:
+            return False
+        children = sum(len(item.children) for item in batch)
+        return (
+            children + len(more_comments.children)
+            <= MoreComments.MORECHILDREN_LIMIT
+        )
+
+    @staticmethod
+    def _fetch_more_comments(batches, executor=None):
+        """Return the comments of each MoreComments in each batch."""
+        if executor is None or len(batches) < 2:
+            return [MoreComments._batch_comments(batch) for batch in batches]
+        return list(executor.map(MoreComments._batch_comments, batches))
+
     def __getitem__(self, index: int):
         """Return the comment at position ``index`` in the list.
 
@@ -86,6 +107,18 @@ class CommentForest:
             parent = self._submission._comments_by_id[comment.parent_id]
             parent.replies._comments.append(comment)
 
+    def _replace_more_comments(self, item, new_comments, more_comments):
+        # Add new MoreComment objects to the heap of more_comments
+        for more in self._gather_more_comments(new_comments, self._comments):
+            more.submission = self._submission
+            heappush(more_comments, more)
+        # Insert all items into the tree
+        for comment in new_comments:
+            self._insert_comment(comment)
+
+        # Remove from forest
+        item._remove_from.remove(item)
+
     def _update(self, comments):
         self._comments = comments
         for comment in comments:
@@ -108,7 +141,11 @@ class CommentForest:
         return comments
 
     def replace_more(
-        self, limit: int = 32, threshold: int = 0
+        self,
+        limit: int = 32,
+        threshold: int = 0,
+        workers: Optional[int] = None,
+        coalesce: bool = False,
     ) -> List[MoreComments]:
         """Update the comment forest by resolving instances of MoreComments.
 
@@ -121,6 +158,18 @@ class CommentForest:
             replaced. :class:`.MoreComments` instances that represent "continue
             this thread" links unfortunately appear to have 0
             children. (default: 0).
+        :param workers: The maximum number of :class:`.MoreComments` instances
+            to fetch concurrently. Each round pops up to ``workers`` instances
+            from the front of the queue, fetches them in a thread pool and
+            inserts the results into the forest in the order they were popped.
+            When ``None`` the instances are fetched one at a time (default:
+            None). Raise ``ValueError`` when less than 1.
+        :param coalesce: When True, consecutive :class:`.MoreComments`
+            instances are combined into a single request for up to 100
+            children, and the returned
+            comments are distributed back to the instance that referenced them.
+            Each combined instance still counts towards ``limit`` (default:
+            False).
 
         :returns: A list of :class:`.MoreComments` instances that were not
             replaced.
@@ -142,6 +191,22 @@ class CommentForest:
            comment.refresh()
            comment.replies.replace_more()
 
+        To resolve all :class:`.MoreComments` instances of a large submission
+        using up to eight concurrent requests try:
+
+        .. code-block:: python
+
+           submission = reddit.submission('3hahrw')
+           submission.comments.replace_more(limit=None, workers=8)
+
+        Wide threads with many small :class:`.MoreComments` instances require
+        several times fewer requests when they are coalesced:
+
+        .. code-block:: python
+
+           submission = reddit.submission('3hahrw')
+           submission.comments.replace_more(limit=None, coalesce=True)
+
         .. note:: This method can take a long time as each replacement will
                   discover at most 20 new :class:`.Comment` or
                   :class:`.MoreComments` instances. As a result, consider
@@ -159,37 +224,52 @@ class CommentForest:
                              sleep(1)
 
         """
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be None or at least 1")
         remaining = limit
         more_comments = self._gather_more_comments(self._comments)
         skipped = []
-
-        # Fetch largest more_comments until reaching the limit or the threshold
-        while more_comments:
-            item = heappop(more_comments)
-            if (
-                remaining is not None
-                and remaining <= 0
-                or item.count < threshold
-            ):
-                skipped.append(item)
-                item._remove_from.remove(item)
-                continue
-
-            new_comments = item.comments(update=False)
-            if remaining is not None:
-                remaining -= 1
-
-            # Add new MoreComment objects to the heap of more_comments
-            for more in self._gather_more_comments(
-                new_comments, self._comments
-            ):
-                more.submission = self._submission
-                heappush(more_comments, more)
-            # Insert all items into the tree
-            for comment in new_comments:
-                self._insert_comment(comment)
-
-            # Remove from forest
-            item._remove_from.remove(item)
+        batch_size = workers or 1
+        executor = ThreadPoolExecutor(workers) if batch_size > 1 else None
+
+        try:
+            # Fetch largest more_comments until reaching the limit or the
+            # threshold
+            while more_comments:
+                batches = []
+                while more_comments:
+                    item = more_comments[0]
+                    if (
+                        remaining is not None
+                        and remaining <= 0
+                        or item.count < threshold
+                    ):
+                        heappop(more_comments)
+                        skipped.append(item)
+                        item._remove_from.remove(item)
+                        continue
+                    if not (
+                        coalesce
+                        and batches
+                        and self._can_coalesce(batches[-1], item)
+                    ):
+                        if len(batches) == batch_size:
+                            break
+                        batches.append([])
+                    heappop(more_comments)
+                    batches[-1].append(item)
+                    if remaining is not None:
+                        remaining -= 1
+
+                for batch, batch_comments in zip(
+                    batches, self._fetch_more_comments(batches, executor)
+                ):
+                    for item, new_comments in zip(batch, batch_comments):
+                        self._replace_more_comments(
+                            item, new_comments, more_comments
+                        )
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
         return more_comments + skipped
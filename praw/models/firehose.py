@@ -0,0 +1,210 @@
+"""Provide the Firehose class."""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Generator, Optional, TypeVar
+
+from ..const import API_PATH
+from .base import PRAWBase
+from .reddit.comment import Comment
+from .reddit.submission import Submission
+from .util import ExponentialCounter
+
+Reddit = TypeVar("Reddit")
+
+_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def _to_base36(number):
+    digits = []
+    while True:
+        number, remainder = divmod(number, 36)
+        digits.append(_DIGITS[remainder])
+        if not number:
+            return "".join(reversed(digits))
+
+
+class Firehose(PRAWBase):
+    """Ingest all new comments or submissions by enumerating their IDs.
+
+    The IDs of comments and submissions are sequential base36 numbers. Rather
+    than polling a listing, which contains at most 100 new items per request,
+    the firehose requests consecutive ranges of 100 IDs from ``/api/info``,
+    using several requests concurrently while it catches up.
+
+    """
+
+    #: The number of IDs requested at once.
+    BATCH_SIZE = 100
+
+    #: The minimum number of seconds between two requests for the newest ID,
+    #: made when a range of IDs returns no items.
+    HEAD_INTERVAL = 30
+
+    def __init__(self, reddit: Reddit):
+        """Initialize a Firehose instance.
+
+        .. note:: This class should not be initialized directly. Instead
+            obtain an instance via: ``reddit.firehose``.
+
+        """
+        super().__init__(reddit, _data=None)
+
+    def _batch(self, kind, first):
+        fullnames = [
+            "{}_{}".format(kind, _to_base36(number))
+            for number in range(first, first + self.BATCH_SIZE)
+        ]
+        items = self._reddit.get(
+            API_PATH["info"], params={"id": ",".join(fullnames)}
+        )
+        return sorted(items, key=lambda item: int(item.id, 36))
+
+    def _newest_id(self, kind):
+        subreddit = self._reddit.subreddit("all")
+        if kind == self._reddit.config.kinds["comment"]:
+            listing = subreddit.comments(limit=1)
+        else:
+            listing = subreddit.new(limit=1)
+        for item in listing:
+            return int(item.id, 36)
+        return 0
+
+    def _stream(self, kind, start_id, workers, pause_after):
+        # The newest ID known to exist, and when it was last requested.
+        head = head_time = None
+        if start_id is None:
+            head, head_time = self._newest_id(kind), time.time()
+            next_number = head + 1
+        else:
+            next_number = int(start_id, 36)
+        exponential_counter = ExponentialCounter(max_counter=16)
+        executor = ThreadPoolExecutor(workers) if workers > 1 else None
+        rounds_without_new = 0
+        batch = partial(self._batch, kind)
+        # Start with a single request when starting at the live head.
+        batches = 1 if start_id is None else workers
+        try:
+            while True:
+                starts = [
+                    next_number + index * self.BATCH_SIZE
+                    for index in range(batches)
+                ]
+                if executor is None:
+                    results = [batch(first) for first in starts]
+                else:
+                    results = list(executor.map(batch, starts))
+
+                found = [item for result in results for item in result]
+                if found:
+                    # Requests beyond the live head return no items. Resume
+                    # after the newest item so that IDs assigned meanwhile are
+                    # not skipped.
+                    next_number = int(found[-1].id, 36) + 1
+                    if next_number == starts[-1] + self.BATCH_SIZE:
+                        batches = workers
+                    else:
+                        batches = 1
+                    for item in found:
+                        yield item
+                    exponential_counter.reset()
+                    rounds_without_new = 0
+                    if pause_after is not None and pause_after < 0:
+                        yield None
+                    continue
+
+                # A range behind the live head contains only IDs of removed or
+                # private items, and is skipped.
+                end = starts[-1] + self.BATCH_SIZE
+                if (head is None or head < end) and (
+                    head_time is None
+                    or time.time() - head_time >= self.HEAD_INTERVAL
+                ):
+                    head, head_time = self._newest_id(kind), time.time()
+                if head is not None and head >= end:
+                    next_number = end
+                    batches = workers
+                    continue
+
+                batches = 1
+                rounds_without_new += 1
+                if pause_after is not None and (
+                    pause_after < 0 or rounds_without_new > pause_after
+                ):
+                    exponential_counter.reset()
+                    rounds_without_new = 0
+                    yield None
+                else:
+                    time.sleep(exponential_counter.counter())
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def comments(
+        self,
+        start_id: Optional[str] = None,
+        workers: int = 4,
+        pause_after: Optional[int] = None,
+    ) -> Generator[Optional[Comment], None, None]:
+        """Yield new comments in the order they were created.
+
+        :param start_id: The base36 ID of the first comment to yield, e.g.,
+            ``dkk4qjd``. When ``None``, the firehose starts after the newest
+            comment of r/all (default: None).
+        :param workers: The maximum number of concurrent requests, each for
+            100 IDs (default: 4).
+        :param pause_after: An integer representing the number of requests
+            that result in no new items before ``None`` is yielded, or
+            ``None`` to never pause. See :func:`.stream_generator`
+            (default: None).
+
+        IDs of deleted comments and comments that cannot be accessed are
+        skipped. When a request returns no comments, the ID of the newest
+        comment of r/all is requested, at most every :attr:`.HEAD_INTERVAL`
+        seconds, so that ranges of unavailable IDs behind it are skipped. Once
+        the firehose reaches the newest comment, it issues a single request at
+        a time, with the exponential delay of :func:`.stream_generator`
+        between requests without new comments.
+
+        For example, to process every new comment on reddit, try:
+
+        .. code-block:: python
+
+           for comment in reddit.firehose.comments():
+               print(comment.subreddit, comment.id)
+
+        """
+        return self._stream(
+            self._reddit.config.kinds["comment"],
+            start_id,
+            workers,
+            pause_after,
+        )
+
+    def submissions(
+        self,
+        start_id: Optional[str] = None,
+        workers: int = 4,
+        pause_after: Optional[int] = None,
+    ) -> Generator[Optional[Submission], None, None]:
+        """Yield submissions in the order they were created.
+
+        :param start_id: The base36 ID of the first submission to yield, e.g.,
+            ``2gmzqe``. When ``None``, the firehose starts after the newest
+            submission of r/all (default: None).
+
+        The remaining parameters, and the handling of missing IDs, are
+        described in :meth:`.comments`.
+
+        .. code-block:: python
+
+           for submission in reddit.firehose.submissions(workers=8):
+               print(submission.subreddit, submission.title)
+
+        """
+        return self._stream(
+            self._reddit.config.kinds["submission"],
+            start_id,
+            workers,
+            pause_after,
+        )
@@ -1,12 +1,21 @@
 """Provide the helper classes."""
-from json import dumps
-from typing import Generator, List, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from ..const import API_PATH
 from .base import PRAWBase
 from .reddit.live import LiveThread
 from .reddit.multi import Multireddit, Subreddit
 from .reddit.redditor import Redditor
+from .util import multiplex_generator
 
 
 class LiveHelper(PRAWBase):
@@ -170,10 +179,43 @@ class MultiredditHelper(PRAWBase):
             "weighting_scheme": weighting_scheme,
         }
         return self._reddit.post(
-            API_PATH["multireddit_base"], data={"model": dumps(model)}
+            API_PATH["multireddit_base"],
+            data={"model": self._reddit.json_backend.dumps(model)},
         )
 
 
+class StreamHelper(PRAWBase):
+    """Provide a set of functions to stream from many listings at once."""
+
+    def multiplex(
+        self, functions: Iterable[Callable[[Any], Any]], **stream_options: Any
+    ) -> Generator[Optional[Tuple[Callable[[Any], Any], Any]], None, None]:
+        """Yield ``(function, item)`` tuples of new items from ``functions``.
+
+        :param functions: An iterable of callables that return a
+            ListingGenerator, e.g., ``subreddit.comments`` or
+            ``redditor.submissions.new``.
+
+        All functions are polled from a single loop, so that watching many
+        subreddits or redditors does not require a thread per stream. For
+        example, to stream the comments and submissions of several
+        subreddits, try:
+
+        .. code-block:: python
+
+           functions = []
+           for name in ('AskReddit', 'redditdev', 'test'):
+               subreddit = reddit.subreddit(name)
+               functions.extend([subreddit.comments, subreddit.new])
+           for function, item in reddit.streams.multiplex(functions):
+               print(function.__self__, item)
+
+        Keyword arguments are passed to :func:`.multiplex_generator`.
+
+        """
+        return multiplex_generator(functions, **stream_options)
+
+
 class SubredditHelper(PRAWBase):
     """Provide a set of functions to interact with Subreddits."""
 
@@ -189,7 +231,9 @@ class SubredditHelper(PRAWBase):
         if lower_name == "randnsfw":
             return self._reddit.random_subreddit(nsfw=True)
 
-        return Subreddit(self._reddit, display_name=display_name)
+        return self._reddit._batch_lazy(
+            Subreddit(self._reddit, display_name=display_name)
+        )
 
     def create(
         self,
@@ -1,9 +1,11 @@
 """Provide the ListingGenerator class."""
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from typing import Any, Dict, Iterator, Optional, TypeVar
 
 from ..base import PRAWBase
-from .listing import FlairListing
+from .listing import FlairListing, LazyChildren, RawListing
 
 Reddit = TypeVar("Reddit")
 
@@ -24,6 +26,9 @@ class ListingGenerator(PRAWBase):
         url: str,
         limit: int = 100,
         params: Optional[Dict[str, str]] = None,
+        prefetch: int = 0,
+        lazy: bool = False,
+        raw: bool = False,
     ):
         """Initialize a ListingGenerator instance.
 
@@ -36,13 +41,58 @@ class ListingGenerator(PRAWBase):
             requests (default: 100).
         :param params: A dictionary containing additional query string
             parameters to send with the request.
+        :param prefetch: The maximum number of pages to request in the
+            background while the current page is being iterated. The order of
+            the generated items is unaffected. At most ``prefetch`` pages are
+            held in memory in addition to the current one (default: 0).
+        :param lazy: When True, the items of each page are kept as the raw
+            data returned by reddit and are only converted into instances of
+            :class:`.RedditBase` when they are reached (default: False).
+        :param raw: When True, the generated items are the dicts of the
+            listing children returned by reddit, and no instances of
+            :class:`.RedditBase` are created. ``lazy`` is then ignored
+            (default: False).
+
+        For example, to overlap the requests for the next two pages with the
+        processing of the current page try:
+
+        .. code-block:: python
+
+           for submission in reddit.subreddit('all').new(limit=None,
+                                                         prefetch=2):
+               print(submission.title)
+
+        Lazy mode is useful when only a few of the fetched items are used,
+        such as when the iteration is stopped early:
+
+        .. code-block:: python
+
+           for comment in reddit.subreddit('all').comments(limit=None,
+                                                           lazy=True):
+               if comment.created_utc < cutoff:
+                   break
+
+        Raw mode is useful when the items are stored rather than used, e.g.,
+        to archive a subreddit:
+
+        .. code-block:: python
+
+           for child in reddit.subreddit('redditdev').new(limit=None,
+                                                          raw=True):
+               archive.append(child['data'])
 
         """
         super().__init__(reddit, _data=None)
+        self._executor = None
         self._exhausted = False
+        self._fetched_count = 0
         self._listing = None
         self._list_index = None
+        self._prefetched = deque()
+        self.lazy = lazy
         self.limit = limit
+        self.prefetch = prefetch
+        self.raw = raw
         self.params = deepcopy(params) if params else {}
         self.params["limit"] = limit or 1024
         self.url = url
@@ -64,23 +114,77 @@ class ListingGenerator(PRAWBase):
         self.yielded += 1
         return self._listing[self._list_index - 1]
 
+    def _fetch_batch(self):
+        if self._exhausted:  # A prefetch scheduled past the last page
+            return []
+        if self.limit is not None and self._fetched_count >= self.limit:
+            # Prefetches are scheduled before the preceding pages arrive.
+            self._exhausted = True
+            return []
+
+        listing = self._get_listing()
+        if isinstance(listing, list):
+            listing = listing[1]  # for submission duplicates
+        if self.raw:
+            listing = RawListing(listing)
+        elif isinstance(listing, dict):
+            listing = FlairListing(self._reddit, listing)
+        self._fetched_count += len(listing)
+
+        if not listing:
+            return listing
+
+        if listing.after and listing.after != self.params.get("after"):
+            self.params["after"] = listing.after
+        else:
+            self._exhausted = True
+        return listing
+
+    def _get_listing(self):
+        if self.raw:
+            return self._reddit.get_raw(self.url, params=self.params)
+        if not self.lazy:
+            return self._reddit.get(self.url, params=self.params)
+        data = self._reddit.request("GET", self.url, params=self.params)
+        for item in data if isinstance(data, list) else [data]:
+            if isinstance(item, dict) and item.get("kind") == "Listing":
+                item["data"]["children"] = LazyChildren(
+                    self._reddit._objector, item["data"]["children"]
+                )
+        return self._reddit._objector.objectify(data)
+
     def _next_batch(self):
-        if self._exhausted:
+        if self._prefetched:
+            self._listing = self._prefetched.popleft().result()
+        elif self._exhausted:
+            self._stop_prefetching()
             raise StopIteration()
-
-        self._listing = self._reddit.get(self.url, params=self.params)
-        if isinstance(self._listing, list):
-            self._listing = self._listing[1]  # for submission duplicates
-        elif isinstance(self._listing, dict):
-            self._listing = FlairListing(self._reddit, self._listing)
+        else:
+            self._listing = self._fetch_batch()
         self._list_index = 0
 
         if not self._listing:
+            self._stop_prefetching()
             raise StopIteration()
 
-        if self._listing.after and self._listing.after != self.params.get(
-            "after"
+        if self.prefetch:
+            self._schedule_prefetch()
+
+    def _schedule_prefetch(self):
+        # The single worker runs the fetches in order, so each one sees the
+        # ``after`` parameter set by its predecessor.
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        while (
+            len(self._prefetched) < self.prefetch
+            and not self._exhausted
+            and (self.limit is None or self._fetched_count < self.limit)
         ):
-            self.params["after"] = self._listing.after
-        else:
-            self._exhausted = True
+            self._prefetched.append(self._executor.submit(self._fetch_batch))
+
+    def _stop_prefetching(self):
+        while self._prefetched:
+            self._prefetched.pop().cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
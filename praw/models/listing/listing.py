@@ -1,8 +1,60 @@
 """Provide the Listing class."""
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, TypeVar
 
 from ..base import PRAWBase
 
+Objector = TypeVar("Objector")
+
+_UNSET = object()
+
+
+class LazyChildren:
+    """A sequence of listing children that are objectified on first access.
+
+    Each child is kept as the raw dict returned by reddit until it is indexed
+    or iterated over, at which point the objectified value is cached and the
+    raw dict released.
+
+    """
+
+    __slots__ = ("_objector", "_objects", "_raw")
+
+    def __init__(self, objector: Objector, raw: List[Dict[str, Any]]):
+        """Initialize a LazyChildren instance.
+
+        :param objector: The :class:`.Objector` used to objectify children.
+        :param raw: The list of raw children.
+
+        """
+        self._objector = objector
+        self._objects = [_UNSET] * len(raw)
+        self._raw = raw
+
+    def __getitem__(self, index: int) -> Any:
+        """Return the objectified child at position index."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        value = self._objects[index]
+        if value is _UNSET:
+            value = self._objects[index] = self._objector.objectify(
+                self._raw[index]
+            )
+            self._raw[index] = None
+        return value
+
+    def __iter__(self):
+        """Iterate over the objectified children."""
+        for index in range(len(self._objects)):
+            yield self[index]
+
+    def __len__(self) -> int:
+        """Return the number of children."""
+        return len(self._objects)
+
+    def __repr__(self) -> str:
+        """Return repr(self)."""
+        return "<{} of {} children>".format(self.__class__.__name__, len(self))
+
 
 class Listing(PRAWBase):
     """A listing is a collection of RedditBase instances."""
@@ -18,8 +70,14 @@ class Listing(PRAWBase):
         return getattr(self, self.CHILD_ATTRIBUTE)[index]
 
     def __setattr__(self, attribute: str, value: Any):
-        """Objectify the CHILD_ATTRIBUTE attribute."""
-        if attribute == self.CHILD_ATTRIBUTE:
+        """Objectify the CHILD_ATTRIBUTE attribute.
+
+        Children provided as :class:`.LazyChildren` are objectified on access.
+
+        """
+        if attribute == self.CHILD_ATTRIBUTE and not isinstance(
+            value, LazyChildren
+        ):
             value = self._reddit._objector.objectify(value)
         super().__setattr__(attribute, value)
 
@@ -33,3 +91,25 @@ class FlairListing(Listing):
     def after(self) -> Optional[Any]:
         """Return the next attribute or None."""
         return getattr(self, "next", None)
+
+
+class RawListing(list):
+    """The children of a listing, kept as the dicts returned by reddit.
+
+    Raw listings are produced by :class:`.ListingGenerator` when ``raw`` is
+    True, and skip the creation of :class:`.RedditBase` instances.
+
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        """Initialize a RawListing instance.
+
+        :param data: The decoded JSON of a listing, or of a flair list.
+
+        """
+        if "users" in data:  # A flair list
+            super().__init__(data["users"])
+            self.after = data.get("next")
+        else:
+            super().__init__(data["data"]["children"])
+            self.after = data["data"].get("after")
@@ -1,5 +1,4 @@
 """Provide the Preferences class."""
-from json import dumps
 from typing import Dict, TypeVar, Union
 
 from ..const import API_PATH
@@ -193,6 +192,10 @@ class Preferences:
                 **{'3rd_party_data_personalized_ads': False})
 
         """
-        return self._reddit.patch(
-            API_PATH["preferences"], data={"json": dumps(preferences)}
+        response = self._reddit.patch(
+            API_PATH["preferences"],
+            data={"json": self._reddit.json_backend.dumps(preferences)},
         )
+        self._reddit._invalidate_cache("me")
+        self._reddit._invalidate_cache("preferences")
+        return response
@@ -11,6 +11,33 @@ Reddit = TypeVar("Reddit")
 class RedditBase(PRAWBase):
     """Base class that represents actual Reddit objects."""
 
+    # Subclasses setting this to True store the attributes of their data
+    # compactly when the ``compact_models`` option is enabled.
+    _COMPACT = False
+
+    # Maps the class and the keys of the data to a pair of the keys stored in
+    # the instance dictionary, and the table of attribute indices shared by
+    # all compact instances with the same keys.
+    _compact_layouts = {}
+
+    @classmethod
+    def _compact_layout(cls, keys):
+        try:
+            return RedditBase._compact_layouts[cls, keys]
+        except KeyError:
+            pass
+        eager = []
+        table = {}
+        for key in keys:
+            # Attributes backed by the class, such as properties and
+            # conversions, keep being set normally.
+            if key == cls.STR_FIELD or hasattr(cls, key):
+                eager.append(key)
+            else:
+                table[key] = len(table)
+        result = RedditBase._compact_layouts[cls, keys] = (tuple(eager), table)
+        return result
+
     @staticmethod
     def _url_parts(url):
         parsed = urlparse(url)
@@ -29,8 +56,13 @@ class RedditBase(PRAWBase):
 
     def __getattr__(self, attribute: str) -> Any:
         """Return the value of `attribute`."""
+        table = self.__dict__.get("_compact_table")
+        if table is not None and attribute in table:
+            return self.__dict__["_compact_values"][table[attribute]]
         if not attribute.startswith("_") and not self._fetched:
-            self._fetch()
+            self._reddit._hydrate_lazy_batch()
+            if not self._fetched:
+                self._fetch()
             return getattr(self, attribute)
         raise AttributeError(
             "{!r} object has no attribute {!r}".format(
@@ -48,6 +80,11 @@ class RedditBase(PRAWBase):
         :param reddit: An instance of :class:`~.Reddit`.
 
         """
+        if _data and self._COMPACT and reddit.config.compact_models:
+            eager, table = self._compact_layout(tuple(_data))
+            self._compact_table = table
+            self._compact_values = tuple(_data[key] for key in table)
+            _data = {key: _data[key] for key in eager}
         super().__init__(reddit, _data=_data)
         self._fetched = False
 
@@ -68,7 +105,32 @@ class RedditBase(PRAWBase):
     def _fetch(self):  # pragma: no cover
         self._fetched = True
 
+    def _expand_compact(self):
+        """Move the compact attributes into the instance dictionary."""
+        table = self.__dict__.pop("_compact_table", None)
+        if table is not None:
+            values = self.__dict__.pop("_compact_values")
+            for attribute, index in table.items():
+                self.__dict__.setdefault(attribute, values[index])
+
+    def _has_attribute(self, attribute):
+        """Return whether ``attribute`` is set, without fetching the object.
+
+        Unlike ``attribute in self.__dict__``, this also finds the attributes
+        stored compactly.
+
+        """
+        return attribute in self.__dict__ or attribute in self.__dict__.get(
+            "_compact_table", ()
+        )
+
+    def _hydrate(self, other):
+        """Update the instance with the attributes of the fetched ``other``."""
+        self.__dict__.update(other.__dict__)
+        self._fetched = True
+
     def _reset_attributes(self, *attributes):
+        self._expand_compact()
         for attribute in attributes:
             if attribute in self.__dict__:
                 del self.__dict__[attribute]
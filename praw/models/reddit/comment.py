@@ -3,7 +3,7 @@ from typing import Any, Dict, Optional, TypeVar, Union
 
 from ...const import API_PATH
 from ...exceptions import ClientException, InvalidURL
-from ...util.cache import cachedproperty
+from ...util.cache import cachedconversion, cachedproperty
 from ..comment_forest import CommentForest
 from .base import RedditBase
 from .mixins import (
@@ -69,6 +69,14 @@ class Comment(InboxableMixin, UserContentMixin, FullnameMixin, RedditBase):
         "This comment does not appear to be in the comment tree"
     )
     STR_FIELD = "id"
+    _COMPACT = True
+
+    author = cachedconversion(
+        "author", lambda self, value: Redditor.from_data(self._reddit, value)
+    )
+    subreddit = cachedconversion(
+        "subreddit", lambda self, value: self._reddit.subreddit(value)
+    )
 
     @staticmethod
     def id_from_url(url: str) -> str:
@@ -178,17 +186,18 @@ class Comment(InboxableMixin, UserContentMixin, FullnameMixin, RedditBase):
         attribute: str,
         value: Union[str, Redditor, CommentForest, Subreddit],
     ):
-        """Objectify author, replies, and subreddit."""
-        if attribute == "author":
-            value = Redditor.from_data(self._reddit, value)
-        elif attribute == "replies":
+        """Objectify replies.
+
+        The ``author`` and ``subreddit`` attributes are objectified on first
+        access.
+
+        """
+        if attribute == "replies":
             if value == "":
                 value = []
             else:
                 value = self._reddit._objector.objectify(value).children
             attribute = "_replies"
-        elif attribute == "subreddit":
-            value = self._reddit.subreddit(value)
         super().__setattr__(attribute, value)
 
     def _fetch_info(self):
@@ -216,7 +225,7 @@ class Comment(InboxableMixin, UserContentMixin, FullnameMixin, RedditBase):
         self._fetched = True
 
     def _extract_submission_id(self):
-        if "context" in self.__dict__:
+        if self._has_attribute("context"):
             return self.context.rsplit("/", 4)[1]
         return self.link_id.split("_", 1)[1]
 
@@ -298,7 +307,7 @@ class Comment(InboxableMixin, UserContentMixin, FullnameMixin, RedditBase):
            comment.refresh()
 
         """
-        if "context" in self.__dict__:  # Using hasattr triggers a fetch
+        if self._has_attribute("context"):  # Using hasattr triggers a fetch
             comment_path = self.context.split("?", 1)[0]
         else:
             path = API_PATH["submission"].format(id=self.submission.id)
@@ -306,9 +315,9 @@ class Comment(InboxableMixin, UserContentMixin, FullnameMixin, RedditBase):
 
         # The context limit appears to be 8, but let's ask for more anyway.
         params = {"context": 100}
-        if "reply_limit" in self.__dict__:
+        if self._has_attribute("reply_limit"):
             params["limit"] = self.reply_limit
-        if "reply_sort" in self.__dict__:
+        if self._has_attribute("reply_sort"):
             params["sort"] = self.reply_sort
         comment_list = self._reddit.get(comment_path, params=params)[
             1
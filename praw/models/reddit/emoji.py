@@ -92,6 +92,7 @@ class Emoji(RedditBase):
             emoji_name=self.name, subreddit=self.subreddit
         )
         self._reddit.request("DELETE", url)
+        self._reddit._invalidate_cache("emoji_list", subreddit=self.subreddit)
 
     def update(
         self,
@@ -142,6 +143,7 @@ class Emoji(RedditBase):
             data[attribute] = value
         url = API_PATH["emoji_update"].format(subreddit=self.subreddit)
         self._reddit.post(url, data=data)
+        self._reddit._invalidate_cache("emoji_list", subreddit=self.subreddit)
         for attribute, value in data.items():
             setattr(self, attribute, value)
 
@@ -241,8 +243,8 @@ class SubredditEmoji:
         upload_url = "https:{}".format(upload_lease["action"])
 
         with open(image_path, "rb") as image:
-            response = self._reddit._core._requestor._http.post(
-                upload_url, data=upload_data, files={"file": image}
+            response = self._reddit._upload(
+                upload_url, upload_data, {"file": image}
             )
         response.raise_for_status()
 
@@ -255,4 +257,5 @@ class SubredditEmoji:
         }
         url = API_PATH["emoji_upload"].format(subreddit=self.subreddit)
         self._reddit.post(url, data=data)
+        self._reddit._invalidate_cache("emoji_list", subreddit=self.subreddit)
         return Emoji(self._reddit, self.subreddit, name)
@@ -1,5 +1,4 @@
 """Package providing reddit class mixins."""
-from json import dumps
 
 from ....const import API_PATH
 from .editable import EditableMixin
@@ -42,7 +41,8 @@ class ThingModerationMixin:
             "reason_id": reason_id,
         }
         self.thing._reddit.post(
-            API_PATH["removal_reasons"], data={"json": dumps(data)}
+            API_PATH["removal_reasons"],
+            data={"json": self.thing._reddit.json_backend.dumps(data)},
         )
 
     def approve(self):
@@ -216,7 +216,8 @@ class ThingModerationMixin:
             "type": type,
         }
 
-        return self.thing._reddit.post(url, data={"json": dumps(data)}) or None
+        payload = self.thing._reddit.json_backend.dumps(data)
+        return self.thing._reddit.post(url, data={"json": payload}) or None
 
     def undistinguish(self):
         """Remove mod, admin, or special distinguishing from an object.
@@ -12,6 +12,43 @@ Reddit = TypeVar("Reddit")
 class MoreComments(PRAWBase):
     """A class indicating there are more comments."""
 
+    #: The maximum number of children to request with a single
+    #: ``morechildren`` request.
+    MORECHILDREN_LIMIT = 100
+
+    @staticmethod
+    def _batch_comments(more_comments):
+        """Fetch and return the comments for each of ``more_comments``.
+
+        The children of all ``more_comments`` are requested at once, and each
+        returned comment is handed back to the instance that referenced it, or
+        that referenced its parent.
+
+        """
+        if len(more_comments) == 1:
+            return [more_comments[0].comments(update=False)]
+        first = more_comments[0]
+        prefix = first._reddit.config.kinds["comment"] + "_"
+        # The comments are only cached on the instances once the request
+        # succeeded, so that a failed request can be retried.
+        owners = {}
+        results = []
+        for index, item in enumerate(more_comments):
+            results.append([])
+            for child in item.children:
+                owners[prefix + child] = index
+        children = [child for item in more_comments for child in item.children]
+        for comment in first._fetch_children(children):
+            owner = owners.get(comment.name)
+            if owner is None:
+                owner = owners.get(comment.parent_id, 0)
+            if not isinstance(comment, MoreComments):
+                owners[comment.name] = owner
+            results[owner].append(comment)
+        for item, comments in zip(more_comments, results):
+            item._comments = comments
+        return results
+
     def __init__(self, reddit: Reddit, _data: Dict[str, Any]):
         """Construct an instance of the MoreComments object."""
         self.count = self.parent_id = None
@@ -53,6 +90,14 @@ class MoreComments(PRAWBase):
                 comment.submission = self.submission
         return self._comments
 
+    def _fetch_children(self, children):
+        data = {
+            "children": ",".join(children),
+            "link_id": self.submission.fullname,
+            "sort": self.submission.comment_sort,
+        }
+        return self._reddit.post(API_PATH["morechildren"], data=data)
+
     def _load_comment(self, comment_id):
         path = "{}_/{}".format(
             API_PATH["submission"].format(id=self.submission.id), comment_id
@@ -75,14 +120,7 @@ class MoreComments(PRAWBase):
             if self.count == 0:  # Handle 'continue this thread'
                 return self._continue_comments(update)
             assert self.children, "Please file a bug report with PRAW."
-            data = {
-                "children": ",".join(self.children),
-                "link_id": self.submission.fullname,
-                "sort": self.submission.comment_sort,
-            }
-            self._comments = self._reddit.post(
-                API_PATH["morechildren"], data=data
-            )
+            self._comments = self._fetch_children(self.children)
             if update:
                 for comment in self._comments:
                     comment.submission = self.submission
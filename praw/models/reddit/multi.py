@@ -1,6 +1,5 @@
 """Provide the Multireddit class."""
 import re
-from json import dumps
 from typing import Any, Dict, List, Optional, TypeVar, Union
 
 from ...const import API_PATH
@@ -122,6 +121,8 @@ class Multireddit(SubredditListingMixin, RedditBase):
 
     def _fetch(self):
         data = self._fetch_data()
+        if self._fetched and self._reddit._response_not_modified():
+            return
         data = data["data"]
         other = type(self)(self._reddit, _data=data)
         self.__dict__.update(other.__dict__)
@@ -143,9 +144,8 @@ class Multireddit(SubredditListingMixin, RedditBase):
         url = API_PATH["multireddit_update"].format(
             multi=self.name, user=self._author, subreddit=subreddit
         )
-        self._reddit.request(
-            "PUT", url, data={"model": dumps({"name": str(subreddit)})}
-        )
+        model = self._reddit.json_backend.dumps({"name": str(subreddit)})
+        self._reddit.request("PUT", url, data={"model": model})
         self._reset_attributes("subreddits")
 
     def copy(self, display_name: Optional[str] = None) -> _Multireddit:
@@ -209,9 +209,8 @@ class Multireddit(SubredditListingMixin, RedditBase):
         url = API_PATH["multireddit_update"].format(
             multi=self.name, user=self._author, subreddit=subreddit
         )
-        self._reddit.request(
-            "DELETE", url, data={"model": dumps({"name": str(subreddit)})}
-        )
+        model = self._reddit.json_backend.dumps({"name": str(subreddit)})
+        self._reddit.request("DELETE", url, data={"model": model})
         self._reset_attributes("subreddits")
 
     def update(
@@ -252,8 +251,7 @@ class Multireddit(SubredditListingMixin, RedditBase):
         path = API_PATH["multireddit_api"].format(
             multi=self.name, user=self._author.name
         )
-        response = self._reddit.request(
-            "PUT", path, data={"model": dumps(updated_settings)}
-        )
+        model = self._reddit.json_backend.dumps(updated_settings)
+        response = self._reddit.request("PUT", path, data={"model": model})
         new = Multireddit(self._reddit, response["data"])
         self.__dict__.update(new.__dict__)
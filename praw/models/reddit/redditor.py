@@ -1,5 +1,4 @@
 """Provide the Redditor class."""
-from json import dumps
 from typing import Any, Dict, Generator, List, Optional, TypeVar, Union
 
 from ...const import API_PATH
@@ -180,7 +179,8 @@ class Redditor(
 
     def _friend(self, method, data):
         url = API_PATH["friend_v1"].format(user=self)
-        self._reddit.request(method, url, data=dumps(data))
+        data = self._reddit.json_backend.dumps(data)
+        self._reddit.request(method, url, data=data)
 
     def block(self):
         """Block the Redditor.
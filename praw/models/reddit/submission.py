@@ -4,7 +4,7 @@ from urllib.parse import urljoin
 
 from ...const import API_PATH
 from ...exceptions import InvalidURL
-from ...util.cache import cachedproperty
+from ...util.cache import cachedconversion, cachedproperty
 from ..comment_forest import CommentForest
 from ..listing.listing import Listing
 from ..listing.mixins import SubmissionListingMixin
@@ -403,6 +403,14 @@ class Submission(
     """
 
     STR_FIELD = "id"
+    _COMPACT = True
+
+    author = cachedconversion(
+        "author", lambda self, value: Redditor.from_data(self._reddit, value)
+    )
+    subreddit = cachedconversion(
+        "subreddit", lambda self, value: Subreddit(self._reddit, value)
+    )
 
     @staticmethod
     def id_from_url(url: str) -> str:
@@ -464,7 +472,9 @@ class Submission(
         :class:`.CommentForest`.
 
         """
-        # This assumes _comments is set so that _fetch is called when it's not.
+        if "_comments" not in self.__dict__:
+            # Instances hydrated via ``Reddit.hydrate`` lack their comments.
+            self._fetch()
         return self._comments
 
     @cachedproperty
@@ -546,14 +556,6 @@ class Submission(
 
         self._comments_by_id = {}
 
-    def __setattr__(self, attribute: str, value: Any):
-        """Objectify author, and subreddit attributes."""
-        if attribute == "author":
-            value = Redditor.from_data(self._reddit, value)
-        elif attribute == "subreddit":
-            value = Subreddit(self._reddit, value)
-        super().__setattr__(attribute, value)
-
     def _chunk(self, other_submissions, chunk_size):
         all_submissions = [self.fullname]
         if other_submissions:
@@ -590,6 +592,12 @@ class Submission(
 
         self._fetched = True
 
+    def _hydrate(self, other):
+        # Keep the comment settings and the comment cache of this instance.
+        for attribute in ("_comments_by_id", "comment_limit", "comment_sort"):
+            other.__dict__.pop(attribute, None)
+        super()._hydrate(other)
+
     def mark_visited(self):
         """Mark submission as visited.
 
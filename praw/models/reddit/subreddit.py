@@ -3,7 +3,6 @@
 # pylint: disable=too-many-lines
 import socket
 from copy import deepcopy
-from json import dumps, loads
 from os.path import basename, dirname, join
 from urllib.parse import urljoin
 
@@ -183,6 +182,12 @@ class Subreddit(
 
         _reddit.post(API_PATH["site_admin"], data=model)
 
+    def _invalidate_about(self, other_subreddits=None):
+        for subreddit in [self] + list(other_subreddits or []):
+            self._reddit._invalidate_cache(
+                "subreddit_about", subreddit=subreddit
+            )
+
     @staticmethod
     def _subreddit_list(subreddit, other_subreddits):
         if other_subreddits:
@@ -505,6 +510,8 @@ class Subreddit(
 
     def _fetch(self):
         data = self._fetch_data()
+        if self._fetched and self._reddit._response_not_modified():
+            return
         data = data["data"]
         other = type(self)(self._reddit, _data=data)
         self.__dict__.update(other.__dict__)
@@ -546,7 +553,7 @@ class Subreddit(
             connection = websocket.create_connection(
                 response["json"]["data"]["websocket_url"], timeout=timeout
             )
-            ws_update = loads(connection.recv())
+            ws_update = self._reddit.json_backend.loads(connection.recv())
             connection.close()
         except (
             websocket.WebSocketException,
@@ -607,8 +614,8 @@ class Subreddit(
         }
 
         with open(media_path, "rb") as media:
-            response = self._reddit._core._requestor._http.post(
-                upload_url, data=upload_data, files={"file": media}
+            response = self._reddit._upload(
+                upload_url, upload_data, {"file": media}
             )
         response.raise_for_status()
 
@@ -1005,6 +1012,7 @@ class Subreddit(
             "sr_name": self._subreddit_list(self, other_subreddits),
         }
         self._reddit.post(API_PATH["subscribe"], data=data)
+        self._invalidate_about(other_subreddits)
 
     def traffic(self):
         """Return a dictionary of the subreddit's traffic statistics.
@@ -1053,6 +1061,7 @@ class Subreddit(
             "sr_name": self._subreddit_list(self, other_subreddits),
         }
         self._reddit.post(API_PATH["subscribe"], data=data)
+        self._invalidate_about(other_subreddits)
 
 
 WidgetEncoder._subreddit_class = Subreddit
@@ -1123,9 +1132,9 @@ class SubredditFilters:
             user=self.subreddit._reddit.user.me(),
             subreddit=subreddit,
         )
-        self.subreddit._reddit.request(
-            "PUT", url, data={"model": dumps({"name": str(subreddit)})}
-        )
+        reddit = self.subreddit._reddit
+        model = reddit.json_backend.dumps({"name": str(subreddit)})
+        reddit.request("PUT", url, data={"model": model})
 
     def remove(self, subreddit):
         """Remove ``subreddit`` from the list of filtered subreddits.
@@ -1688,6 +1697,7 @@ class SubredditModeration:
         """Accept an invitation as a moderator of the community."""
         url = API_PATH["accept_mod_invite"].format(subreddit=self.subreddit)
         self.subreddit._reddit.post(url)
+        self.subreddit._invalidate_about()
 
     def edited(self, only=None, **generator_kwargs):
         """Return a :class:`.ListingGenerator` for edited comments and submissions.
@@ -2022,9 +2032,14 @@ class SubredditModeration:
             current_settings[new] = current_settings.pop(old)
 
         current_settings.update(settings)
-        return Subreddit._create_or_update(
+        response = Subreddit._create_or_update(
             _reddit=self.subreddit._reddit, sr=fullname, **current_settings
         )
+        self.subreddit._invalidate_about()
+        self.subreddit._reddit._invalidate_cache(
+            "subreddit_settings", subreddit=self.subreddit
+        )
+        return response
 
 
 class SubredditModerationStream:
@@ -2933,8 +2948,8 @@ class SubredditStylesheet:
         upload_url = "https:{}".format(upload_lease["action"])
 
         with open(image_path, "rb") as image:
-            response = self.subreddit._reddit._core._requestor._http.post(
-                upload_url, data=upload_data, files={"file": image}
+            response = self.subreddit._reddit._upload(
+                upload_url, upload_data, {"file": image}
             )
         response.raise_for_status()
 
@@ -1,7 +1,7 @@
 """Provide classes related to widgets."""
 
 import os.path
-from json import JSONEncoder, dumps
+from json import JSONEncoder
 
 from ...const import API_PATH
 from ...util.cache import cachedproperty
@@ -303,10 +303,14 @@ class SubredditWidgets(PRAWBase):
         )
 
     def _fetch(self):
-        data = self._reddit.get(
+        data = self._reddit.request(
+            "GET",
             API_PATH["widgets"].format(subreddit=self.subreddit),
             params={"progressive_images": self.progressive_images},
         )
+        if self._fetched and self._reddit._response_not_modified():
+            return
+        data = self._reddit._objector.objectify(data)
 
         self._raw_items = data.pop("items")
         super().__init__(self.subreddit._reddit, data)
@@ -351,9 +355,9 @@ class SubredditWidgetsModeration:
 
     def _create_widget(self, payload):
         path = API_PATH["widget_create"].format(subreddit=self._subreddit)
-        widget = self._reddit.post(
-            path, data={"json": dumps(payload, cls=WidgetEncoder)}
-        )
+        payload = self._reddit.json_backend.dumps(payload, cls=WidgetEncoder)
+        widget = self._reddit.post(path, data={"json": payload})
+        self._reddit._invalidate_cache("widgets", subreddit=self._subreddit)
         widget.subreddit = self._subreddit
         return widget
 
@@ -870,9 +874,9 @@ class SubredditWidgetsModeration:
         path = API_PATH["widget_order"].format(
             subreddit=self._subreddit, section=section
         )
-        self._reddit.patch(
-            path, data={"json": dumps(order), "section": section}
-        )
+        order = self._reddit.json_backend.dumps(order)
+        self._reddit.patch(path, data={"json": order, "section": section})
+        self._reddit._invalidate_cache("widgets", subreddit=self._subreddit)
 
     def upload_image(self, file_path):
         """Upload an image to Reddit and get the URL.
@@ -912,8 +916,8 @@ class SubredditWidgetsModeration:
         upload_url = "https:{}".format(upload_lease["action"])
 
         with open(file_path, "rb") as image:
-            response = self._reddit._core._requestor._http.post(
-                upload_url, data=upload_data, files={"file": image}
+            response = self._reddit._upload(
+                upload_url, upload_data, {"file": image}
             )
         response.raise_for_status()
 
@@ -1764,6 +1768,7 @@ class WidgetModeration:
             widget_id=self.widget.id, subreddit=self._subreddit
         )
         self._reddit.request("DELETE", path)
+        self._reddit._invalidate_cache("widgets", subreddit=self._subreddit)
 
     def update(self, **kwargs):
         """Update the widget. Returns the updated widget.
@@ -1793,8 +1798,8 @@ class WidgetModeration:
         }
         del payload["subreddit"]  # not JSON serializable
         payload.update(kwargs)
-        widget = self._reddit.put(
-            path, data={"json": dumps(payload, cls=WidgetEncoder)}
-        )
+        payload = self._reddit.json_backend.dumps(payload, cls=WidgetEncoder)
+        widget = self._reddit.put(path, data={"json": payload})
+        self._reddit._invalidate_cache("widgets", subreddit=self._subreddit)
         widget.subreddit = self._subreddit
         return widget
@@ -137,9 +137,13 @@ class WikiPage(RedditBase):
 
     @staticmethod
     def _revision_generator(subreddit, url, generator_kwargs):
-        for revision in ListingGenerator(
+        generator = ListingGenerator(
             subreddit._reddit, url, **generator_kwargs
-        ):
+        )
+        for revision in generator:
+            if generator.raw:
+                yield revision
+                continue
             if revision["author"] is not None:
                 revision["author"] = Redditor(
                     subreddit._reddit, _data=revision["author"]["data"]
@@ -213,6 +217,8 @@ class WikiPage(RedditBase):
 
     def _fetch(self):
         data = self._fetch_data()
+        if self._fetched and self._reddit._response_not_modified():
+            return
         data = data["data"]
         if data["revision_by"] is not None:
             data["revision_by"] = Redditor(
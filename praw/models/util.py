@@ -1,31 +1,60 @@
 """Provide helper classes used by other models."""
+import heapq
+import logging
+import math
 import random
 import time
-from typing import Any, Callable, Generator, List, Optional, Set
+from collections import OrderedDict
+from hashlib import sha1
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from ..util.checkpoint import Checkpoint
+
+log = logging.getLogger(__name__)
 
 
 class BoundedSet:
     """A set with a maximum size that evicts the oldest items when necessary.
 
+    Adding an item and testing membership take constant time.
+
     This class does not implement the complete set interface.
     """
 
     def __init__(self, max_items: int):
         """Construct an instance of the BoundedSet."""
         self.max_items = max_items
-        self._fifo = []
-        self._set = set()
+        self._set = OrderedDict()
 
     def __contains__(self, item: Any) -> bool:
         """Test if the BoundedSet contains item."""
         return item in self._set
 
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the items from the oldest to the newest."""
+        return iter(self._set)
+
+    def __len__(self) -> int:
+        """Return the number of items in the BoundedSet."""
+        return len(self._set)
+
     def add(self, item: Any):
         """Add an item to the set discarding the oldest item if necessary."""
-        if len(self._set) == self.max_items:
-            self._set.remove(self._fifo.pop(0))
-        self._fifo.append(item)
-        self._set.add(item)
+        if item in self._set:
+            return
+        if len(self._set) >= self.max_items:
+            self._set.popitem(last=False)
+        self._set[item] = None
 
 
 class ExponentialCounter:
@@ -52,6 +81,268 @@ class ExponentialCounter:
         self._base = 1
 
 
+class PollPolicy:
+    """The interface of the policies that schedule the polls of a stream.
+
+    A policy instance belongs to a single stream. After each response, the
+    stream calls :meth:`.delay` with the new items of the response, and waits
+    for the returned number of seconds before issuing its next request.
+
+    """
+
+    def delay(self, items: List[Any]) -> float:
+        """Return the seconds to wait before the next poll.
+
+        :param items: The new items of the last response, oldest first.
+
+        """
+        raise NotImplementedError
+
+    def reset(self):
+        """Handle a pause of the stream."""
+
+
+class ExponentialPollPolicy(PollPolicy):
+    """Poll again immediately after new items, and back off exponentially.
+
+    This is the default policy of :func:`.stream_generator`. The delay after
+    each response without new items doubles, with jitter, up to just over
+    ``max_delay`` seconds. Any new item, or a pause, resets the delay to one
+    second.
+
+    """
+
+    def __init__(self, max_delay: int = 16):
+        """Initialize an ExponentialPollPolicy instance.
+
+        :param max_delay: The maximum base delay in seconds (default: 16).
+
+        """
+        self._exponential_counter = ExponentialCounter(max_counter=max_delay)
+
+    def delay(self, items: List[Any]) -> float:
+        """Return the seconds to wait before the next poll."""
+        if items:
+            self._exponential_counter.reset()
+            return 0
+        return self._exponential_counter.counter()
+
+    def reset(self):
+        """Reset the delay to one second."""
+        self._exponential_counter.reset()
+
+
+class AdaptivePollPolicy(PollPolicy):
+    """Poll at the rate at which a stream receives new items.
+
+    The arrival rate of the stream is estimated from the gaps between the
+    ``created_utc`` values of its items, and smoothed over the responses. The
+    next poll is then scheduled for when ``target_items`` new items are
+    expected, so that busy streams are polled often enough not to exceed the
+    100 items of a single response, while quiet streams are polled rarely.
+
+    .. code-block:: python
+
+       from praw.models.util import AdaptivePollPolicy
+
+       subreddit = reddit.subreddit('AskReddit')
+       for comment in subreddit.stream.comments(
+               poll_policy=AdaptivePollPolicy):
+           print(comment)
+
+    """
+
+    def __init__(
+        self,
+        min_delay: float = 1,
+        max_delay: float = 60,
+        target_items: int = 50,
+        smoothing: float = 0.5,
+    ):
+        """Initialize an AdaptivePollPolicy instance.
+
+        :param min_delay: The minimum delay between polls in seconds
+            (default: 1).
+        :param max_delay: The maximum delay between polls in seconds
+            (default: 60).
+        :param target_items: The number of new items expected per response
+            (default: 50).
+        :param smoothing: The weight of the most recent rate observation,
+            between 0 and 1 (default: 0.5).
+
+        """
+        self.max_delay = max_delay
+        self.min_delay = min_delay
+        self.smoothing = smoothing
+        self.target_items = target_items
+        self._fallback_delay = min_delay
+        self._newest = None
+        self._rate = None
+
+    def _observe(self, items):
+        """Return the arrival rate observed in ``items``, or ``None``."""
+        times = sorted(
+            created
+            for created in (
+                _item_attribute(x, "created_utc", None) for x in items
+            )
+            if created is not None
+        )
+        if self._newest is not None:
+            times.insert(0, self._newest)
+        if times:
+            now = time.time()
+            if len(times) > 1 and times[-1] > times[0]:
+                sample = (len(times) - 1) / (times[-1] - times[0])
+            elif not items and now > times[-1]:
+                # Nothing arrived since the newest item, which bounds the rate.
+                sample = 1 / (now - times[-1])
+                if self._rate is not None and sample >= self._rate:
+                    sample = None
+            else:
+                sample = None
+            self._newest = times[-1]
+            return sample
+        return None
+
+    def delay(self, items: List[Any]) -> float:
+        """Return the seconds to wait before the next poll."""
+        sample = self._observe(items)
+        if sample is not None:
+            if self._rate is None:
+                self._rate = sample
+            else:
+                self._rate += self.smoothing * (sample - self._rate)
+        if not self._rate:
+            # Without an estimate, back off as the exponential policy does.
+            delay = self._fallback_delay
+            self._fallback_delay = min(delay * 2, self.max_delay)
+            return delay
+        delay = self.target_items / self._rate
+        return max(self.min_delay, min(delay, self.max_delay))
+
+
+class RotatingBloomFilter:
+    """A compact set-like container remembering the most recent items.
+
+    Two Bloom filters of ``capacity`` items each are used: once the current
+    filter is full, it replaces the previous one and a new filter is started.
+    Hence at least the ``capacity`` most recently added items are remembered.
+    For the default ``error_rate``, each filter takes about 1.8 bytes per
+    item of ``capacity``, i.e., both take about 3.6 bytes per item of
+    ``capacity``, allocated up front and regardless of the length of the
+    items.
+
+    Membership tests never miss a remembered item, but may report an item
+    that was never added with a probability of up to about twice
+    ``error_rate``. For streams, such false positives are items that are not
+    yielded. The container cannot be iterated, and thus cannot be saved to a
+    :class:`.Checkpoint`.
+
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """Initialize a RotatingBloomFilter instance.
+
+        :param capacity: The number of items per filter.
+        :param error_rate: The false positive probability of a full filter
+            (default: 0.001).
+
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._bits = max(
+            8,
+            int(
+                math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+            ),
+        )
+        self._count = 0
+        self._hashes = max(1, round(self._bits / capacity * math.log(2)))
+        self._current = bytearray((self._bits + 7) // 8)
+        self._previous = bytearray(len(self._current))
+
+    def __contains__(self, item: Any) -> bool:
+        """Test if the item was probably added recently."""
+        positions = self._positions(item)
+        return any(
+            all(
+                bits[position >> 3] & 1 << (position & 7)
+                for position in positions
+            )
+            for bits in (self._current, self._previous)
+        )
+
+    def _positions(self, item):
+        digest = sha1(str(item).encode("utf-8")).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:16], "little") | 1
+        return [
+            (first + index * second) % self._bits
+            for index in range(self._hashes)
+        ]
+
+    def add(self, item: Any):
+        """Add an item, starting a new filter if the current one is full."""
+        if self._count >= self.capacity:
+            self._previous = self._current
+            self._current = bytearray(len(self._previous))
+            self._count = 0
+        for position in self._positions(item):
+            self._current[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+
+class TimeWindowSet:
+    """A set that evicts the items added more than ``seconds`` ago.
+
+    This class does not implement the complete set interface.
+
+    """
+
+    def __init__(self, seconds: float, max_items: Optional[int] = None):
+        """Initialize a TimeWindowSet instance.
+
+        :param seconds: The number of seconds items are kept for.
+        :param max_items: When provided, the oldest items are also evicted to
+            keep at most this many items (default: None).
+
+        """
+        self.max_items = max_items
+        self.seconds = seconds
+        self._items = OrderedDict()
+
+    def __contains__(self, item: Any) -> bool:
+        """Test if the item was added within the time window."""
+        self._expire()
+        return item in self._items
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the items from the oldest to the newest."""
+        self._expire()
+        return iter(list(self._items))
+
+    def __len__(self) -> int:
+        """Return the number of items added within the time window."""
+        self._expire()
+        return len(self._items)
+
+    def _expire(self):
+        oldest = time.time() - self.seconds
+        items = self._items
+        while items and next(iter(items.values())) <= oldest:
+            items.popitem(last=False)
+
+    def add(self, item: Any):
+        """Add an item to the set discarding expired items."""
+        self._expire()
+        if item in self._items:
+            return
+        self._items[item] = time.time()
+        if self.max_items is not None and len(self._items) > self.max_items:
+            self._items.popitem(last=False)
+
+
 def permissions_string(
     permissions: Optional[List[str]], known_permissions: Set[str]
 ) -> str:
@@ -79,15 +370,314 @@ def permissions_string(
     return ",".join(to_set)
 
 
+def _default_dedup():
+    return BoundedSet(301)
+
+
+def _item_attribute(item, attribute, *default):
+    """Return ``attribute`` of a model, or of a raw listing child."""
+    if not isinstance(item, dict):
+        return getattr(item, attribute, *default)
+    data = item.get("data", item)
+    if attribute == "fullname":
+        attribute = "name"
+    return data.get(attribute, *default) if default else data[attribute]
+
+
+class StreamPoller:
+    """Request the items of a listing that have not been seen before.
+
+    A StreamPoller holds the state of a single stream: the recently seen
+    items, the item new items are requested ``before``, and the
+    :class:`.PollPolicy` scheduling its requests.
+
+    A full response that was requested without ``before`` and contains none
+    of the seen items indicates that more items arrived between two polls
+    than a single response contains. The poller then pages back from the
+    oldest item of the response with ``after`` until it reaches a seen item.
+    Responses with fewer items than requested are not paged back from, as
+    listings such as the unread messages or the modqueue drop their items. The number
+    of items recovered this way is counted in :attr:`.recovered`, logged to
+    the ``praw.models.util`` logger, and passed to ``on_recovered``.
+
+    When a :class:`.Checkpoint` is provided, the recently seen items are
+    restored from it, and the first poll pages back in the same way, so that
+    the items received while the stream was stopped are neither repeated nor
+    skipped.
+
+    """
+
+    #: The maximum number of additional requests made to reach a seen item.
+    #: Reddit's listings contain at most 1000 items.
+    MAX_BACKFILL_REQUESTS = 9
+
+    def __init__(
+        self,
+        function: Callable[[Any], Any],
+        attribute_name: str = "fullname",
+        exclude_before: bool = False,
+        poll_policy: Optional[Callable[[], PollPolicy]] = None,
+        checkpoint: Optional[Checkpoint] = None,
+        dedup: Optional[Callable[[], Any]] = None,
+        backfill: bool = True,
+        on_recovered: Optional[Callable[[int], Any]] = None,
+        **function_kwargs: Any
+    ):
+        """Initialize a StreamPoller instance.
+
+        :param function: A callable that returns a ListingGenerator, e.g.
+            ``subreddit.comments`` or ``subreddit.new``.
+        :param attribute_name: The field to use as an id (default:
+            "fullname").
+        :param exclude_before: When True does not pass ``params`` to
+            ``function`` (default: False).
+        :param poll_policy: A callable, typically a subclass of
+            :class:`.PollPolicy`, returning the policy scheduling the requests
+            of the stream (default: :class:`.ExponentialPollPolicy`).
+        :param checkpoint: A :class:`.Checkpoint` to restore the state of the
+            stream from, and to save it to with :meth:`.save_checkpoint`
+            (default: None).
+        :param dedup: A callable returning the container remembering the ids
+            of the seen items, e.g., ``lambda: BoundedSet(10000)``, or
+            ``lambda: TimeWindowSet(3600)`` (default: a :class:`.BoundedSet`
+            of 301 items).
+        :param backfill: When True, pages back to recover the items that
+            arrived between two polls but did not fit in a single response
+            (default: True).
+        :param on_recovered: A callable called with the number of items
+            recovered each time the poller pages back (default: None).
+
+        Additional keyword arguments will be passed to ``function``.
+
+        """
+        self.function = function
+        self.poll_policy = (poll_policy or ExponentialPollPolicy)()
+        self.recovered = 0
+        """The number of items recovered by paging back."""
+        self._attribute_name = attribute_name
+        self._backfill_overflow = backfill and not exclude_before
+        self._before_attribute = None
+        self._checkpoint = checkpoint
+        self._exclude_before = exclude_before
+        self._function_kwargs = function_kwargs
+        self._last_attribute = None
+        self._on_recovered = on_recovered
+        self._seen_attributes = (dedup or _default_dedup)()
+        self._without_before_counter = 0
+        if checkpoint is not None and not hasattr(
+            self._seen_attributes, "__iter__"
+        ):
+            raise TypeError("The dedup container cannot be checkpointed.")
+
+        state = None if checkpoint is None else checkpoint.load()
+        self.resumed = state is not None
+        """Whether the state of the stream was restored from a checkpoint."""
+        self._backfill_pending = self.resumed
+        self._seen_any = self.resumed
+        if self.resumed:
+            self._last_attribute = state["last"]
+            for attribute in state["seen"]:
+                self._seen_attributes.add(attribute)
+
+    def _backfill(self, page):
+        """Return ``page`` followed by the older items it does not overlap.
+
+        :param page: The items of a response, newest first.
+
+        """
+        if self._exclude_before:
+            return page
+        items = list(page)
+        recovered = self.recovered
+        for _ in range(self.MAX_BACKFILL_REQUESTS):
+            if not page or self._overlaps(page):
+                break
+            function_kwargs = dict(self._function_kwargs)
+            function_kwargs["params"] = {
+                "after": _item_attribute(items[-1], self._attribute_name)
+            }
+            page = list(self.function(limit=100, **function_kwargs))
+            self.recovered += sum(
+                _item_attribute(item, self._attribute_name)
+                not in self._seen_attributes
+                for item in page
+            )
+            items.extend(page)
+        if self.recovered > recovered:
+            log.info(
+                "Recovered %d items of %r by paging back",
+                self.recovered - recovered,
+                self.function,
+            )
+            if self._on_recovered is not None:
+                self._on_recovered(self.recovered - recovered)
+        return items
+
+    def _overlaps(self, page):
+        """Return whether ``page`` contains a seen item."""
+        return any(
+            _item_attribute(item, self._attribute_name)
+            in self._seen_attributes
+            for item in page
+        )
+
+    def delay(self, items: List[Any]) -> float:
+        """Return the seconds to wait before the next poll.
+
+        :param items: The items returned by the last call to :meth:`.poll`.
+
+        """
+        return self.poll_policy.delay(items)
+
+    def poll(self) -> List[Any]:
+        """Issue a single request and return its new items, oldest first."""
+        limit = 100
+        from_newest = self._before_attribute is None
+        if from_newest:
+            limit -= self._without_before_counter
+            self._without_before_counter = (
+                self._without_before_counter + 1
+            ) % 30
+        if not self._exclude_before:
+            self._function_kwargs["params"] = {
+                "before": self._before_attribute
+            }
+        page = list(self.function(limit=limit, **self._function_kwargs))
+        if self._backfill_pending:
+            self._backfill_pending = False
+            page = self._backfill(page)
+        elif (
+            self._backfill_overflow
+            and from_newest
+            and self._seen_any
+            and len(page) >= limit
+            and not self._overlaps(page)
+        ):
+            page = self._backfill(page)
+        items = []
+        newest_attribute = None
+        for item in reversed(page):
+            attribute = _item_attribute(item, self._attribute_name)
+            if attribute in self._seen_attributes:
+                continue
+            self._seen_attributes.add(attribute)
+            newest_attribute = attribute
+            items.append(item)
+        self._before_attribute = newest_attribute
+        if newest_attribute is not None:
+            self._last_attribute = newest_attribute
+            self._seen_any = True
+        return items
+
+    def reset_delay(self):
+        """Notify the poll policy that the stream paused."""
+        self.poll_policy.reset()
+
+    def save_checkpoint(self):
+        """Save the newest and the recently seen items to the checkpoint.
+
+        Items are yielded at least once: the items of a response should be
+        processed before the checkpoint is saved.
+
+        """
+        if self._checkpoint is not None:
+            self._checkpoint.save(
+                {
+                    "last": self._last_attribute,
+                    "seen": list(self._seen_attributes),
+                }
+            )
+
+
+def multiplex_generator(
+    functions: Iterable[Callable[[Any], Any]],
+    pause_after: Optional[int] = None,
+    skip_existing: bool = False,
+    **poller_kwargs: Any
+) -> Generator[Optional[Tuple[Callable[[Any], Any], Any]], None, None]:
+    """Yield ``(function, item)`` tuples of new items from many listings.
+
+    :param functions: An iterable of callables that return a ListingGenerator,
+        e.g., ``subreddit.comments`` or ``redditor.submissions.new``.
+
+    :param pause_after: An integer representing the number of consecutive
+        requests, across all ``functions``, that result in no new items before
+        this function yields ``None``. A negative value yields ``None`` after
+        the items of every response, and a value of ``None`` never introduces
+        a pause (default: None).
+
+    :param skip_existing: When True does not yield any results from the first
+        request of each function (default: False).
+
+    Additional keyword arguments are passed to :class:`.StreamPoller`.
+
+    Unlike running a :func:`.stream_generator` per function, all functions are
+    polled from a single loop. Each function is scheduled in a priority queue
+    by the time of its next poll, as determined by its poll policy. With the
+    default :class:`.ExponentialPollPolicy`, a function is polled again as
+    soon as possible after a response containing new items, and after an
+    exponential delay otherwise. The loop only sleeps until
+    the earliest of these deadlines. All requests share the rate limit of the
+    :class:`.Reddit` instance; when it is the bottleneck, due functions are
+    polled in the order in which they became due.
+
+    For example, to stream the comments of several subreddits, try:
+
+    .. code-block:: python
+
+       functions = [reddit.subreddit(name).comments
+                    for name in ('AskReddit', 'redditdev', 'test')]
+       for function, comment in multiplex_generator(functions):
+           print(function.__self__, comment)
+
+    """
+    if poller_kwargs.get("checkpoint") is not None:
+        raise TypeError("Checkpoints are only supported by single streams.")
+    queue = []
+    for index, function in enumerate(functions):
+        poller = StreamPoller(function, **poller_kwargs)
+        queue.append((0, index, poller, skip_existing))
+    heapq.heapify(queue)
+    responses_without_new = 0
+    valid_pause_after = pause_after is not None
+    while queue:
+        deadline, index, poller, skip = heapq.heappop(queue)
+        items = poller.poll()
+        if not skip:
+            for item in items:
+                yield poller.function, item
+        if items:
+            responses_without_new = 0
+        else:
+            responses_without_new += 1
+        deadline = time.time() + poller.delay(items)
+        heapq.heappush(queue, (deadline, index, poller, False))
+
+        if valid_pause_after and (
+            pause_after < 0 or responses_without_new > pause_after
+        ):
+            responses_without_new = 0
+            yield None
+        delay = queue[0][0] - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+
 def stream_generator(
     function: Callable[[Any], Any],
     pause_after: Optional[int] = None,
     skip_existing: bool = False,
     attribute_name: str = "fullname",
     exclude_before: bool = False,
+    poll_policy: Optional[Callable[[], PollPolicy]] = None,
+    checkpoint: Optional[Checkpoint] = None,
+    dedup: Optional[Callable[[], Any]] = None,
+    backfill: bool = True,
+    raw: bool = False,
+    on_recovered: Optional[Callable[[int], Any]] = None,
     **function_kwargs: Any
 ) -> Generator[Any, None, None]:
-    """Yield new items from ListingGenerators and ``None`` when paused.
+    r"""Yield new items from ListingGenerators and ``None`` when paused.
 
     :param function: A callable that returns a ListingGenerator, e.g.
        ``subreddit.comments`` or ``subreddit.new``.
@@ -109,13 +699,47 @@ def stream_generator(
     :param exclude_before: When True does not pass ``params`` to ``functions``
          (default: False).
 
+    :param poll_policy: A callable, typically a subclass of
+        :class:`.PollPolicy`, returning the policy that determines the delay
+        between requests (default: :class:`.ExponentialPollPolicy`).
+
+    :param checkpoint: A :class:`.Checkpoint`, e.g., a
+        :class:`.FileCheckpoint`, saving the state of the stream after the
+        items of each response are processed. When the checkpoint holds a
+        state, the stream resumes from it: the items received since are
+        yielded, and ``skip_existing`` is ignored (default: None).
+
+    :param dedup: A callable returning the container remembering the ids of
+        the yielded items. By default, a :class:`.BoundedSet` of the 301 most
+        recent ids is used. Streams of many sources or of busy listings may
+        use a larger :class:`.BoundedSet`, a :class:`.TimeWindowSet`, or a
+        :class:`.RotatingBloomFilter` (default: None).
+
+    :param backfill: When True, a full response that shares no item with the
+        previously yielded items causes older items to be requested with
+        ``after`` until the yielded items are reached, so that items are not
+        missed when more than a single response worth of items arrive between
+        two requests (default: True).
+
+    :param raw: When True, ``raw=True`` is passed to ``function``, so that the
+        stream yields the dicts of the listing children returned by reddit
+        instead of instances of :class:`.RedditBase`. See
+        :class:`.ListingGenerator` (default: False).
+
+    :param on_recovered: A callable called with the number of items recovered
+        each time ``backfill`` pages back, e.g., to monitor how often a stream
+        receives more new items than a single response contains (default:
+        None).
+
     Additional keyword arguments will be passed to ``function``.
 
-    .. note:: This function internally uses an exponential delay with jitter
+    .. note:: By default, this function uses an exponential delay with jitter
        between subsequent responses that contain no new results, up to a
        maximum delay of just over a 16 seconds. In practice that means that the
        time before pause for ``pause_after=N+1`` is approximately twice the
-       time before pause for ``pause_after=N``.
+       time before pause for ``pause_after=N``. Pass
+       ``poll_policy=AdaptivePollPolicy`` to instead poll at the rate at which
+       the stream receives new items.
 
     For example, to create a stream of comment replies, try:
 
@@ -153,6 +777,18 @@ def stream_generator(
                break
            print(comment)
 
+    To resume a comment stream where it stopped when the script is restarted,
+    try:
+
+    .. code-block:: python
+
+       from praw.util import FileCheckpoint
+
+       subreddit = reddit.subreddit('redditdev')
+       checkpoint = FileCheckpoint('redditdev_comments.json')
+       for comment in subreddit.stream.comments(checkpoint=checkpoint):
+           print(comment)
+
     To bypass the internal exponential backoff, try the following. This
     approach is useful if you are monitoring a subreddit with infrequent
     activity, and you want the to consistently learn about new items from the
@@ -167,43 +803,56 @@ def stream_generator(
                continue
            print(comment)
 
+    To archive the comments of a subreddit as they arrive, without creating
+    instances of :class:`.Comment`, try:
+
+    .. code-block:: python
+
+       import json
+
+       subreddit = reddit.subreddit('redditdev')
+       with open('redditdev_comments.ndjson', 'a') as fp:
+           for child in subreddit.stream.comments(raw=True):
+               fp.write(json.dumps(child['data']) + '\n')
+
     """
-    before_attribute = None
-    exponential_counter = ExponentialCounter(max_counter=16)
-    seen_attributes = BoundedSet(301)
-    without_before_counter = 0
+    if raw:
+        function_kwargs["raw"] = True
+    poller = StreamPoller(
+        function,
+        attribute_name=attribute_name,
+        exclude_before=exclude_before,
+        poll_policy=poll_policy,
+        checkpoint=checkpoint,
+        dedup=dedup,
+        backfill=backfill,
+        on_recovered=on_recovered,
+        **function_kwargs
+    )
+    if poller.resumed:
+        skip_existing = False
     responses_without_new = 0
     valid_pause_after = pause_after is not None
     while True:
-        found = False
-        newest_attribute = None
-        limit = 100
-        if before_attribute is None:
-            limit -= without_before_counter
-            without_before_counter = (without_before_counter + 1) % 30
-        if not exclude_before:
-            function_kwargs["params"] = {"before": before_attribute}
-        for item in reversed(list(function(limit=limit, **function_kwargs))):
-            attribute = getattr(item, attribute_name)
-            if attribute in seen_attributes:
-                continue
-            found = True
-            seen_attributes.add(attribute)
-            newest_attribute = attribute
-            if not skip_existing:
+        items = poller.poll()
+        if not skip_existing:
+            for item in items:
                 yield item
-        before_attribute = newest_attribute
+        if items:
+            poller.save_checkpoint()
         skip_existing = False
         if valid_pause_after and pause_after < 0:
             yield None
-        elif found:
-            exponential_counter.reset()
+            continue
+        delay = poller.delay(items)
+        if items:
             responses_without_new = 0
         else:
             responses_without_new += 1
             if valid_pause_after and responses_without_new > pause_after:
-                exponential_counter.reset()
+                poller.reset_delay()
                 responses_without_new = 0
                 yield None
-            else:
-                time.sleep(exponential_counter.counter())
+                continue
+        if delay > 0:
+            time.sleep(delay)
@@ -49,6 +49,30 @@ class Objector:
         if error:
             raise error
 
+    # Each rule maps the keys that identify a kind of dict to the name of the
+    # method that converts it. Rules are evaluated in order, and the first
+    # rule whose keys are all present in a dict applies.
+    _DICT_RULES = (
+        (("conversation", "messages", "modActions"), "_modmail_conversation"),
+        (("actionTypeId", "author", "date"), "_modmail_action"),
+        (("bodyMarkdown", "isInternal"), "_modmail_message"),
+        (("isAdmin", "isDeleted"), "_modmail_author"),
+        (("banStatus", "muteStatus", "recentComments"), "_modmail_user"),
+        (("displayName", "id", "type"), "_modmail_subreddit"),
+        (("date", "id", "name"), "_redditor"),
+        (("id", "name", "permissions"), "_redditor"),
+        (("text", "url", "color"), "_button"),
+        (("text", "url", "linkUrl"), "_button"),
+        (("text", "url"), "_menu_link"),
+        (("children", "text"), "_submenu"),
+        (("height", "url", "width"), "_image"),
+        (("isSubscribed", "name", "subscribers"), "_partial_subreddit"),
+        (("authorFlairType", "name"), "_partial_redditor"),
+        (("parent_id",), "_comment"),
+        (("collection_id",), "_collection"),
+        (("user",), "_user_data"),
+    )
+
     def __init__(
         self, reddit: Reddit, parsers: Optional[Dict[str, Any]] = None
     ):
@@ -59,6 +83,56 @@ class Objector:
         """
         self.parsers = {} if parsers is None else parsers
         self._reddit = reddit
+        self._rules = tuple(
+            (frozenset(keys), getattr(self, name))
+            for keys, name in self._DICT_RULES
+        )
+        self._rule_keys = frozenset().union(*(keys for keys, _ in self._rules))
+        self._rules_by_signature = {}
+
+    def _button(self, data):
+        return self.parsers["Button"].parse(data, self._reddit)
+
+    def _collection(self, data):
+        return self.parsers["Collection"].parse(data, self._reddit)
+
+    def _comment(self, data):
+        parser = self.parsers[self._reddit.config.kinds["comment"]]
+        return parser.parse(data, self._reddit)
+
+    def _image(self, data):
+        return self.parsers["Image"].parse(data, self._reddit)
+
+    def _menu_link(self, data):
+        return self.parsers["MenuLink"].parse(data, self._reddit)
+
+    def _modmail_action(self, data):
+        data = snake_case_keys(data)
+        return self.parsers["ModmailAction"].parse(data, self._reddit)
+
+    def _modmail_author(self, data):
+        data = snake_case_keys(data)
+        # Prevent clobbering base-36 id
+        del data["id"]
+        data["is_subreddit_mod"] = data.pop("is_mod")
+        return self._redditor(data)
+
+    def _modmail_conversation(self, data):
+        return self.parsers["ModmailConversation"].parse(data, self._reddit)
+
+    def _modmail_message(self, data):
+        data = snake_case_keys(data)
+        return self.parsers["ModmailMessage"].parse(data, self._reddit)
+
+    def _modmail_subreddit(self, data):
+        data = snake_case_keys(data)
+        parser = self.parsers[self._reddit.config.kinds[data["type"]]]
+        return parser.parse(data, self._reddit)
+
+    def _modmail_user(self, data):
+        data = snake_case_keys(data)
+        data["created_string"] = data.pop("created")
+        return self._redditor(data)
 
     def _objectify_dict(self, data):
         """Create RedditBase objects from dicts.
@@ -67,66 +141,41 @@ class Objector:
         :returns: An instance of :class:`~.RedditBase`.
 
         """
-        if {"conversation", "messages", "modActions"}.issubset(data):
-            parser = self.parsers["ModmailConversation"]
-        elif {"actionTypeId", "author", "date"}.issubset(data):
-            # Modmail mod action
-            data = snake_case_keys(data)
-            parser = self.parsers["ModmailAction"]
-        elif {"bodyMarkdown", "isInternal"}.issubset(data):
-            # Modmail message
-            data = snake_case_keys(data)
-            parser = self.parsers["ModmailMessage"]
-        elif {"isAdmin", "isDeleted"}.issubset(data):
-            # Modmail author
-            data = snake_case_keys(data)
-            # Prevent clobbering base-36 id
-            del data["id"]
-            data["is_subreddit_mod"] = data.pop("is_mod")
-            parser = self.parsers[self._reddit.config.kinds["redditor"]]
-        elif {"banStatus", "muteStatus", "recentComments"}.issubset(data):
-            # Modmail user
-            data = snake_case_keys(data)
-            data["created_string"] = data.pop("created")
-            parser = self.parsers[self._reddit.config.kinds["redditor"]]
-        elif {"displayName", "id", "type"}.issubset(data):
-            # Modmail subreddit
-            data = snake_case_keys(data)
-            parser = self.parsers[self._reddit.config.kinds[data["type"]]]
-        elif {"date", "id", "name"}.issubset(data) or {
-            "id",
-            "name",
-            "permissions",
-        }.issubset(data):
-            parser = self.parsers[self._reddit.config.kinds["redditor"]]
-        elif {"text", "url"}.issubset(data):
-            if "color" in data or "linkUrl" in data:
-                parser = self.parsers["Button"]
-            else:
-                parser = self.parsers["MenuLink"]
-        elif {"children", "text"}.issubset(data):
-            parser = self.parsers["Submenu"]
-        elif {"height", "url", "width"}.issubset(data):
-            parser = self.parsers["Image"]
-        elif {"isSubscribed", "name", "subscribers"}.issubset(data):
-            # discards icon and subscribed information
-            return self._reddit.subreddit(data["name"])
-        elif {"authorFlairType", "name"}.issubset(data):
-            # discards flair information
-            return self._reddit.redditor(data["name"])
-        elif {"parent_id"}.issubset(data):
-            parser = self.parsers[self._reddit.config.kinds["comment"]]
-        elif "collection_id" in data.keys():
-            parser = self.parsers["Collection"]
-        else:
-            if "user" in data:
-                parser = self.parsers[self._reddit.config.kinds["redditor"]]
-                data["user"] = parser.parse(
-                    {"name": data["user"]}, self._reddit
-                )
+        signature = frozenset(data.keys() & self._rule_keys)
+        try:
+            rule = self._rules_by_signature[signature]
+        except KeyError:
+            rule = self._rules_by_signature[signature] = next(
+                (
+                    method
+                    for keys, method in self._rules
+                    if keys.issubset(signature)
+                ),
+                None,
+            )
+        if rule is None:
             return data
+        return rule(data)
+
+    def _partial_redditor(self, data):
+        # discards flair information
+        return self._reddit.redditor(data["name"])
+
+    def _partial_subreddit(self, data):
+        # discards icon and subscribed information
+        return self._reddit.subreddit(data["name"])
+
+    def _redditor(self, data):
+        parser = self.parsers[self._reddit.config.kinds["redditor"]]
         return parser.parse(data, self._reddit)
 
+    def _submenu(self, data):
+        return self.parsers["Submenu"].parse(data, self._reddit)
+
+    def _user_data(self, data):
+        data["user"] = self._redditor({"name": data["user"]})
+        return data
+
     def objectify(
         self, data: Optional[Union[Dict[str, Any], List[Any]]]
     ) -> Optional[Union[RedditBase, Dict[str, Any], List[Any]]]:
@@ -141,16 +190,16 @@ class Objector:
         if data is None:  # 204 no content
             return None
         if isinstance(data, list):
-            return [self.objectify(item) for item in data]
-        if "kind" in data and (
-            "shortName" in data or data["kind"] in ("menu", "moderators")
-        ):
-            # This is a widget
-            parser = self.parsers.get(data["kind"], self.parsers["widget"])
-            return parser.parse(data, self._reddit)
-        if {"kind", "data"}.issubset(data) and data["kind"] in self.parsers:
-            parser = self.parsers[data["kind"]]
-            return parser.parse(data["data"], self._reddit)
+            objectify = self.objectify
+            return [objectify(item) for item in data]
+        if "kind" in data:
+            kind = data["kind"]
+            if "shortName" in data or kind in ("menu", "moderators"):
+                # This is a widget
+                parser = self.parsers.get(kind, self.parsers["widget"])
+                return parser.parse(data, self._reddit)
+            if "data" in data and kind in self.parsers:
+                return self.parsers[kind].parse(data["data"], self._reddit)
         if "json" in data and "data" in data["json"]:
             if "websocket_url" in data["json"]["data"]:
                 return data
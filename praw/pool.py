@@ -0,0 +1,296 @@
+"""Provide the RedditPool class."""
+from contextlib import contextmanager
+from threading import Lock, local
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+)
+
+from prawcore import (
+    DeviceIDAuthorizer,
+    ReadOnlyAuthorizer,
+    TrustedAuthenticator,
+    UntrustedAuthenticator,
+    session,
+)
+
+from .config import Config
+from .endpoints import API_PATH
+from .exceptions import MissingRequiredAttributeException
+from .reddit import Reddit
+from .requestor import Requestor
+from .util.cache import ResponseCache
+from .util.endpoints import endpoint_name
+from .util.jsonbackend import JSONBackend
+from .util.scheduler import RequestScheduler
+
+_PINNED_PREFIXES = ("about_", "list_", "moderator_", "modmail_", "my_")
+
+#: The names of ``API_PATH`` entries whose responses depend on the
+#: authenticated user. GET requests to them are always issued by the owner.
+PINNED_ENDPOINTS = frozenset(
+    [name for name in API_PATH if name.startswith(_PINNED_PREFIXES)]
+    + [
+        "blocked",
+        "comment_replies",
+        "flaircsv",
+        "flairlist",
+        "friends",
+        "inbox",
+        "karma",
+        "me",
+        "mentions",
+        "message",
+        "messages",
+        "preferences",
+        "removal_reasons_list",
+        "sent",
+        "submission_replies",
+        "subreddit_settings",
+        "unread",
+    ]
+)
+
+
+class _Credential:
+    """Hold the session of one site of a :class:`.RedditPool`.
+
+    The credential of the owner reads the current session of the pool, as
+    ``read_only`` may be toggled.
+
+    """
+
+    def __init__(self, site, core=None, owner=None):
+        self._core = core
+        self._owner = owner
+        self.requests = 0
+        self.site = site
+
+    @property
+    def core(self):
+        """Return the session of the credential."""
+        return self._core if self._owner is None else self._owner._core
+
+    @property
+    def remaining(self):
+        """Return the remaining requests, or ``None`` when unknown."""
+        return self.core._rate_limiter.remaining
+
+
+class RedditPool(Reddit):
+    """A :class:`.Reddit` instance sharding reads across several credentials.
+
+    Reddit limits the request rate of each OAuth application. A pool is
+    configured with several sites, e.g., sections of ``praw.ini``, each with
+    its own application. The first site is the owner: the pool acts as a
+    :class:`.Reddit` instance for that site, and all non-GET requests, i.e.,
+    writes, are issued by it.
+
+    GET requests issued by listings, :meth:`.info` and the fetches of lazy
+    objects are routed to the credential with the most remaining requests in
+    the current rate limit window. The owner contributes its current session,
+    and every other site its read-only, application-only session.
+
+    The responses of an authenticated session may depend on its user, e.g.,
+    hidden submissions, private subreddits or the vote of each item. Hence
+    while the owner is authenticated, i.e., not :attr:`~.Reddit.read_only`,
+    all of its requests are issued by the owner unless the caller opts in to
+    routing: per endpoint with ``shared_endpoints``, or per call within
+    :meth:`.shared`. Requests to the endpoints in :data:`.PINNED_ENDPOINTS`
+    are never routed, and :meth:`.pinned` keeps all requests with the owner:
+
+    .. code-block:: python
+
+       import praw
+
+       pool = praw.RedditPool(['bot1', 'bot2', 'bot3'], user_agent='USERAGENT')
+       with pool.shared():
+           for submission in pool.subreddit('all').hot(limit=1000):
+               print(submission.title)
+       print(list(pool.user.me().saved()))
+
+    All credentials share the requestor of the owner.
+
+    """
+
+    def __init__(
+        self,
+        sites: Sequence[Union[str, Dict[str, Any]]],
+        config_interpolation: Optional[str] = None,
+        requestor_class: Optional[Type[Requestor]] = None,
+        requestor_kwargs: Dict[str, Any] = None,
+        response_cache: Optional[ResponseCache] = None,
+        request_scheduler: Optional[RequestScheduler] = None,
+        json_backend: Optional[Union[str, JSONBackend]] = None,
+        shared_endpoints: Optional[Iterable[str]] = None,
+        **config_settings: str
+    ):
+        """Initialize a RedditPool instance.
+
+        :param sites: A sequence of sites, the first of which is the owner.
+            Each site is either the name of a section in your ``praw.ini``
+            file, or a dictionary of configuration settings, e.g.,
+            ``{'client_id': ..., 'client_secret': ...}``.
+        :param shared_endpoints: The names of ``API_PATH`` entries, e.g.,
+            ``['info', 'subreddit']``, whose GET requests are routed even
+            while the owner is authenticated (default: None).
+
+        The remaining parameters are described in :class:`.Reddit`. Additional
+        keyword arguments are used to configure every site.
+
+        """
+        if not sites:
+            raise ValueError("At least one site is required.")
+        site_name, settings = self._site_settings(sites[0], config_settings)
+        self._credentials = []
+        self._local = local()
+        self._lock = Lock()
+        self._shared_endpoints = frozenset(shared_endpoints or ())
+        super().__init__(
+            site_name,
+            config_interpolation=config_interpolation,
+            requestor_class=requestor_class,
+            requestor_kwargs=requestor_kwargs,
+            response_cache=response_cache,
+            request_scheduler=request_scheduler,
+            json_backend=json_backend,
+            **settings
+        )
+        requestor = self._core._requestor
+        self._credentials.append(
+            _Credential(site_name or "DEFAULT", owner=self)
+        )
+        for site in sites[1:]:
+            site_name, settings = self._site_settings(site, config_settings)
+            config = Config(
+                site_name or "DEFAULT", config_interpolation, **settings
+            )
+            self._credentials.append(
+                _Credential(
+                    site_name or config.client_id,
+                    self._read_only_session(config, requestor),
+                )
+            )
+
+    @staticmethod
+    def _read_only_session(config, requestor):
+        if config.client_id in (config.CONFIG_NOT_SET, None):
+            raise MissingRequiredAttributeException(
+                "Required configuration setting 'client_id' missing."
+            )
+        if config.client_secret:
+            authenticator = TrustedAuthenticator(
+                requestor,
+                config.client_id,
+                config.client_secret,
+                config.redirect_uri,
+            )
+            return session(ReadOnlyAuthorizer(authenticator))
+        authenticator = UntrustedAuthenticator(
+            requestor, config.client_id, config.redirect_uri
+        )
+        return session(DeviceIDAuthorizer(authenticator))
+
+    @staticmethod
+    def _site_settings(site, config_settings):
+        if isinstance(site, str):
+            return site, config_settings
+        return None, dict(config_settings, **site)
+
+    def _request_core(self, method, path):
+        """Return the session with the most remaining requests for reads."""
+        name = endpoint_name(path)
+        if (
+            method != "GET"
+            or getattr(self._local, "pinned", False)
+            or name in PINNED_ENDPOINTS
+            or not (
+                self.read_only
+                or getattr(self._local, "shared", False)
+                or name in self._shared_endpoints
+            )
+        ):
+            credential = self._credentials[0]
+        else:
+            credential = min(
+                self._credentials,
+                key=lambda item: (
+                    item.remaining is not None,
+                    -(item.remaining or 0),
+                    item.requests,
+                ),
+            )
+        return credential.core
+
+    def _request_sent(self, core):
+        """Count the request sent by the credential of ``core``."""
+        for credential in self._credentials:
+            if credential.core is core:
+                with self._lock:
+                    credential.requests += 1
+                return
+
+    @contextmanager
+    def pinned(self) -> Generator[None, None, None]:
+        """Return a context manager issuing all requests as the owner.
+
+        Within the context, GET requests of the current thread are issued by
+        the owner, e.g., to list the saved items of the authenticated user.
+
+        """
+        previous = getattr(self._local, "pinned", False)
+        self._local.pinned = True
+        try:
+            yield
+        finally:
+            self._local.pinned = previous
+
+    @contextmanager
+    def shared(self) -> Generator[None, None, None]:
+        """Return a context manager routing reads of an authenticated owner.
+
+        Within the context, GET requests of the current thread are routed
+        across all credentials even while the owner is authenticated, except
+        for those to :data:`.PINNED_ENDPOINTS` and those within
+        :meth:`.pinned`. Use it for reads whose responses do not depend on the
+        authenticated user.
+
+        """
+        previous = getattr(self._local, "shared", False)
+        self._local.shared = True
+        try:
+            yield
+        finally:
+            self._local.shared = previous
+
+    def utilization(self) -> List[Dict[str, Any]]:
+        """Return the usage of each credential.
+
+        :returns: A list with a dictionary per site, in the order of
+            ``sites``, with the keys ``site``, ``requests`` (the number of
+            requests it sent, excluding responses served from the response
+            cache), ``remaining``, ``used`` and ``reset_timestamp`` (the
+            latter three as in :attr:`.Auth.limits`, ``None`` until its first
+            response).
+
+        """
+        result = []
+        for credential in self._credentials:
+            limiter = credential.core._rate_limiter
+            result.append(
+                {
+                    "remaining": limiter.remaining,
+                    "requests": credential.requests,
+                    "reset_timestamp": limiter.reset_timestamp,
+                    "site": credential.site,
+                    "used": limiter.used,
+                }
+            )
+        return result
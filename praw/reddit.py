@@ -1,15 +1,27 @@
 """Provide the Reddit class."""
 import configparser
 import os
+import time
+from contextlib import contextmanager
+from hashlib import sha1
 from itertools import islice
-from typing import IO, Any, Dict, Generator, Iterable, Optional, Type, Union
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    Union,
+)
 
 from prawcore import (
     Authorizer,
     DeviceIDAuthorizer,
     ReadOnlyAuthorizer,
     Redirect,
-    Requestor,
     ScriptAuthorizer,
     TrustedAuthenticator,
     UntrustedAuthenticator,
@@ -21,6 +33,13 @@ from .config import Config
 from .const import API_PATH, USER_AGENT_FORMAT, __version__
 from .exceptions import ClientException, MissingRequiredAttributeException
 from .objector import Objector
+from .requestor import Requestor
+from .util.cache import ResponseCache
+from .util.endpoints import endpoint_name
+from .util.jsonbackend import JSONBackend
+from .util.jsonbackend import json_backend as named_json_backend
+from .util.metrics import RequestMetrics
+from .util.scheduler import RequestScheduler
 
 try:
     from update_checker import update_check
@@ -96,6 +115,9 @@ class Reddit:
         config_interpolation: Optional[str] = None,
         requestor_class: Optional[Type[Requestor]] = None,
         requestor_kwargs: Dict[str, Any] = None,
+        response_cache: Optional[ResponseCache] = None,
+        request_scheduler: Optional[RequestScheduler] = None,
+        json_backend: Optional[Union[str, JSONBackend]] = None,
         **config_settings: str
     ):  # noqa: D207, D301
         """Initialize a Reddit instance.
@@ -109,9 +131,20 @@ class Reddit:
             variable praw_site. If it is not found there, the DEFAULT site will
             be used.
         :param requestor_class: A class that will be used to create a
-            requestor. If not set, use ``prawcore.Requestor`` (default: None).
+            requestor. If not set, use :class:`praw.requestor.Requestor`
+            (default: None).
         :param requestor_kwargs: Dictionary with additional keyword arguments
             used to initialize the requestor (default: None).
+        :param response_cache: An instance of :class:`.ResponseCache` used to
+            cache the data returned by GET requests to the endpoints it is
+            configured for (default: None).
+        :param request_scheduler: An instance of :class:`.RequestScheduler`
+            used to dispatch the requests of concurrent threads by priority
+            under the rate limit (default: None).
+        :param json_backend: The :class:`.JSONBackend` decoding responses and
+            encoding JSON payloads, or the name of one as accepted by
+            :func:`.json_backend`, e.g., ``'auto'`` to use the fastest
+            installed library (default: the standard library).
 
         Additional keyword arguments will be used to initialize the
         :class:`.Config` object. This can be used to specify configuration
@@ -149,9 +182,30 @@ class Reddit:
 
         """
         self._core = self._authorized_core = self._read_only_core = None
+        self._lazy_batch = None
         self._objector = None
         self._unique_counter = 0
 
+        if json_backend is None or isinstance(json_backend, str):
+            json_backend = named_json_backend(json_backend or "json")
+        self.json_backend = json_backend
+        """The :class:`.JSONBackend` decoding responses."""
+
+        self.request_observers = []
+        """A list of callables called with the :class:`.RequestMetrics` of
+        each request.
+
+        For example, to aggregate metrics for Prometheus, append a
+        :class:`.MetricsAggregator`.
+
+        """
+
+        self.request_scheduler = request_scheduler
+        """The :class:`.RequestScheduler` dispatching requests, or ``None``."""
+
+        self.response_cache = response_cache
+        """The :class:`.ResponseCache` used for GET requests, or ``None``."""
+
         try:
             config_section = site_name or os.getenv("praw_site") or "DEFAULT"
             self.config = Config(
@@ -206,6 +260,19 @@ class Reddit:
 
         """
 
+        self.firehose = models.Firehose(self)
+        """An instance of :class:`.Firehose`.
+
+        Provides the interface for ingesting all new comments or submissions
+        by their sequential IDs. For example:
+
+        .. code-block:: python
+
+           for comment in reddit.firehose.comments():
+               print(comment)
+
+        """
+
         self.front = models.Front(self)
         """An instance of :class:`.Front`.
 
@@ -272,6 +339,22 @@ class Reddit:
 
         """
 
+        self.streams = models.StreamHelper(self, None)
+        """An instance of :class:`.StreamHelper`.
+
+        Provides the interface for streaming new items from many listings in a
+        single loop. For example, to stream the new submissions of several
+        subreddits, run:
+
+        .. code-block:: python
+
+           functions = [reddit.subreddit(name).new
+                        for name in ('redditdev', 'test')]
+           for function, submission in reddit.streams.multiplex(functions):
+               print(submission.title)
+
+        """
+
         self.subreddit = models.SubredditHelper(self, None)
         """An instance of :class:`.SubredditHelper`.
 
@@ -324,6 +407,32 @@ class Reddit:
 
         """
 
+    def _batch_lazy(self, obj):
+        """Return ``obj`` after adding it to the active lazy batch, if any."""
+        if self._lazy_batch is not None:
+            self._lazy_batch.append(obj)
+        return obj
+
+    @staticmethod
+    def _cache_identity(core):
+        """Return the user the responses of ``core`` are cached for.
+
+        Returns ``""`` for sessions without a user, and ``None`` when the user
+        cannot be determined, in which case responses are not cached.
+
+        """
+        authorizer = core._authorizer
+        if isinstance(authorizer, (DeviceIDAuthorizer, ReadOnlyAuthorizer)):
+            return ""
+        if isinstance(authorizer, ScriptAuthorizer):
+            return "user:" + authorizer._username.lower()
+        token = getattr(authorizer, "refresh_token", None) or getattr(
+            authorizer, "access_token", None
+        )
+        if token is None:
+            return None
+        return "token:" + sha1(token.encode("utf-8")).hexdigest()
+
     def _check_for_update(self):
         if UPDATE_CHECKER_MISSING:
             return
@@ -331,6 +440,45 @@ class Reddit:
             update_check(__package__, __version__)
             Reddit.update_checked = True
 
+    def _hydrate_lazy_batch(self):
+        """Hydrate the objects collected by the active lazy batch."""
+        if self._lazy_batch:
+            pending, self._lazy_batch[:] = list(self._lazy_batch), []
+            self.hydrate(pending)
+
+    def _invalidate_cache(self, endpoint, **fields):
+        """Remove the cached responses of an ``API_PATH`` entry.
+
+        :param endpoint: The name of the ``API_PATH`` entry.
+
+        Additional keyword arguments are used to format the path.
+
+        """
+        if self.response_cache is not None:
+            self.response_cache.invalidate(API_PATH[endpoint].format(**fields))
+
+    def _notify(self, metrics):
+        """Pass ``metrics`` to each of the :attr:`.request_observers`."""
+        for observer in list(self.request_observers):
+            observer(metrics)
+
+    def _objectify_request(self, method, path, **kwargs):
+        """Return the objects built from the response to a request."""
+        if not self.request_observers:
+            return self._objector.objectify(
+                self.request(method, path, **kwargs)
+            )
+        metrics = RequestMetrics(method, path, endpoint_name(path))
+        try:
+            data = self._request(method, path, metrics=metrics, **kwargs)
+            start = time.perf_counter()
+            try:
+                return self._objector.objectify(data)
+            finally:
+                metrics.objectify = time.perf_counter() - start
+        finally:
+            self._notify(metrics)
+
     def _prepare_objector(self):
         mappings = {
             self.config.kinds["comment"]: models.Comment,
@@ -381,6 +529,8 @@ class Reddit:
             self.config.reddit_url,
             **requestor_kwargs
         )
+        if isinstance(requestor, Requestor):
+            requestor.json_backend = self.json_backend
 
         if self.config.client_secret:
             self._prepare_trusted_prawcore(requestor)
@@ -420,6 +570,113 @@ class Reddit:
         else:
             self._core = self._read_only_core
 
+    def _response_not_modified(self):
+        """Return whether the last response of this thread was a 304."""
+        requestor = self._core._requestor
+        return isinstance(requestor, Requestor) and requestor.not_modified
+
+    def _request(
+        self, method, path, params=None, data=None, files=None, metrics=None,
+    ):
+        """Issue a request, recording its phases in ``metrics`` if given."""
+        cacheable = (
+            self.response_cache is not None
+            and method == "GET"
+            and data is None
+            and files is None
+        )
+        core = self._request_core(method, path)
+        if cacheable:
+            identity = self._cache_identity(core)
+            cacheable = identity is not None
+        if cacheable:
+            cached = self.response_cache.get(path, params, identity)
+            if cached is not None:
+                if isinstance(core._requestor, Requestor):
+                    core._requestor.not_modified = False
+                if metrics is not None:
+                    metrics.cached = True
+                return cached
+        self._request_sent(core)
+        if metrics is not None:
+            self._start_metrics(core, metrics)
+        start = time.perf_counter()
+        try:
+            if self.request_scheduler is None:
+                response = core.request(
+                    method, path, data=data, files=files, params=params
+                )
+            else:
+                response = self._scheduled_request(
+                    core,
+                    method,
+                    path,
+                    data=data,
+                    files=files,
+                    metrics=metrics,
+                    params=params,
+                )
+        except Exception as exc:
+            if metrics is not None:
+                metrics.error = exc
+                response = getattr(exc, "response", None)
+                if response is not None:
+                    metrics.status = response.status_code
+            raise
+        finally:
+            if metrics is not None:
+                self._stop_metrics(core, metrics, start)
+        if cacheable:
+            self.response_cache.set(path, params, response, identity)
+        return response
+
+    def _request_core(self, method, path):
+        """Return the session used to issue a request."""
+        return self._core
+
+    def _request_sent(self, core):
+        """Handle a request sent by ``core``, i.e., not served from cache."""
+
+    def _scheduled_request(self, core, method, path, metrics=None, **kwargs):
+        """Issue a request once :attr:`.request_scheduler` permits it."""
+        start = time.perf_counter()
+        self.request_scheduler.acquire()
+        if metrics is not None:
+            metrics.queue = time.perf_counter() - start
+        try:
+            return core.request(method, path, **kwargs)
+        finally:
+            limiter = core._rate_limiter
+            self.request_scheduler.update(
+                remaining=limiter.remaining,
+                reset_timestamp=limiter.reset_timestamp,
+            )
+
+    @staticmethod
+    def _start_metrics(core, metrics):
+        next_request = core._rate_limiter.next_request_timestamp
+        if next_request is not None:
+            metrics.ratelimit = max(0.0, next_request - time.time())
+        if isinstance(core._requestor, Requestor):
+            core._requestor.metrics = metrics
+
+    @staticmethod
+    def _stop_metrics(core, metrics, start):
+        if isinstance(core._requestor, Requestor):
+            core._requestor.metrics = None
+        elapsed = time.perf_counter() - start - metrics.queue
+        metrics.decode = max(
+            0.0, elapsed - metrics.ratelimit - metrics.network
+        )
+        metrics.remaining = core._rate_limiter.remaining
+
+    def _upload(self, url, data, files):
+        """Return the response of uploading ``files`` to an upload lease."""
+        requestor = self._core._requestor
+        if isinstance(requestor, Requestor):
+            return requestor.upload(url, data, files)
+        return requestor._http.post(url, data=data, files=files)
+
     def comment(
         self,  # pylint: disable=invalid-name
         id: Optional[str] = None,  # pylint: disable=redefined-builtin
@@ -436,7 +693,28 @@ class Reddit:
                   :class:`.Comment`.
 
         """
-        return models.Comment(self, id=id, url=url)
+        return self._batch_lazy(models.Comment(self, id=id, url=url))
+
+    def delete(
+        self,
+        path: str,
+        data: Optional[
+            Union[Dict[str, Union[str, Any]], bytes, IO, str]
+        ] = None,
+        params: Optional[Union[str, Dict[str, str]]] = None,
+    ) -> Any:
+        """Return parsed objects returned from a DELETE request to ``path``.
+
+        :param path: The path to fetch.
+        :param data: Dictionary, bytes, or file-like object to send in the body
+            of the request (default: None).
+        :param params: The query parameters to add to the request (default:
+            None).
+
+        """
+        return self._objectify_request(
+            "DELETE", path, data=data, params=params
+        )
 
     def domain(self, domain: str):
         """Return an instance of :class:`.DomainListing`.
@@ -456,8 +734,81 @@ class Reddit:
             None).
 
         """
-        data = self.request("GET", path, params=params)
-        return self._objector.objectify(data)
+        return self._objectify_request("GET", path, params=params)
+
+    def get_raw(
+        self, path: str, params: Optional[Union[str, Dict[str, str]]] = None
+    ) -> Any:
+        """Return the decoded JSON returned from a GET request to ``path``.
+
+        :param path: The path to fetch.
+        :param params: The query parameters to add to the request (default:
+            None).
+
+        Unlike :meth:`.get`, no instances of :class:`.RedditBase` are created:
+        the lists and dicts returned by reddit are returned as they are.
+
+        """
+        return self.request("GET", path, params=params)
+
+    def hydrate(self, objects: Iterable[Any]) -> List[Any]:
+        """Fetch the attributes of many lazy objects in batched requests.
+
+        :param objects: An iterable of :class:`.Comment`,
+            :class:`.Submission`, and/or :class:`.Subreddit` instances. Objects
+            of other types, and objects that have already been fetched, are
+            ignored.
+        :returns: A list of the objects for which Reddit returned no data,
+            e.g., deleted submissions and banned subreddits. They remain lazy.
+
+        Comments and submissions are requested via :meth:`.info` by fullname,
+        and subreddits by name, in batches of 100. Hence:
+
+        .. code-block:: python
+
+           submissions = [reddit.submission(id) for id in ids]
+           reddit.hydrate(submissions)
+           for submission in submissions:
+               print(submission.title)
+
+        issues one request per 100 submissions rather than one request per
+        submission.
+
+        .. note:: As with :meth:`.info`, the replies of hydrated comments are
+                  not obtained. Hydrated submissions fetch their comments the
+                  first time :attr:`~.Submission.comments` is accessed.
+
+        """
+        by_fullname = {}
+        by_name = {}
+        for obj in objects:
+            if not isinstance(obj, (Comment, Submission, Subreddit)):
+                continue
+            if obj.__dict__.get("_fetched", True):
+                continue
+            if isinstance(obj, Subreddit):
+                key = obj.display_name.lower()
+                by_name.setdefault(key, []).append(obj)
+            else:
+                by_fullname.setdefault(obj.fullname, []).append(obj)
+
+        for parameter, pending in (("id", by_fullname), ("sr_name", by_name)):
+            keys = list(pending)
+            for start in range(0, len(keys), 100):
+                params = {parameter: ",".join(keys[start : start + 100])}
+                for result in self.get(API_PATH["info"], params=params):
+                    if parameter == "id":
+                        key = result.fullname
+                    else:
+                        key = result.display_name.lower()
+                    for obj in pending.pop(key, ()):
+                        obj._hydrate(result)
+        return [
+            obj
+            for pending in (by_fullname, by_name)
+            for objs in pending.values()
+            for obj in objs
+        ]
 
     def info(
         self,
@@ -517,6 +868,30 @@ class Reddit:
 
         return generator(url)
 
+    @contextmanager
+    def lazy_batch(self) -> Generator[None, None, None]:
+        """Return a context manager that hydrates lazy objects in batches.
+
+        Comments, submissions and subreddits created within the context via
+        :meth:`.comment`, :meth:`.submission` and :attr:`.subreddit` are
+        collected. The first time any lazy object needs to be fetched, all
+        collected objects are hydrated together via :meth:`.hydrate`:
+
+        .. code-block:: python
+
+           with reddit.lazy_batch():
+               subreddits = [reddit.subreddit(name) for name in names]
+               for subreddit in subreddits:
+                   print(subreddit.subscribers)
+
+        """
+        previous = self._lazy_batch
+        self._lazy_batch = []
+        try:
+            yield
+        finally:
+            self._lazy_batch = previous
+
     def patch(
         self,
         path: str,
@@ -531,8 +906,7 @@ class Reddit:
             of the request (default: None).
 
         """
-        data = self.request("PATCH", path, data=data)
-        return self._objector.objectify(data)
+        return self._objectify_request("PATCH", path, data=data)
 
     def post(
         self,
@@ -554,10 +928,32 @@ class Reddit:
             None).
 
         """
-        data = self.request(
+        return self._objectify_request(
             "POST", path, data=data or {}, files=files, params=params
         )
-        return self._objector.objectify(data)
+
+    @contextmanager
+    def priority(self, priority: str) -> Generator[None, None, None]:
+        """Return a context manager setting the priority of requests.
+
+        :param priority: The name of a priority of :attr:`.request_scheduler`,
+            e.g., ``interactive``, ``moderation`` or ``bulk``.
+
+        Requests issued by the current thread within the context are
+        dispatched with ``priority``. Without a :attr:`.request_scheduler`,
+        the priority has no effect.
+
+        .. code-block:: python
+
+           with reddit.priority('bulk'):
+               submission.comments.replace_more(limit=None)
+
+        """
+        if self.request_scheduler is None:
+            yield
+            return
+        with self.request_scheduler.priority(priority):
+            yield
 
     def put(
         self,
@@ -573,8 +969,7 @@ class Reddit:
             of the request (default: None).
 
         """
-        data = self.request("PUT", path, data=data)
-        return self._objector.objectify(data)
+        return self._objectify_request("PUT", path, data=data)
 
     def random_subreddit(self, nsfw: bool = False) -> Subreddit:
         """Return a random lazy instance of :class:`~.Subreddit`.
@@ -628,9 +1023,13 @@ class Reddit:
             (default: None).
 
         """
-        return self._core.request(
-            method, path, data=data, files=files, params=params
-        )
+        if not self.request_observers:
+            return self._request(method, path, params, data, files)
+        metrics = RequestMetrics(method, path, endpoint_name(path))
+        try:
+            return self._request(method, path, params, data, files, metrics)
+        finally:
+            self._notify(metrics)
 
     def submission(  # pylint: disable=invalid-name,redefined-builtin
         self, id: Optional[str] = None, url: Optional[str] = None
@@ -644,4 +1043,4 @@ class Reddit:
         Either ``id`` or ``url`` can be provided, but not both.
 
         """
-        return models.Submission(self, id=id, url=url)
+        return self._batch_lazy(models.Submission(self, id=id, url=url))
@@ -0,0 +1,271 @@
+"""Provide the Requestor class."""
+import copy
+import time
+from collections import OrderedDict
+from functools import partial
+from threading import Lock, local
+from typing import Any, Optional
+
+import prawcore
+import requests
+from prawcore.const import TIMEOUT
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+# The response headers holding validators, and the request headers that
+# send them back.
+_VALIDATORS = (
+    ("etag", "If-None-Match"),
+    ("last-modified", "If-Modified-Since"),
+)
+
+
+class Requestor(prawcore.Requestor):
+    """The requestor used by :class:`.Reddit` unless another is provided.
+
+    In addition to the behavior of ``prawcore.Requestor``, this requestor can
+    send conditional GET requests. When ``max_validators`` is set, it
+    remembers the ``ETag`` and ``Last-Modified`` validators and the decoded
+    body of successful GET responses, and sends the validators as
+    ``If-None-Match`` and ``If-Modified-Since`` headers when the same URL is
+    requested again. When reddit replies with ``304 Not Modified``, the
+    remembered body is returned in its place, and :attr:`.not_modified` is set
+    for the requesting thread. This mostly benefits the repeated fetches of
+    single objects, such as subreddits, wiki pages and widgets:
+
+    .. code-block:: python
+
+       reddit = praw.Reddit(..., requestor_kwargs={'max_validators': 256})
+
+    The requestor also sizes the connection pool of the session it creates,
+    and applies its timeout to both API requests and media uploads. For
+    example, to let 64 threads share one :class:`.Reddit` instance without
+    waiting for, or discarding, connections:
+
+    .. code-block:: python
+
+       reddit = praw.Reddit(..., requestor_kwargs={'pool_maxsize': 64,
+                                                   'timeout': 30})
+
+    Another transport can be used by passing a session compatible with
+    ``requests.Session`` as ``session``.
+
+    Responses are decoded by :attr:`.json_backend` when it is set.
+
+    """
+
+    @staticmethod
+    def _key(url, params, headers):
+        if isinstance(params, dict):
+            params = tuple(sorted(params.items()))
+        # Responses may depend on the authorized user.
+        return url, params, (headers or {}).get("Authorization")
+
+    @staticmethod
+    def _session(pool_block, pool_connections, pool_maxsize):
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_block=pool_block,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @staticmethod
+    def _stored_response(body, response):
+        """Return ``response``, a 304, as a 200 response holding ``body``.
+
+        The rate limit headers of the 304 response are preserved so that the
+        rate limiter remains accurate.
+
+        """
+        result = copy.copy(response)
+        result.headers = CaseInsensitiveDict(response.headers)
+        result.headers.pop("content-length", None)
+        result.json = lambda: copy.deepcopy(body)
+        result.status_code = 200
+        return result
+
+    def __getstate__(self):
+        """Return the state to pickle without thread state or validators."""
+        state = self.__dict__.copy()
+        for attribute in ("_local", "_validators", "_validators_lock"):
+            del state[attribute]
+        return state
+
+    def __init__(
+        self,
+        *args: Any,
+        max_validators: int = 0,
+        pool_block: bool = False,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        timeout: float = TIMEOUT,
+        **kwargs: Any
+    ):
+        """Initialize a Requestor instance.
+
+        :param max_validators: The maximum number of responses whose
+            validators and bodies are remembered, or ``0`` to disable
+            conditional requests (default: 0).
+        :param pool_block: Whether requests wait for a free connection when
+            ``pool_maxsize`` connections to a host are in use, rather than
+            opening a connection that is discarded afterwards (default:
+            False).
+        :param pool_connections: The number of hosts whose connections are
+            kept alive (default: 10).
+        :param pool_maxsize: The maximum number of connections kept alive per
+            host. Set it to at least the number of threads issuing requests
+            concurrently (default: 10).
+        :param timeout: The number of seconds to wait for the server before
+            giving up on a request or upload (default: the ``prawcore_timeout``
+            environment variable, or 16).
+
+        Additional arguments are passed to ``prawcore.Requestor``. The
+        ``pool_*`` parameters only apply when no ``session`` is provided.
+
+        """
+        if kwargs.get("session") is None:
+            kwargs["session"] = self._session(
+                pool_block, pool_connections, pool_maxsize
+            )
+        super().__init__(*args, **kwargs)
+        #: The :class:`.JSONBackend` decoding responses, or ``None`` to use
+        #: ``requests``. :class:`.Reddit` sets it to its
+        #: :attr:`~.Reddit.json_backend`.
+        self.json_backend = None
+        self.timeout = timeout
+        self._local = local()
+        self._validators = OrderedDict()
+        self._validators_lock = Lock()
+        self.max_validators = max_validators
+
+    def __setstate__(self, state):
+        """Restore the pickled state."""
+        self.__dict__.update(state)
+        self._local = local()
+        self._validators = OrderedDict()
+        self._validators_lock = Lock()
+
+    @property
+    def metrics(self) -> Optional[Any]:
+        """The :class:`.RequestMetrics` of the current thread, if any.
+
+        While set, the network time, attempts, response size and status of the
+        requests issued by the thread are added to it.
+
+        """
+        return getattr(self._local, "metrics", None)
+
+    @metrics.setter
+    def metrics(self, value: Optional[Any]):
+        """Set the :class:`.RequestMetrics` of the current thread."""
+        self._local.metrics = value
+
+    @property
+    def not_modified(self) -> bool:
+        """Whether the last response of the current thread was a 304."""
+        return getattr(self._local, "not_modified", False)
+
+    @not_modified.setter
+    def not_modified(self, value: bool):
+        """Set whether the last response of the current thread was a 304."""
+        self._local.not_modified = value
+
+    def _conditional_headers(self, key, headers):
+        with self._validators_lock:
+            stored = self._validators.get(key)
+            if stored is None:
+                return None
+            self._validators.move_to_end(key)
+        headers = dict(headers or {})
+        headers.update(stored[0])
+        return stored[1], headers
+
+    def _remember(self, key, response):
+        """Remember the validators and the decoded body of ``response``."""
+        validators = {
+            header: response.headers[name]
+            for name, header in _VALIDATORS
+            if name in response.headers
+        }
+        body = None
+        if validators:
+            try:
+                body = response.json()
+            except ValueError:
+                validators = None
+        if not validators:
+            with self._validators_lock:
+                self._validators.pop(key, None)
+            return
+        # The decoded body is modified while it is objectified.
+        stored = copy.deepcopy(body)
+        response.json = lambda: body
+        with self._validators_lock:
+            self._validators[key] = validators, stored
+            self._validators.move_to_end(key)
+            while len(self._validators) > self.max_validators:
+                self._validators.popitem(last=False)
+
+    def _send(self, *args, **kwargs):
+        metrics = self.metrics
+        # Newer versions of prawcore pass their own ``timeout``.
+        kwargs.setdefault("timeout", self.timeout)
+        start = time.perf_counter()
+        try:
+            response = self._http.request(*args, **kwargs)
+        except Exception as exc:
+            raise prawcore.RequestException(exc, args, kwargs)
+        finally:
+            if metrics is not None:
+                metrics.attempts += 1
+                metrics.network += time.perf_counter() - start
+        if metrics is not None:
+            metrics.response_bytes += len(response.content)
+            metrics.status = response.status_code
+        if self.json_backend is not None:
+            # prawcore decodes the body with ``response.json()``.
+            response.json = partial(self.json_backend.loads, response.content)
+        return response
+
+    def request(
+        self, method: str, url: str, *args: Any, **kwargs: Any
+    ) -> Optional[Any]:
+        """Issue the HTTP request capturing any errors that may occur.
+
+        GET requests are made conditional when a validator is known for their
+        URL and parameters.
+
+        """
+        self.not_modified = False
+        if method != "GET" or not self.max_validators:
+            return self._send(method, url, *args, **kwargs)
+
+        key = self._key(url, kwargs.get("params"), kwargs.get("headers"))
+        conditional = self._conditional_headers(key, kwargs.get("headers"))
+        if conditional is not None:
+            kwargs["headers"] = conditional[1]
+        response = self._send(method, url, *args, **kwargs)
+        if response.status_code == 304 and conditional is not None:
+            self.not_modified = True
+            return self._stored_response(conditional[0], response)
+        if response.status_code == 200:
+            self._remember(key, response)
+        return response
+
+    def upload(self, url: str, data: Any, files: Any) -> Any:
+        """Return the response of a POST request uploading ``files``.
+
+        :param url: The URL of the upload lease, e.g., on Amazon S3.
+        :param data: The fields of the upload lease.
+        :param files: A dictionary mapping field names to file objects.
+
+        Unlike :meth:`.request`, errors are not wrapped.
+
+        """
+        return self._http.post(
+            url, data=data, files=files, timeout=self.timeout
+        )
@@ -1,4 +1,17 @@
 """Package imports for utilities."""
 
-from .cache import cachedproperty  # noqa: F401
+from .cache import (  # noqa: F401
+    FileResponseCache,
+    ResponseCache,
+    cachedconversion,
+    cachedproperty,
+)
+from .checkpoint import (  # noqa: F401
+    Checkpoint,
+    FileCheckpoint,
+    SQLiteCheckpoint,
+)
+from .jsonbackend import JSONBackend, json_backend  # noqa: F401
+from .metrics import MetricsAggregator, RequestMetrics  # noqa: F401
+from .scheduler import RequestScheduler  # noqa: F401
 from .snake import camel_to_snake, snake_case_keys  # noqa: F401
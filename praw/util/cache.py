@@ -1,5 +1,16 @@
 """Caching utilities."""
-from typing import Any, Callable, Optional
+import json
+import os
+import shutil
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from hashlib import sha1
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Union
+from urllib.parse import urlencode
+
+from .endpoints import endpoint_name, normalize_path
 
 
 class cachedproperty:
@@ -44,3 +55,301 @@ class cachedproperty:
     def __repr__(self) -> str:
         """Return repr(self)."""
         return "<%s %s>" % (self.__class__.__name__, self.func)
+
+
+class cachedconversion:
+    """A data descriptor converting an attribute's value on first access.
+
+    Assigned values are stored unchanged in the object's instance dictionary
+    under ``name``. Values of type ``raw_type`` are passed to ``converter``
+    the first time they are accessed, and the result replaces the stored
+    value. Values of any other type are returned as they are.
+
+    This allows objects built from API responses to defer the construction of
+    related objects until they are needed.
+
+    """
+
+    def __init__(
+        self,
+        name: str,
+        converter: Callable[[Any, Any], Any],
+        raw_type: type = str,
+    ):
+        """Initialize the descriptor.
+
+        :param name: The name of the attribute the descriptor is assigned to.
+        :param converter: A callable accepting the object and the raw value,
+            and returning the converted value.
+        :param raw_type: The type of the values to convert (default: str).
+
+        """
+        self.converter = converter
+        self.name = name
+        self.raw_type = raw_type
+        self.__doc__ = None
+
+    def __get__(
+        self, obj: Optional[Any], objtype: Optional[Any] = None
+    ) -> Any:
+        """Implement descriptor getter.
+
+        Raise AttributeError when the value is not set so that
+        ``__getattr__`` is consulted.
+        """
+        if obj is None:
+            return self
+        try:
+            value = obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name)
+        if isinstance(value, self.raw_type):
+            value = obj.__dict__[self.name] = self.converter(obj, value)
+        return value
+
+    def __set__(self, obj: Any, value: Any):
+        """Implement descriptor setter."""
+        obj.__dict__[self.name] = value
+
+    def __delete__(self, obj: Any):
+        """Implement descriptor deleter."""
+        try:
+            del obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name)
+
+    def __repr__(self) -> str:
+        """Return repr(self)."""
+        return "<%s %s>" % (self.__class__.__name__, self.name)
+
+
+class ResponseCache:
+    """An in-memory cache of the data returned by GET requests.
+
+    Entries expire after the time-to-live configured for the endpoint they
+    were fetched from. Endpoints are identified by their name in
+    ``praw.endpoints.API_PATH``, and responses from endpoints without a
+    time-to-live are not cached. When the cache is full, the least recently
+    used entry is discarded.
+
+    Responses are cached per ``identity``: :class:`.Reddit` passes the user
+    it is authorized as, so that instances authorized as different users can
+    share a cache without reading each other's responses.
+
+    Mutating methods, such as :meth:`.SubredditEmoji.add`, invalidate the
+    cached responses of the resource they modify, for every identity.
+
+    .. code-block:: python
+
+       cache = ResponseCache(ttls={'rules': 3600, 'widgets': 600})
+       reddit = praw.Reddit(..., response_cache=cache)
+
+    """
+
+    DEFAULT_TTLS = {
+        "emoji_list": 300,
+        "me": 60,
+        "preferences": 60,
+        "rules": 300,
+        "subreddit_about": 60,
+        "widgets": 300,
+    }
+
+    @staticmethod
+    def _key(path, params, identity=""):
+        if isinstance(params, dict):
+            params = urlencode(sorted(params.items()))
+        return normalize_path(path).lower(), params or "", identity
+
+    def __init__(
+        self, ttls: Optional[Dict[str, float]] = None, max_entries: int = 1024,
+    ):
+        """Initialize a ResponseCache instance.
+
+        :param ttls: A dictionary mapping the names of endpoints in
+            ``praw.endpoints.API_PATH`` to the number of seconds their
+            responses are cached for (default: :attr:`.DEFAULT_TTLS`).
+        :param max_entries: The maximum number of responses to hold, or
+            ``None`` for no limit (default: 1024).
+
+        """
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self.max_entries = max_entries
+        self.ttls = dict(self.DEFAULT_TTLS if ttls is None else ttls)
+
+    def __len__(self) -> int:
+        """Return the number of cached responses, including expired ones."""
+        return len(self._entries)
+
+    def __setstate__(self, state):
+        """Restore the pickled state."""
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def _delete(self, key):
+        self._entries.pop(key, None)
+
+    def _invalidate(self, path):
+        for key in [key for key in self._entries if key[0] == path]:
+            del self._entries[key]
+
+    def _load(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        expires, data = entry
+        return expires, deepcopy(data)
+
+    def _store(self, key, expires, data):
+        self._entries[key] = (expires, deepcopy(data))
+        self._entries.move_to_end(key)
+        while (
+            self.max_entries is not None
+            and len(self._entries) > self.max_entries
+        ):
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def get(
+        self,
+        path: str,
+        params: Optional[Union[str, Dict[str, str]]] = None,
+        identity: str = "",
+    ) -> Any:
+        """Return a copy of the cached data for a request, or ``None``.
+
+        :param path: The path of the request.
+        :param params: The query parameters of the request (default: None).
+        :param identity: The user the request is issued as, or ``""`` for
+            requests without a user (default: "").
+
+        """
+        key = self._key(path, params, identity)
+        with self._lock:
+            entry = self._load(key)
+            if entry is None:
+                return None
+            expires, data = entry
+            if expires <= time.time():
+                self._delete(key)
+                return None
+        return data
+
+    def invalidate(self, path: str):
+        """Remove the cached responses for ``path`` with any parameters.
+
+        :param path: The path of the modified resource.
+
+        """
+        with self._lock:
+            self._invalidate(self._key(path, None)[0])
+
+    def set(
+        self,
+        path: str,
+        params: Optional[Union[str, Dict[str, str]]],
+        data: Any,
+        identity: str = "",
+    ) -> bool:
+        """Cache ``data`` if the endpoint of ``path`` has a time-to-live.
+
+        :param path: The path of the request.
+        :param params: The query parameters of the request.
+        :param data: The decoded JSON data returned by the request.
+        :param identity: The user the request was issued as, or ``""`` for
+            requests without a user (default: "").
+        :returns: Whether or not the data was cached.
+
+        """
+        ttl = self.ttls.get(endpoint_name(path))
+        if not ttl or data is None:
+            return False
+        with self._lock:
+            self._store(
+                self._key(path, params, identity), time.time() + ttl, data
+            )
+        return True
+
+
+class FileResponseCache(ResponseCache):
+    """A :class:`.ResponseCache` storing responses as JSON files.
+
+    Cached responses outlive the process, and can be shared by several
+    processes using the same ``directory``. Expired files are removed when
+    they are read, or by :meth:`.clear`.
+
+    """
+
+    @staticmethod
+    def _digest(value):
+        return sha1(value.encode("utf-8")).hexdigest()
+
+    def __init__(
+        self, directory: str, ttls: Optional[Dict[str, float]] = None
+    ):
+        """Initialize a FileResponseCache instance.
+
+        :param directory: The directory to store the responses in. It is
+            created if it does not exist.
+        :param ttls: See :class:`.ResponseCache`.
+
+        The number of cached responses is not limited.
+
+        """
+        super().__init__(ttls=ttls, max_entries=None)
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        """Return the number of cached responses, including expired ones."""
+        return sum(len(files) for _, _, files in os.walk(self.directory))
+
+    def _delete(self, key):
+        try:
+            os.remove(self._filename(key))
+        except FileNotFoundError:
+            pass
+
+    def _filename(self, key):
+        path, params, identity = key
+        return os.path.join(
+            self.directory,
+            self._digest(path),
+            self._digest("{}\n{}".format(identity, params)) + ".json",
+        )
+
+    def _invalidate(self, path):
+        shutil.rmtree(
+            os.path.join(self.directory, self._digest(path)),
+            ignore_errors=True,
+        )
+
+    def _load(self, key):
+        try:
+            with open(self._filename(key)) as fp:
+                entry = json.load(fp)
+        except (FileNotFoundError, ValueError):
+            return None
+        return entry["expires"], entry["data"]
+
+    def _store(self, key, expires, data):
+        filename = self._filename(key)
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        temporary = "{}.{}.tmp".format(filename, os.getpid())
+        with open(temporary, "w") as fp:
+            json.dump({"data": data, "expires": expires}, fp)
+        os.replace(temporary, filename)
+
+    def clear(self):
+        """Remove all cached responses."""
+        with self._lock:
+            for name in os.listdir(self.directory):
+                shutil.rmtree(
+                    os.path.join(self.directory, name), ignore_errors=True
+                )
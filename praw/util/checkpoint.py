@@ -0,0 +1,124 @@
+"""Provide stores for the state of streams."""
+import json
+import os
+import sqlite3
+from copy import deepcopy
+from typing import Any, Dict, Optional
+
+
+class Checkpoint:
+    """Store the state of a stream so that it can resume after a restart.
+
+    A checkpoint holds the state of a single stream. This class keeps the
+    state in memory; :class:`.FileCheckpoint` and :class:`.SQLiteCheckpoint`
+    persist it.
+
+    """
+
+    def __init__(self):
+        """Initialize a Checkpoint instance."""
+        self._state = None
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Return the stored state, or ``None`` when nothing is stored."""
+        return deepcopy(self._state)
+
+    def save(self, state: Dict[str, Any]):
+        """Replace the stored state with ``state``.
+
+        :param state: A JSON serializable dictionary.
+
+        """
+        self._state = deepcopy(state)
+
+
+class FileCheckpoint(Checkpoint):
+    """A :class:`.Checkpoint` storing the state of a stream in a JSON file.
+
+    The file is replaced atomically, so that it always contains a complete
+    state even when the process is interrupted while saving.
+
+    """
+
+    def __init__(self, path: str):
+        """Initialize a FileCheckpoint instance.
+
+        :param path: The path of the file to store the state in.
+
+        """
+        super().__init__()
+        self.path = path
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Return the stored state, or ``None`` when nothing is stored."""
+        try:
+            with open(self.path) as fp:
+                return json.load(fp)
+        except FileNotFoundError:
+            return None
+
+    def save(self, state: Dict[str, Any]):
+        """Replace the stored state with ``state``."""
+        temporary = "{}.{}.tmp".format(self.path, os.getpid())
+        with open(temporary, "w") as fp:
+            json.dump(state, fp)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(temporary, self.path)
+
+
+class SQLiteCheckpoint(Checkpoint):
+    """A :class:`.Checkpoint` storing the state of a stream in SQLite.
+
+    A single database can hold the checkpoints of many streams, each under
+    its own ``name``:
+
+    .. code-block:: python
+
+       from praw.util import SQLiteCheckpoint
+
+       for name in ('redditdev', 'test'):
+           checkpoint = SQLiteCheckpoint('streams.db', name)
+           ...
+
+    """
+
+    def __init__(self, path: str, name: str = "stream"):
+        """Initialize a SQLiteCheckpoint instance.
+
+        :param path: The path of the SQLite database. It is created if it does
+            not exist.
+        :param name: The name of the stream within the database (default:
+            "stream").
+
+        """
+        super().__init__()
+        self.name = name
+        self.path = path
+        self._execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints"
+            " (name TEXT PRIMARY KEY, state TEXT NOT NULL)"
+        )
+
+    def _execute(self, statement, parameters=()):
+        """Execute ``statement`` in a transaction and return the first row."""
+        connection = sqlite3.connect(self.path)
+        try:
+            with connection:
+                return connection.execute(statement, parameters).fetchone()
+        finally:
+            connection.close()
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Return the stored state, or ``None`` when nothing is stored."""
+        row = self._execute(
+            "SELECT state FROM checkpoints WHERE name = ?", (self.name,)
+        )
+        return None if row is None else json.loads(row[0])
+
+    def save(self, state: Dict[str, Any]):
+        """Replace the stored state with ``state``."""
+        self._execute(
+            "INSERT OR REPLACE INTO checkpoints VALUES (?, ?)",
+            (self.name, json.dumps(state)),
+        )
@@ -0,0 +1,61 @@
+"""Utilities for identifying API endpoints."""
+import re
+from functools import lru_cache
+from typing import Optional
+
+from ..endpoints import API_PATH
+
+# Placeholders whose values may contain slashes.
+_MULTI_SEGMENT_FIELDS = {"page"}
+_PLACEHOLDER = re.compile(r"{(\w+)}")
+
+
+def _compile(template):
+    pattern = []
+    position = 0
+    for match in _PLACEHOLDER.finditer(template):
+        pattern.append(re.escape(template[position : match.start()]))
+        if match.group(1) in _MULTI_SEGMENT_FIELDS:
+            pattern.append(".+")
+        else:
+            pattern.append("[^/]+")
+        position = match.end()
+    pattern.append(re.escape(template[position:]))
+    return re.compile("".join(pattern) + "$", re.IGNORECASE)
+
+
+def _literal_length(template):
+    return len(_PLACEHOLDER.sub("", template))
+
+
+# More specific templates, i.e., those with more literal characters, are
+# tried first so that, e.g., ``r/{subreddit}/about/rules`` is not reported as
+# ``r/{subreddit}/{special}``.
+_PATTERNS = tuple(
+    (name, _compile(template.strip("/")))
+    for name, template in sorted(
+        API_PATH.items(),
+        key=lambda item: (-_literal_length(item[1]), item[0]),
+    )
+)
+
+
+def normalize_path(path: str) -> str:
+    """Return ``path`` without its query string and surrounding slashes."""
+    return path.split("?", 1)[0].strip("/")
+
+
+@lru_cache(maxsize=4096)
+def endpoint_name(path: str) -> Optional[str]:
+    """Return the name of the ``API_PATH`` entry matching ``path``.
+
+    :param path: The path of a request, e.g., ``r/redditdev/about/rules``.
+    :returns: The matching key of :data:`praw.endpoints.API_PATH`, or ``None``
+        when no entry matches.
+
+    """
+    path = normalize_path(path)
+    for name, pattern in _PATTERNS:
+        if pattern.match(path):
+            return name
+    return None
@@ -0,0 +1,156 @@
+"""Provide interchangeable libraries to encode and decode JSON."""
+import json
+from typing import Any, Optional, Type, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+
+class JSONBackend:
+    """Encode and decode JSON with the ``json`` module of the standard library.
+
+    A backend is passed to :class:`.Reddit` as ``json_backend``. It decodes
+    the body of every API response, and encodes the JSON payloads PRAW sends,
+    e.g., of widgets. Subclasses wrap faster libraries; see
+    :func:`.json_backend` to select one by name.
+
+    """
+
+    #: The name of the backend.
+    name = "json"
+
+    def __repr__(self) -> str:
+        """Return an object initialization representation of the instance."""
+        return "{}()".format(self.__class__.__name__)
+
+    def dumps(self, data: Any, cls: Optional[Type[json.JSONEncoder]] = None):
+        """Return ``data`` encoded as a JSON string.
+
+        :param data: The object to encode.
+        :param cls: A subclass of ``json.JSONEncoder`` whose ``default``
+            method serializes objects not supported natively (default: None).
+
+        """
+        return json.dumps(data, cls=cls)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Return the object encoded in ``data``.
+
+        :param data: A JSON document encoded in UTF-8, or a string.
+
+        Raises ``ValueError`` when ``data`` is not valid JSON.
+
+        """
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        return json.loads(data)
+
+
+class OrjsonBackend(JSONBackend):
+    """Encode and decode JSON with the ``orjson`` package."""
+
+    name = "orjson"
+
+    def __init__(self):
+        """Initialize an OrjsonBackend instance."""
+        if orjson is None:
+            raise ImportError("The orjson package is not installed.")
+
+    def dumps(self, data: Any, cls: Optional[Type[json.JSONEncoder]] = None):
+        """Return ``data`` encoded as a JSON string.
+
+        :param data: The object to encode.
+        :param cls: A subclass of ``json.JSONEncoder`` whose ``default``
+            method serializes objects not supported natively (default: None).
+
+        """
+        default = None if cls is None else cls().default
+        return orjson.dumps(data, default=default).decode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Return the object encoded in ``data``.
+
+        :param data: A JSON document encoded in UTF-8, or a string.
+
+        Raises ``ValueError`` when ``data`` is not valid JSON.
+
+        """
+        return orjson.loads(data)
+
+
+class UjsonBackend(JSONBackend):
+    """Decode JSON with the ``ujson`` package.
+
+    ``ujson`` has no hook to serialize unsupported objects, hence payloads are
+    encoded with the standard library when ``cls`` is given.
+
+    """
+
+    name = "ujson"
+
+    def __init__(self):
+        """Initialize a UjsonBackend instance."""
+        if ujson is None:
+            raise ImportError("The ujson package is not installed.")
+
+    def dumps(self, data: Any, cls: Optional[Type[json.JSONEncoder]] = None):
+        """Return ``data`` encoded as a JSON string.
+
+        :param data: The object to encode.
+        :param cls: A subclass of ``json.JSONEncoder`` whose ``default``
+            method serializes objects not supported natively (default: None).
+
+        """
+        if cls is not None:
+            return super().dumps(data, cls=cls)
+        return ujson.dumps(data, ensure_ascii=False)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Return the object encoded in ``data``.
+
+        :param data: A JSON document encoded in UTF-8, or a string.
+
+        Raises ``ValueError`` when ``data`` is not valid JSON.
+
+        """
+        return ujson.loads(data)
+
+
+#: The backends available by name.
+JSON_BACKENDS = {
+    backend.name: backend
+    for backend in (OrjsonBackend, UjsonBackend, JSONBackend)
+}
+# The order in which ``auto`` tries the backends, fastest first.
+_PREFERENCE = ("orjson", "ujson", "json")
+
+
+def json_backend(name: str = "json") -> JSONBackend:
+    """Return a new instance of the JSON backend named ``name``.
+
+    :param name: One of the keys of :data:`.JSON_BACKENDS`, or ``auto`` to
+        select the fastest installed backend (default: ``json``).
+
+    Raises ``ImportError`` when the library of the backend is not installed,
+    and ``ValueError`` when ``name`` is unknown.
+
+    """
+    if name == "auto":
+        for candidate in _PREFERENCE:
+            try:
+                return JSON_BACKENDS[candidate]()
+            except ImportError:
+                continue
+    if name not in JSON_BACKENDS:
+        raise ValueError(
+            "Unknown JSON backend {!r}. Use one of: auto, {}.".format(
+                name, ", ".join(sorted(JSON_BACKENDS))
+            )
+        )
+    return JSON_BACKENDS[name]()
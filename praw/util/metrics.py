@@ -0,0 +1,218 @@
+"""Provide classes describing and aggregating the requests of PRAW."""
+from bisect import bisect_left
+from collections import defaultdict
+from threading import Lock
+from typing import Optional, Sequence
+
+#: The phases of a request, in the order they occur.
+PHASES = ("queue", "ratelimit", "network", "decode", "objectify")
+
+
+class RequestMetrics:
+    """Describe a single request issued via :meth:`.Reddit.request`.
+
+    All durations are in seconds:
+
+    * ``queue``: waiting for the :attr:`.Reddit.request_scheduler`.
+    * ``ratelimit``: sleeping to respect the rate limit, as estimated from the
+      rate limiter before the request.
+    * ``network``: sending the request and receiving the response, summed
+      over all attempts. Only measured with :class:`praw.requestor.Requestor`.
+    * ``decode``: the remainder of the time spent in prawcore, mostly
+      decoding JSON.
+    * ``objectify``: building PRAW objects from the response. Only measured
+      for :meth:`.Reddit.get`, :meth:`.Reddit.post` and the other methods
+      that return objects.
+
+    """
+
+    def __init__(self, method: str, path: str, endpoint: Optional[str]):
+        """Initialize a RequestMetrics instance.
+
+        :param method: The HTTP method.
+        :param path: The path of the request.
+        :param endpoint: The name of the ``API_PATH`` entry matching ``path``,
+            or ``None``.
+
+        """
+        #: The number of HTTP requests issued, including retries.
+        self.attempts = 0
+        #: Whether the response was served by :attr:`.Reddit.response_cache`.
+        self.cached = False
+        self.decode = 0.0
+        self.endpoint = endpoint
+        #: The exception raised by the request, or ``None``.
+        self.error = None
+        self.method = method
+        self.network = 0.0
+        self.objectify = 0.0
+        self.path = path
+        self.queue = 0.0
+        self.ratelimit = 0.0
+        #: The number of requests remaining in the rate limit window.
+        self.remaining = None
+        #: The total size of the response bodies in bytes.
+        self.response_bytes = 0
+        #: The HTTP status code of the last response, or ``None``.
+        self.status = None
+
+    def __repr__(self) -> str:
+        """Return an object initialization representation of the instance."""
+        return "{}({!r}, {!r}, status={!r}, total={:.3f})".format(
+            self.__class__.__name__,
+            self.method,
+            self.path,
+            self.status,
+            self.total,
+        )
+
+    @property
+    def total(self) -> float:
+        """Return the sum of the durations of all phases."""
+        return sum(getattr(self, phase) for phase in PHASES)
+
+
+class MetricsAggregator:
+    """Aggregate :class:`.RequestMetrics` for export to Prometheus.
+
+    An aggregator is an observer. Register it with a :class:`.Reddit`
+    instance, and serve the result of :meth:`.prometheus` from your metrics
+    endpoint:
+
+    .. code-block:: python
+
+       from praw.util import MetricsAggregator
+
+       aggregator = MetricsAggregator()
+       reddit.request_observers.append(aggregator)
+       ...
+       print(aggregator.prometheus())
+
+    Requests are labeled with their endpoint, i.e., the name of the matching
+    ``API_PATH`` entry, or ``other``.
+
+    """
+
+    #: The default upper bounds, in seconds, of the histogram buckets.
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+    def __getstate__(self):
+        """Return the state to pickle without the lock."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __init__(self, buckets: Optional[Sequence[float]] = None):
+        """Initialize a MetricsAggregator instance.
+
+        :param buckets: The upper bounds, in seconds, of the histogram buckets
+            (default: :attr:`.BUCKETS`).
+
+        """
+        self.buckets = tuple(sorted(buckets or self.BUCKETS))
+        self._bytes = defaultdict(int)
+        self._histograms = {}
+        self._lock = Lock()
+        self._remaining = None
+        self._requests = defaultdict(int)
+
+    def __call__(self, metrics: RequestMetrics):
+        """Record ``metrics``."""
+        endpoint = metrics.endpoint or "other"
+        if metrics.status is not None:
+            status = str(metrics.status)
+        elif metrics.cached:
+            status = "cached"
+        else:
+            status = "error"
+        with self._lock:
+            self._requests[(endpoint, metrics.method, status)] += 1
+            self._bytes[(endpoint, metrics.method)] += metrics.response_bytes
+            if metrics.remaining is not None:
+                self._remaining = metrics.remaining
+            for phase in PHASES + ("total",):
+                self._observe(
+                    (endpoint, metrics.method, phase), getattr(metrics, phase),
+                )
+
+    def __setstate__(self, state):
+        """Restore the pickled state."""
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def _observe(self, key, value):
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = [
+                [0] * (len(self.buckets) + 1),
+                0.0,
+            ]
+        histogram[0][bisect_left(self.buckets, value)] += 1
+        histogram[1] += value
+
+    def prometheus(self) -> str:
+        """Return the aggregated metrics in the Prometheus text format."""
+        lines = [
+            "# HELP praw_requests_total Requests by endpoint and status.",
+            "# TYPE praw_requests_total counter",
+        ]
+        with self._lock:
+            for (endpoint, method, status), value in sorted(
+                self._requests.items()
+            ):
+                lines.append(
+                    'praw_requests_total{{endpoint="{}",method="{}",'
+                    'status="{}"}} {}'.format(endpoint, method, status, value)
+                )
+            lines.extend(
+                [
+                    "# HELP praw_response_bytes_total Size of the response "
+                    "bodies.",
+                    "# TYPE praw_response_bytes_total counter",
+                ]
+            )
+            for (endpoint, method), value in sorted(self._bytes.items()):
+                lines.append(
+                    'praw_response_bytes_total{{endpoint="{}",method="{}"}} '
+                    "{}".format(endpoint, method, value)
+                )
+            lines.extend(
+                [
+                    "# HELP praw_request_duration_seconds Duration of each "
+                    "phase of the requests.",
+                    "# TYPE praw_request_duration_seconds histogram",
+                ]
+            )
+            for (endpoint, method, phase), (counts, total) in sorted(
+                self._histograms.items()
+            ):
+                labels = 'endpoint="{}",method="{}",phase="{}"'.format(
+                    endpoint, method, phase
+                )
+                cumulative = 0
+                for bound, count in zip(self.buckets + ("+Inf",), counts):
+                    cumulative += count
+                    lines.append(
+                        "praw_request_duration_seconds_bucket"
+                        '{{{},le="{}"}} {}'.format(labels, bound, cumulative)
+                    )
+                lines.append(
+                    "praw_request_duration_seconds_sum{{{}}} {}".format(
+                        labels, total
+                    )
+                )
+                lines.append(
+                    "praw_request_duration_seconds_count{{{}}} {}".format(
+                        labels, cumulative
+                    )
+                )
+            if self._remaining is not None:
+                lines.extend(
+                    [
+                        "# HELP praw_ratelimit_remaining Requests remaining "
+                        "in the rate limit window.",
+                        "# TYPE praw_ratelimit_remaining gauge",
+                        "praw_ratelimit_remaining {}".format(self._remaining),
+                    ]
+                )
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,184 @@
+"""Provide the RequestScheduler class."""
+import heapq
+import time
+from contextlib import contextmanager
+from itertools import count
+from threading import Condition, local
+from typing import Dict, Generator, Optional
+
+
+class RequestScheduler:
+    """Order the requests of many threads by priority under the rate limit.
+
+    Without a scheduler, every thread issuing a request sleeps on its own
+    until the rate limit permits a request, and the threads then proceed in
+    no particular order. With a scheduler, each request first waits for a
+    permit. Permits are issued from a token bucket that is refilled at the
+    rate permitted by the ``X-Ratelimit-*`` headers of the responses, and go
+    to the waiting request with the earliest deadline. Until the first
+    response is received, permits are issued without delay.
+
+    The deadline of a request is the time it started waiting plus the delay
+    of its priority. With the default priorities, an ``interactive`` request
+    is dispatched before ``moderation`` requests that have been waiting for
+    less than a second, and before ``bulk`` requests that have been waiting
+    for less than ten seconds. Within a priority, requests are dispatched in
+    the order they started waiting. Hence higher priorities are preferred,
+    yet no request waits indefinitely.
+
+    .. code-block:: python
+
+       from praw.util import RequestScheduler
+
+       reddit = praw.Reddit(..., request_scheduler=RequestScheduler())
+       with reddit.priority('bulk'):
+           submission.comments.replace_more(limit=None)
+
+    """
+
+    #: The delay, in seconds, of each priority.
+    PRIORITIES = {"bulk": 10, "interactive": 0, "moderation": 1}
+
+    def __getstate__(self):
+        """Return the state to pickle without synchronization primitives."""
+        state = self.__dict__.copy()
+        for attribute in ("_condition", "_local", "_sequence"):
+            del state[attribute]
+        state["_queue"] = []
+        return state
+
+    def __init__(
+        self,
+        priorities: Optional[Dict[str, float]] = None,
+        default_priority: str = "interactive",
+        burst: int = 1,
+    ):
+        """Initialize a RequestScheduler instance.
+
+        :param priorities: A dictionary mapping the name of each priority to
+            its delay in seconds (default: :attr:`.PRIORITIES`).
+        :param default_priority: The priority of requests issued outside of
+            :meth:`.priority` (default: interactive).
+        :param burst: The number of permits that can accumulate while no
+            requests are made (default: 1).
+
+        """
+        self.burst = burst
+        self.default_priority = default_priority
+        self.priorities = dict(priorities or self.PRIORITIES)
+        self._condition = Condition()
+        self._local = local()
+        self._queue = []
+        self._rate = None
+        self._refilled = time.time()
+        self._sequence = count()
+        self._tokens = float(burst)
+        if default_priority not in self.priorities:
+            raise ValueError("Unknown priority: {!r}".format(default_priority))
+
+    def __setstate__(self, state):
+        """Restore the pickled state."""
+        self.__dict__.update(state)
+        self._condition = Condition()
+        self._local = local()
+        self._sequence = count()
+
+    @property
+    def current_priority(self) -> str:
+        """Return the priority of requests issued by the current thread."""
+        return getattr(self._local, "priority", self.default_priority)
+
+    def _refill(self, now):
+        if self._rate is not None:
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._refilled) * self._rate
+            )
+        self._refilled = now
+
+    def _seconds_until_token(self, now):
+        self._refill(now)
+        if self._rate is None or self._tokens >= 1:
+            return 0
+        return (1 - self._tokens) / self._rate
+
+    def acquire(self, priority: Optional[str] = None):
+        """Wait for a permit to issue a request.
+
+        :param priority: The priority of the request (default: the
+            :attr:`.current_priority`).
+
+        """
+        priority = priority or self.current_priority
+        entry = (
+            time.time() + self.priorities[priority],
+            next(self._sequence),
+        )
+        with self._condition:
+            heapq.heappush(self._queue, entry)
+            try:
+                while True:
+                    if self._queue[0] is entry:
+                        wait = self._seconds_until_token(time.time())
+                        if wait <= 0:
+                            break
+                        self._condition.wait(wait)
+                    else:
+                        self._condition.wait()
+            except BaseException:
+                self._queue.remove(entry)
+                heapq.heapify(self._queue)
+                self._condition.notify_all()
+                raise
+            heapq.heappop(self._queue)
+            if self._rate is not None:
+                self._tokens -= 1
+            self._condition.notify_all()
+
+    @contextmanager
+    def priority(self, priority: str) -> Generator[None, None, None]:
+        """Return a context manager setting the priority of the thread.
+
+        :param priority: The name of a priority, e.g., ``bulk``.
+
+        Requests issued by the current thread within the context use
+        ``priority``.
+
+        """
+        if priority not in self.priorities:
+            raise ValueError("Unknown priority: {!r}".format(priority))
+        previous = self.current_priority
+        self._local.priority = priority
+        try:
+            yield
+        finally:
+            self._local.priority = previous
+
+    def update(
+        self,
+        remaining: Optional[float] = None,
+        reset_timestamp: Optional[float] = None,
+        **_other_limits
+    ):
+        """Update the refill rate from the current rate limit.
+
+        :param remaining: The number of requests remaining in the current
+            rate limit window, or ``None`` when unknown.
+        :param reset_timestamp: The unix timestamp at which the window ends.
+
+        The keyword arguments correspond to :attr:`.Auth.limits`.
+
+        """
+        if remaining is None or reset_timestamp is None:
+            return
+        with self._condition:
+            now = time.time()
+            self._refill(now)
+            seconds = max(reset_timestamp - now, 1)
+            if remaining <= 0:
+                # Issue the next permit when the window ends.
+                self._tokens = min(self._tokens, 0)
+                self._rate = 1 / seconds
+            else:
+                self._tokens = min(self._tokens, remaining)
+                self._rate = remaining / seconds
+            self._condition.notify_all()
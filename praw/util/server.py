@@ -0,0 +1,1050 @@
+"""Provide a local stand-in for the Reddit API for load and soak testing."""
+import json
+import logging
+import random
+import threading
+import time
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+log = logging.getLogger(__name__)
+
+_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+#: The seconds since the epoch at which the synthetic dataset begins.
+EPOCH = 1577836800
+
+
+def _base36(number):
+    digits = []
+    while True:
+        number, remainder = divmod(number, 36)
+        digits.append(_DIGITS[remainder])
+        if not number:
+            return "".join(reversed(digits))
+
+
+def _isoformat(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+def _listing(children, after=None, before=None):
+    return {
+        "kind": "Listing",
+        "data": {
+            "after": after,
+            "before": before,
+            "children": children,
+            "dist": len(children),
+        },
+    }
+
+
+class _Listing:
+    """Hold the names of a listing, oldest first."""
+
+    def __init__(self):
+        self.names = []
+        self.positions = {}
+
+    def append(self, name):
+        self.positions[name] = len(self.names)
+        self.names.append(name)
+
+    def page(self, after, before, limit):
+        """Return a page of names, newest first, and its neighbors."""
+        count = len(self.names)
+        if after:
+            if after not in self.positions:
+                return [], None, None
+            start = count - self.positions[after]
+            end = min(count, start + limit)
+        elif before:
+            if before not in self.positions:
+                return [], None, None
+            end = count - 1 - self.positions[before]
+            start = max(0, end - limit)
+        else:
+            start, end = 0, min(count, limit)
+        names = [self.names[count - 1 - index] for index in range(start, end)]
+        if not names:
+            return names, None, None
+        return (
+            names,
+            names[-1] if end < count else None,
+            names[0] if start > 0 else None,
+        )
+
+
+class SyntheticDataset:
+    """A generated set of subreddits, users, submissions and comments.
+
+    The dataset is deterministic for a given ``seed``. Submissions and
+    comments are assigned to random subreddits, authors and parents, and are
+    created one second apart, starting at :data:`.EPOCH`. Items created via
+    :meth:`.add_submission` and :meth:`.add_comment`, or by requests to
+    :class:`.RedditServer`, are newer than all generated items.
+
+    """
+
+    def __init__(
+        self,
+        subreddits: int = 5,
+        users: int = 100,
+        submissions: int = 1000,
+        comments: int = 20000,
+        conversations: int = 100,
+        seed: int = 0,
+    ):
+        """Initialize a SyntheticDataset instance.
+
+        :param subreddits: The number of subreddits, named ``subreddit0``,
+            ``subreddit1``, etc. (default: 5).
+        :param users: The number of users, named ``user0``, ``user1``, etc.
+            ``user0`` is the authenticated user and moderates every subreddit
+            (default: 100).
+        :param submissions: The number of submissions (default: 1000).
+        :param comments: The number of comments (default: 20000).
+        :param conversations: The number of modmail conversations, each with
+            three messages (default: 100).
+        :param seed: The seed of the random number generator (default: 0).
+
+        """
+        self._children = {}
+        self._conversations = {}
+        self._conversation_listing = _Listing()
+        self._counter = 36 ** 5
+        self._listings = {}
+        self._lock = threading.Lock()
+        self._messages = {}
+        self._names = {}
+        self._random = random.Random(seed)
+        self._things = {}
+        self.subreddits = [
+            self._add_subreddit("subreddit{}".format(number))
+            for number in range(subreddits)
+        ]
+        self.users = [
+            self._add_user("user{}".format(number)) for number in range(users)
+        ]
+        for _ in range(submissions):
+            self.add_submission(
+                self._random.choice(self.subreddits),
+                "Synthetic submission",
+                author=self._random.choice(self.users),
+            )
+        submission_names = self.listing("r/all").names
+        for _ in range(comments if submission_names else 0):
+            submission = self._random.choice(submission_names)
+            parents = self._children.get(submission, [])
+            if parents and self._random.random() < 0.7:
+                parent = self._random.choice(
+                    self.listing(submission + "/comments").names
+                )
+            else:
+                parent = submission
+            self.add_comment(
+                parent, "Synthetic comment", self._random.choice(self.users)
+            )
+        for _ in range(conversations):
+            self._add_conversation(
+                self._random.choice(self.subreddits),
+                self._random.choice(self.users[1:] or self.users),
+            )
+
+    def _add_conversation(self, subreddit, user):
+        conversation_id = _base36(len(self._conversations) + 36 ** 3)
+        participant = self._modmail_author(user, is_mod=False)
+        moderator = self._modmail_author(self.users[0], is_mod=True)
+        conversation = {
+            "authors": [participant, moderator],
+            "id": conversation_id,
+            "isAuto": False,
+            "isHighlighted": False,
+            "isInternal": False,
+            "isRepliable": True,
+            "lastModUpdate": None,
+            "lastUnread": None,
+            "lastUpdated": None,
+            "lastUserUpdate": None,
+            "numMessages": 0,
+            "objIds": [],
+            "owner": {
+                "displayName": self._things[subreddit]["display_name"],
+                "id": subreddit,
+                "type": "subreddit",
+            },
+            "participant": participant,
+            "state": 1,
+            "subject": "Synthetic conversation",
+        }
+        self._conversations[conversation_id] = conversation
+        self._conversation_listing.append(conversation_id)
+        for author in (user, self.users[0], user):
+            self.add_message(conversation_id, "Synthetic message", author)
+        return conversation_id
+
+    def _add_subreddit(self, display_name):
+        name = "t5_" + self._next_id()
+        self._things[name] = {
+            "created_utc": EPOCH,
+            "display_name": display_name,
+            "id": name[3:],
+            "name": name,
+            "over18": False,
+            "public_description": "A synthetic subreddit.",
+            "subreddit_type": "public",
+            "subscribers": 1000,
+            "title": display_name,
+            "url": "/r/{}/".format(display_name),
+        }
+        self._names["r/" + display_name.lower()] = name
+        return name
+
+    def _add_user(self, user_name):
+        name = "t2_" + self._next_id()
+        self._things[name] = {
+            "comment_karma": 0,
+            "created_utc": EPOCH,
+            "id": name[3:],
+            "is_employee": False,
+            "is_mod": True,
+            "link_karma": 0,
+            "name": user_name,
+        }
+        self._names["user/" + user_name.lower()] = name
+        return name
+
+    def _modmail_author(self, user, is_mod):
+        return {
+            "id": int(user[3:], 36),
+            "isAdmin": False,
+            "isDeleted": False,
+            "isHidden": False,
+            "isMod": is_mod,
+            "isOp": not is_mod,
+            "isParticipant": not is_mod,
+            "name": self._things[user]["name"],
+        }
+
+    def _next_id(self):
+        self._counter += 1
+        return _base36(self._counter)
+
+    def _now(self):
+        return EPOCH + self._counter - 36 ** 5
+
+    def add_comment(self, parent: str, body: str, author: str) -> str:
+        """Add a comment and return its fullname.
+
+        :param parent: The fullname of the submission or comment replied to.
+        :param body: The body of the comment.
+        :param author: The fullname of the author.
+
+        Raises ``KeyError`` when ``parent`` or ``author`` does not exist.
+
+        """
+        with self._lock:
+            parent_data = self._things[parent]
+            submission = parent_data.get("link_id", parent)
+            subreddit = self._things[submission]["subreddit_id"]
+            display_name = self._things[subreddit]["display_name"]
+            user_name = self._things[author]["name"]
+            name = "t1_" + self._next_id()
+            self._things[name] = {
+                "author": user_name,
+                "author_fullname": author,
+                "body": body,
+                "body_html": '<div class="md"><p>{}</p>\n</div>'.format(body),
+                "created_utc": self._now(),
+                "depth": parent_data.get("depth", -1) + 1,
+                "id": name[3:],
+                "link_id": submission,
+                "name": name,
+                "parent_id": parent,
+                "permalink": "{}{}/".format(
+                    self._things[submission]["permalink"], name[3:]
+                ),
+                "replies": "",
+                "score": self._random.randint(0, 100),
+                "subreddit": display_name,
+                "subreddit_id": subreddit,
+            }
+            self._children.setdefault(parent, []).append(name)
+            self._things[submission]["num_comments"] += 1
+            for key in (
+                "r/all/comments",
+                "r/{}/comments".format(display_name),
+                "user/{}/comments".format(user_name),
+                submission + "/comments",
+            ):
+                self.listing(key).append(name)
+            return name
+
+    def add_message(self, conversation_id: str, body: str, author: str) -> str:
+        """Add a message to a modmail conversation and return its ID.
+
+        :param conversation_id: The ID of the conversation.
+        :param body: The body of the message.
+        :param author: The fullname of the author. Only the authenticated user
+            replies as a moderator.
+
+        Raises ``KeyError`` when the conversation or ``author`` does not
+        exist.
+
+        """
+        author = self._modmail_author(author, is_mod=author == self.users[0])
+        with self._lock:
+            conversation = self._conversations[conversation_id]
+            message_id = _base36(len(self._messages) + 36 ** 3)
+            date = _isoformat(self._now())
+            self._counter += 1
+            self._messages[message_id] = {
+                "author": author,
+                "body": '<div class="md"><p>{}</p>\n</div>'.format(body),
+                "bodyMarkdown": body,
+                "date": date,
+                "id": message_id,
+                "isInternal": False,
+            }
+            reference = {"id": message_id, "key": "messages"}
+            conversation["objIds"].append(reference)
+            conversation["numMessages"] += 1
+            conversation["lastUpdated"] = date
+            if author["isMod"]:
+                conversation["lastModUpdate"] = date
+            else:
+                conversation["lastUserUpdate"] = date
+            return message_id
+
+    def add_submission(
+        self, subreddit: str, title: str, author: Optional[str] = None
+    ) -> str:
+        """Add a self post and return its fullname.
+
+        :param subreddit: The fullname of the subreddit.
+        :param title: The title of the submission.
+        :param author: The fullname of the author (default: the authenticated
+            user).
+
+        """
+        author = author or self.users[0]
+        with self._lock:
+            name = "t3_" + self._next_id()
+            display_name = self._things[subreddit]["display_name"]
+            permalink = "/r/{}/comments/{}/synthetic/".format(
+                display_name, name[3:]
+            )
+            self._things[name] = {
+                "author": self._things[author]["name"],
+                "author_fullname": author,
+                "created_utc": self._now(),
+                "id": name[3:],
+                "is_self": True,
+                "name": name,
+                "num_comments": 0,
+                "over_18": False,
+                "permalink": permalink,
+                "score": self._random.randint(0, 1000),
+                "selftext": "",
+                "subreddit": display_name,
+                "subreddit_id": subreddit,
+                "title": title,
+                "url": "https://www.reddit.com" + permalink,
+            }
+            for key in (
+                "r/all",
+                "r/" + display_name,
+                "user/{}/submitted".format(self._things[author]["name"]),
+            ):
+                self.listing(key).append(name)
+            return name
+
+    def children(self, name: str) -> List[str]:
+        """Return the fullnames of the direct replies to ``name``."""
+        return self._children.get(name, [])
+
+    def conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        """Return the conversation with ``conversation_id``, or ``None``."""
+        return self._conversations.get(conversation_id)
+
+    def conversations(self, after: Optional[str], limit: int) -> List[str]:
+        """Return the IDs of a page of conversations, newest first."""
+        return self._conversation_listing.page(after, None, limit)[0]
+
+    def listing(self, key: str) -> _Listing:
+        """Return the listing with ``key``, creating it when necessary.
+
+        Listings are keyed by ``r/all``, ``r/{subreddit}``,
+        ``r/{subreddit}/comments``, ``user/{user}/submitted``,
+        ``user/{user}/comments`` and ``{submission fullname}/comments``.
+
+        """
+        listing = self._listings.get(key.lower())
+        if listing is None:
+            listing = self._listings[key.lower()] = _Listing()
+        return listing
+
+    def message(self, message_id: str) -> Dict[str, Any]:
+        """Return the modmail message with ``message_id``."""
+        return self._messages[message_id]
+
+    def subreddit(self, display_name: str) -> Optional[str]:
+        """Return the fullname of the subreddit named ``display_name``."""
+        return self._names.get("r/" + display_name.lower())
+
+    def thing(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return the data of the item with fullname ``name``, or ``None``."""
+        return self._things.get(name)
+
+    def user(self, user_name: str) -> Optional[str]:
+        """Return the fullname of the user named ``user_name``, or ``None``."""
+        return self._names.get("user/" + user_name.lower())
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Dispatch each request to a method of :class:`.RedditServer`."""
+
+    disable_nagle_algorithm = True
+    protocol_version = "HTTP/1.1"
+
+    def _handle(self, method):
+        url = urlsplit(self.path)
+        params = {
+            key: values[-1] for key, values in parse_qs(url.query).items()
+        }
+        data = {}
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            body = self.rfile.read(length).decode("utf-8")
+            data = {key: values[-1] for key, values in parse_qs(body).items()}
+        status, headers, body = self.server.reddit_server.respond(
+            method, url.path.strip("/"), params, data
+        )
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_DELETE(self):  # noqa: N802
+        """Handle a DELETE request."""
+        self._handle("DELETE")
+
+    def do_GET(self):  # noqa: N802
+        """Handle a GET request."""
+        self._handle("GET")
+
+    def do_PATCH(self):  # noqa: N802
+        """Handle a PATCH request."""
+        self._handle("PATCH")
+
+    def do_POST(self):  # noqa: N802
+        """Handle a POST request."""
+        self._handle("POST")
+
+    def do_PUT(self):  # noqa: N802
+        """Handle a PUT request."""
+        self._handle("PUT")
+
+    def log_message(self, *_args):
+        """Do not log requests."""
+
+
+class _HTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class RedditServer:
+    """A local HTTP server standing in for the Reddit API.
+
+    The server serves a :class:`.SyntheticDataset` to a :class:`.Reddit`
+    instance whose ``oauth_url`` and ``reddit_url`` point to it, so that bots
+    can be load tested without issuing requests to Reddit:
+
+    .. code-block:: python
+
+       import praw
+       from praw.util.server import RedditServer
+
+       with RedditServer(latency=0.05) as server:
+           reddit = praw.Reddit(
+               client_id='CLIENT_ID',
+               client_secret='CLIENT_SECRET',
+               oauth_url=server.url,
+               reddit_url=server.url,
+               user_agent='USERAGENT',
+               password='PASSWORD',
+               username='user0',
+           )
+           for submission in reddit.subreddit('subreddit0').new(limit=None):
+               print(submission.title)
+
+    Any credentials are accepted, and every user is authenticated as
+    ``user0``. The following endpoints are served:
+
+    * The listings of subreddits, including ``r/all`` and the front page, and
+      of users, paginated with ``after``, ``before`` and ``limit``. All sorts
+      are served newest first.
+    * ``api/info``, and the about pages of subreddits and users.
+    * Submissions with their comments, ``api/morechildren``, and continued
+      threads.
+    * ``api/submit`` and ``api/comment``, which add to the dataset.
+    * Modmail conversations, including replies.
+
+    Other GET requests result in a 404 response, and other requests in an
+    empty successful response.
+
+    Every response carries the rate limit headers of Reddit, and requests
+    beyond ``ratelimit_requests`` in a window receive a 429 response. PRAW
+    spaces its requests according to these headers. Pass
+    ``ratelimit_requests=None`` to omit them, so that PRAW issues requests as
+    fast as the server responds.
+
+    The server handles each connection in a thread of the current process.
+    Run it in a separate process, e.g., ``python -m praw.util.server``, when
+    the client would otherwise compete with it for the GIL.
+
+    """
+
+    # Each route maps a method and a path pattern to the name of the method
+    # handling it. Routes are evaluated in order.
+    _ROUTES = (
+        ("GET", ("api", "info"), "_info"),
+        ("GET", ("api", "mod", "conversations"), "_conversations"),
+        ("GET", ("api", "mod", "conversations", None), "_conversation"),
+        ("GET", ("api", "v1", "me"), "_me"),
+        ("GET", ("comments", None), "_submission"),
+        ("GET", ("comments", None, None), "_submission"),
+        ("GET", ("comments", None, None, None), "_submission"),
+        ("GET", ("r", None), "_subreddit_listing"),
+        ("GET", ("r", None, "about"), "_subreddit_about"),
+        ("GET", ("r", None, "comments"), "_subreddit_comments"),
+        ("GET", ("r", None, None), "_subreddit_listing"),
+        ("GET", ("user", None, "about"), "_user_about"),
+        ("GET", ("user", None, None), "_user_listing"),
+        ("GET", (None,), "_front_page"),
+        ("POST", ("api", "comment"), "_comment"),
+        ("POST", ("api", "morechildren"), "_morechildren"),
+        ("POST", ("api", "mod", "conversations", None), "_reply"),
+        ("POST", ("api", "submit"), "_submit"),
+        ("POST", ("api", "v1", "access_token"), "_access_token"),
+    )
+
+    #: The number of comments included when fetching a submission.
+    COMMENT_LIMIT = 200
+
+    def __enter__(self):
+        """Start the server and return it."""
+        self.start()
+        return self
+
+    def __exit__(self, *_args):
+        """Stop the server."""
+        self.stop()
+
+    def __init__(
+        self,
+        dataset: Optional[SyntheticDataset] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 429,
+        ratelimit_requests: Optional[int] = 600,
+        ratelimit_window: int = 600,
+        seed: int = 0,
+    ):
+        """Initialize a RedditServer instance.
+
+        :param dataset: The :class:`.SyntheticDataset` to serve (default: a
+            dataset with the default parameters).
+        :param host: The address to listen on (default: ``127.0.0.1``).
+        :param port: The port to listen on. ``0`` selects a free port
+            (default: 0).
+        :param latency: The seconds to wait before each response (default: 0).
+        :param error_rate: The fraction of requests answered with
+            ``error_status`` (default: 0).
+        :param error_status: The status code of injected errors (default:
+            429).
+        :param ratelimit_requests: The requests allowed per window, or
+            ``None`` for no rate limit (default: 600).
+        :param ratelimit_window: The length of a rate limit window in seconds
+            (default: 600).
+        :param seed: The seed of the random number generator choosing the
+            requests that fail (default: 0).
+
+        """
+        self.dataset = dataset or SyntheticDataset()
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.latency = latency
+        self.ratelimit_requests = ratelimit_requests
+        self.ratelimit_window = ratelimit_window
+        #: The number of requests received.
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._thread = None
+        self._used = 0
+        self._window = None
+        self._routes = {}
+        for method, pattern, name in self._ROUTES:
+            self._routes.setdefault((method, len(pattern)), []).append(
+                (pattern, getattr(self, name))
+            )
+        self._server = _HTTPServer((host, port), _Handler)
+        self._server.reddit_server = self
+
+    def _access_token(self, _params, _data):
+        return (
+            200,
+            {
+                "access_token": "synthetic_access_token",
+                "expires_in": 3600,
+                "scope": "*",
+                "token_type": "bearer",
+            },
+        )
+
+    def _comment(self, _params, data):
+        parent = data.get("thing_id", "")
+        if not parent.startswith(("t1_", "t3_")) or not self.dataset.thing(
+            parent
+        ):
+            return (
+                200,
+                {
+                    "json": {
+                        "errors": [
+                            [
+                                "NO_THING_ID",
+                                "can't find that thing",
+                                "thing_id",
+                            ]
+                        ]
+                    }
+                },
+            )
+        name = self.dataset.add_comment(
+            parent, data.get("text", ""), self.dataset.users[0]
+        )
+        thing = {"kind": "t1", "data": self.dataset.thing(name)}
+        return 200, {"json": {"data": {"things": [thing]}, "errors": []}}
+
+    def _comment_tree(self, names, budget, parent):
+        """Return the comments ``names`` and their replies as a tree."""
+        result = []
+        for index, name in enumerate(names):
+            if budget[0] <= 0:
+                result.append(self._more(parent, names[index:]))
+                break
+            budget[0] -= 1
+            data = dict(self.dataset.thing(name))
+            replies = self._comment_tree(
+                self.dataset.children(name), budget, name
+            )
+            if replies:
+                data["replies"] = _listing(replies)
+            result.append({"kind": "t1", "data": data})
+        return result
+
+    def _conversation(self, _params, _data, conversation_id):
+        conversation = self.dataset.conversation(conversation_id)
+        if conversation is None:
+            return self._not_found()
+        participant = conversation["participant"]
+        user = self.dataset.thing(self.dataset.user(participant["name"]))
+        return (
+            200,
+            {
+                "conversation": conversation,
+                "messages": {
+                    item["id"]: self.dataset.message(item["id"])
+                    for item in conversation["objIds"]
+                },
+                "modActions": {},
+                "user": {
+                    "banStatus": {
+                        "endDate": None,
+                        "isBanned": False,
+                        "isPermanent": False,
+                        "reason": "",
+                    },
+                    "created": _isoformat(user["created_utc"]),
+                    "id": "t2_" + user["id"],
+                    "isShadowBanned": False,
+                    "muteStatus": {
+                        "endDate": None,
+                        "isMuted": False,
+                        "muteCount": 0,
+                        "reason": "",
+                    },
+                    "name": user["name"],
+                    "recentComments": {},
+                    "recentConvos": {},
+                    "recentPosts": {},
+                },
+            },
+        )
+
+    def _conversations(self, params, _data):
+        limit = min(int(params.get("limit", 100)), 100)
+        conversation_ids = self.dataset.conversations(
+            params.get("after"), limit
+        )
+        conversations = {}
+        messages = {}
+        for conversation_id in conversation_ids:
+            conversation = self.dataset.conversation(conversation_id)
+            conversations[conversation_id] = conversation
+            message_id = conversation["objIds"][-1]["id"]
+            messages[message_id] = self.dataset.message(message_id)
+        return (
+            200,
+            {
+                "conversationIds": conversation_ids,
+                "conversations": conversations,
+                "messages": messages,
+                "viewerId": self.dataset.users[0],
+            },
+        )
+
+    def _flat_comments(self, names, budget, result):
+        """Append the comments ``names`` and their replies to ``result``."""
+        for index, name in enumerate(names):
+            if budget[0] <= 0:
+                parent = self.dataset.thing(name)["parent_id"]
+                result.append(self._more(parent, names[index:]))
+                return
+            budget[0] -= 1
+            result.append({"kind": "t1", "data": self.dataset.thing(name)})
+            self._flat_comments(self.dataset.children(name), budget, result)
+
+    def _front_page(self, params, _data, _sort):
+        return self._listing_response("r/all", params)
+
+    def _info(self, params, _data):
+        names = params.get("id", "").split(",")
+        names += [
+            self.dataset.subreddit(display_name)
+            for display_name in params.get("sr_name", "").split(",")
+        ]
+        children = []
+        for name in names:
+            data = self.dataset.thing(name) if name else None
+            if data is not None:
+                children.append({"kind": name[:2], "data": data})
+        return 200, _listing(children)
+
+    def _listing_response(self, key, params):
+        limit = min(int(params.get("limit", 25)), 100)
+        names, after, before = self.dataset.listing(key).page(
+            params.get("after"), params.get("before"), limit
+        )
+        return (
+            200,
+            _listing(
+                [
+                    {"kind": name[:2], "data": self.dataset.thing(name)}
+                    for name in names
+                ],
+                after,
+                before,
+            ),
+        )
+
+    def _me(self, _params, _data):
+        return 200, self.dataset.thing(self.dataset.users[0])
+
+    def _more(self, parent, names):
+        count = 0
+        pending = list(names)
+        while pending:
+            count += 1
+            pending.extend(self.dataset.children(pending.pop()))
+        return {
+            "kind": "more",
+            "data": {
+                "children": [name[3:] for name in names],
+                "count": count,
+                "depth": self.dataset.thing(names[0])["depth"],
+                "id": names[0][3:],
+                "name": names[0],
+                "parent_id": parent,
+            },
+        }
+
+    def _morechildren(self, _params, data):
+        names = [
+            "t1_" + comment_id
+            for comment_id in data.get("children", "").split(",")
+            if comment_id
+        ]
+        things = []
+        budget = [self.COMMENT_LIMIT]
+        for index, name in enumerate(names):
+            if self.dataset.thing(name) is None:
+                continue
+            if budget[0] <= 0:
+                parent = self.dataset.thing(name)["parent_id"]
+                things.append(self._more(parent, names[index:]))
+                break
+            budget[0] -= 1
+            things.append({"kind": "t1", "data": self.dataset.thing(name)})
+            self._flat_comments(self.dataset.children(name), budget, things)
+        return 200, {"json": {"data": {"things": things}, "errors": []}}
+
+    @staticmethod
+    def _not_found():
+        return 404, {"error": 404, "message": "Not Found"}
+
+    def _ratelimit(self):
+        """Return the rate limit headers, and whether the limit is exceeded."""
+        now = time.time()
+        with self._lock:
+            self.requests += 1
+            if self.ratelimit_requests is None:
+                return [], False
+            if self._window is None or now >= self._window:
+                self._window = now + self.ratelimit_window
+                self._used = 0
+            self._used += 1
+            used = self._used
+            reset = int(self._window - now)
+        remaining = max(0, self.ratelimit_requests - used)
+        headers = [
+            ("x-ratelimit-remaining", "{:.1f}".format(remaining)),
+            ("x-ratelimit-reset", str(reset)),
+            ("x-ratelimit-used", str(used)),
+        ]
+        return headers, used > self.ratelimit_requests
+
+    def _reply(self, _params, data, conversation_id):
+        if self.dataset.conversation(conversation_id) is None:
+            return self._not_found()
+        self.dataset.add_message(
+            conversation_id, data.get("body", ""), self.dataset.users[0]
+        )
+        conversation = self.dataset.conversation(conversation_id)
+        return (
+            200,
+            {
+                "conversation": conversation,
+                "messages": {
+                    item["id"]: self.dataset.message(item["id"])
+                    for item in conversation["objIds"]
+                },
+            },
+        )
+
+    def _respond(self, method, path, params, data):
+        if self.latency:
+            time.sleep(self.latency)
+        handler, arguments = self._route(method, path)
+        if handler == self._access_token:
+            status, result = handler(params, data)
+            return status, [], json.dumps(result).encode("utf-8")
+        headers, exceeded = self._ratelimit()
+        if exceeded or (
+            self.error_rate and self._random.random() < self.error_rate
+        ):
+            status = 429 if exceeded else self.error_status
+            result = {"error": status, "message": "Synthetic error"}
+        elif handler is None:
+            if method == "GET":
+                status, result = self._not_found()
+            else:
+                status, result = 200, {}
+        else:
+            status, result = handler(params, data, *arguments)
+        return status, headers, json.dumps(result).encode("utf-8")
+
+    def _route(self, method, path):
+        segments = tuple(path.split("/")) if path else ()
+        for pattern, handler in self._routes.get((method, len(segments)), ()):
+            arguments = []
+            for expected, segment in zip(pattern, segments):
+                if expected is None:
+                    arguments.append(segment)
+                elif expected != segment.lower():
+                    break
+            else:
+                return handler, arguments
+        return None, None
+
+    def _submission(
+        self, params, _data, submission_id, _slug=None, comment=None
+    ):
+        name = "t3_" + submission_id
+        submission = self.dataset.thing(name)
+        if submission is None:
+            return self._not_found()
+        limit = int(params.get("limit", self.COMMENT_LIMIT))
+        if comment:
+            names, parent = ["t1_" + comment], "t1_" + comment
+            if self.dataset.thing(parent) is None:
+                return self._not_found()
+        else:
+            names, parent = self.dataset.children(name), name
+        comments = self._comment_tree(names, [limit], parent)
+        return (
+            200,
+            [
+                _listing([{"kind": "t3", "data": submission}]),
+                _listing(comments),
+            ],
+        )
+
+    def _subreddit_about(self, _params, _data, display_name):
+        name = self.dataset.subreddit(display_name)
+        if name is None:
+            return self._not_found()
+        return 200, {"kind": "t5", "data": self.dataset.thing(name)}
+
+    def _subreddit_comments(self, params, _data, display_name):
+        return self._listing_response(
+            "r/{}/comments".format(display_name), params
+        )
+
+    def _subreddit_listing(self, params, _data, display_name, _sort="hot"):
+        if display_name.lower() in ("all", "popular"):
+            display_name = "all"
+        return self._listing_response("r/" + display_name, params)
+
+    def _submit(self, _params, data):
+        subreddit = self.dataset.subreddit(data.get("sr", ""))
+        if subreddit is None:
+            return (
+                200,
+                {
+                    "json": {
+                        "errors": [
+                            [
+                                "SUBREDDIT_NOEXIST",
+                                "that subreddit doesn't exist",
+                                "sr",
+                            ]
+                        ]
+                    }
+                },
+            )
+        name = self.dataset.add_submission(subreddit, data.get("title", ""))
+        submission = self.dataset.thing(name)
+        return (
+            200,
+            {
+                "json": {
+                    "data": {
+                        "id": submission["id"],
+                        "name": name,
+                        "url": submission["url"],
+                    },
+                    "errors": [],
+                }
+            },
+        )
+
+    def _user_about(self, _params, _data, user_name):
+        name = self.dataset.user(user_name)
+        if name is None:
+            return self._not_found()
+        return 200, {"kind": "t2", "data": self.dataset.thing(name)}
+
+    def _user_listing(self, params, _data, user_name, where):
+        if where.lower() not in ("comments", "submitted"):
+            return self._not_found()
+        return self._listing_response(
+            "user/{}/{}".format(user_name, where), params
+        )
+
+    def respond(
+        self,
+        method: str,
+        path: str,
+        params: Dict[str, str],
+        data: Dict[str, str],
+    ) -> Tuple[int, List[Tuple[str, str]], bytes]:
+        """Return the status, headers and body of the response to a request.
+
+        :param method: The HTTP method.
+        :param path: The path of the request, without surrounding slashes.
+        :param params: The query parameters.
+        :param data: The form data of the request body.
+
+        An exception raised while handling the request results in a response
+        with status 500.
+
+        """
+        try:
+            return self._respond(method, path, params, data)
+        except Exception:
+            log.exception("Error handling %s /%s", method, path)
+            result = {"error": 500, "message": "Internal Server Error"}
+            return 500, [], json.dumps(result).encode("utf-8")
+
+    def start(self):
+        """Serve requests in a background thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop serving requests and close the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    @property
+    def url(self) -> str:
+        """Return the URL to use as ``oauth_url`` and ``reddit_url``."""
+        host, port = self._server.server_address[:2]
+        return "http://{}:{}".format(host, port)
+
+
+def main():
+    """Serve a synthetic dataset until interrupted."""
+    parser = ArgumentParser(
+        prog="python -m praw.util.server",
+        description="Serve a synthetic dataset as the Reddit API.",
+    )
+    parser.add_argument("--port", default=8080, type=int)
+    parser.add_argument("--latency", default=0.0, type=float)
+    parser.add_argument("--error-rate", default=0.0, type=float)
+    parser.add_argument(
+        "--ratelimit-requests",
+        default=600,
+        help="the requests allowed per window, 0 for no rate limit",
+        type=int,
+    )
+    parser.add_argument("--ratelimit-window", default=600, type=int)
+    parser.add_argument("--submissions", default=1000, type=int)
+    parser.add_argument("--comments", default=20000, type=int)
+    arguments = parser.parse_args()
+    server = RedditServer(
+        SyntheticDataset(
+            submissions=arguments.submissions, comments=arguments.comments
+        ),
+        port=arguments.port,
+        latency=arguments.latency,
+        error_rate=arguments.error_rate,
+        ratelimit_requests=arguments.ratelimit_requests or None,
+        ratelimit_window=arguments.ratelimit_window,
+    )
+    print("Serving on {}".format(server.url))
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        server._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
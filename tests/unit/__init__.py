@@ -1,5 +1,7 @@
 """PRAW Unit test suite."""
 from praw import Reddit
+from requests import Response
+from requests.structures import CaseInsensitiveDict
 
 
 class UnitTest:
@@ -12,3 +14,35 @@ class UnitTest:
         )
         # Unit tests should never issue requests
         self.reddit._core._requestor._http = None
+
+
+def http_response(status_code, content=b"", **headers):
+    """Return a :class:`requests.Response` as received from reddit."""
+    response = Response()
+    response._content = content
+    response.headers = CaseInsensitiveDict(headers)
+    response.status_code = status_code
+    return response
+
+
+def listing_child(kind, **data):
+    """Return a child of a listing of ``kind`` with the fields ``data``."""
+    return {"kind": kind, "data": data}
+
+
+def listing_response(*children, after=None):
+    """Return the decoded JSON of a listing as returned by reddit.
+
+    :param children: The children of the listing, either ids of comments or
+        dictionaries returned by :func:`.listing_child`.
+    :param after: The fullname of the last child when the listing continues.
+
+    """
+    children = [
+        listing_child("t1", id=child, name="t1_" + child)
+        if isinstance(child, str)
+        else child
+        for child in children
+    ]
+    data = {"after": after, "before": None, "children": children}
+    return {"kind": "Listing", "data": data}
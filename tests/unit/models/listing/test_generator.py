@@ -1,13 +1,120 @@
 """Test praw.models.front."""
+import threading
+
+import mock
+from praw.models import Comment
 from praw.models.listing.generator import ListingGenerator
+from praw.models.listing.listing import LazyChildren, RawListing
 
-from ... import UnitTest
+from ... import UnitTest, listing_response as response
 
 
 class TestListingGenerator(UnitTest):
+    def test_lazy(self):
+        generator = ListingGenerator(self.reddit, "/comments", lazy=True)
+        with mock.patch.object(self.reddit, "request") as mock_method:
+            mock_method.return_value = response("a", "b", "c")
+            assert next(generator).id == "a"
+        children = generator._listing.children
+        assert isinstance(children, LazyChildren)
+        assert children._raw[0] is None
+        assert children._raw[1] == {
+            "kind": "t1",
+            "data": {"id": "b", "name": "t1_b"},
+        }
+        assert isinstance(children[-2], Comment)
+        assert children[1] is children[-2]
+        assert [item.id for item in children[1:]] == ["b", "c"]
+        assert [item.id for item in generator] == ["b", "c"]
+
+    def test_raw(self):
+        responses = [response("a", "b", after="t1_b"), response("c")]
+        generator = ListingGenerator(
+            self.reddit, "/comments", limit=None, raw=True
+        )
+        with mock.patch.object(self.reddit, "request") as mock_method:
+            mock_method.side_effect = responses
+            items = list(generator)
+        assert items == [
+            {"kind": "t1", "data": {"id": x, "name": "t1_" + x}} for x in "abc"
+        ]
+        assert isinstance(generator._listing, RawListing)
+        assert mock_method.call_args[1]["params"]["after"] == "t1_b"
+
+    def test_raw__flair(self):
+        data = {"users": [{"user": "a"}, {"user": "b"}], "next": None}
+        generator = ListingGenerator(self.reddit, "/flairlist", raw=True)
+        with mock.patch.object(self.reddit, "request") as mock_method:
+            mock_method.return_value = data
+            assert list(generator) == data["users"]
+        assert mock_method.call_count == 1
+
     def test_params_are_not_modified(self):
         params = {"prawtest": "yes"}
         generator = ListingGenerator(None, None, params=params)
         assert "limit" in generator.params
         assert "limit" not in params
         assert ("prawtest", "yes") in generator.params.items()
+
+    def test_prefetch(self):
+        responses = [
+            response("a", "b", after="t1_b"),
+            response("c", "d", after="t1_d"),
+            response("e"),
+        ]
+        afters = []
+
+        def request(method, path, params):
+            afters.append(params.get("after"))
+            return responses[len(afters) - 1]
+
+        generator = ListingGenerator(
+            self.reddit, "/comments", limit=None, prefetch=2
+        )
+        with mock.patch.object(self.reddit, "request") as mock_method:
+            mock_method.side_effect = request
+            assert next(generator).id == "a"
+            assert len(generator._prefetched) == 2
+            generator._prefetched[-1].result()
+            assert mock_method.call_count == 3
+            assert [item.id for item in generator] == ["b", "c", "d", "e"]
+        assert mock_method.call_count == 3
+        assert afters == [None, "t1_b", "t1_d"]
+        assert generator._exhausted
+
+    def test_prefetch__respects_limit(self):
+        generator = ListingGenerator(
+            self.reddit, "/comments", limit=2, prefetch=3
+        )
+        with mock.patch.object(self.reddit, "request") as mock_method:
+            mock_method.side_effect = [response("a", "b", after="t1_b")]
+            assert [item.id for item in generator] == ["a", "b"]
+        assert mock_method.call_count == 1
+
+    def test_prefetch__pages_within_limit(self):
+        ids = ["{:03d}".format(x) for x in range(300)]
+        responses = [
+            response(*ids[:100], after="t1_099"),
+            response(*ids[100:200], after="t1_199"),
+            response(*ids[200:], after="t1_299"),
+        ]
+        scheduled = threading.Event()
+
+        def request(method, path, params):
+            if params.get("after"):
+                # Hold the prefetches until all of them are scheduled.
+                scheduled.wait(5)
+            return responses.pop(0) if responses else response()
+
+        generator = ListingGenerator(
+            self.reddit, "/comments", limit=150, prefetch=4
+        )
+        with mock.patch.object(self.reddit, "request") as mock_method:
+            mock_method.side_effect = request
+            assert next(generator).id == "000"
+            assert len(generator._prefetched) == 4
+            scheduled.set()
+            for future in list(generator._prefetched):
+                future.result()
+            assert [item.id for item in generator] == ids[1:150]
+        assert mock_method.call_count == 2
@@ -1,8 +1,9 @@
 import pickle
 
+import mock
 import pytest
 from praw.exceptions import ClientException
-from praw.models import Comment
+from praw.models import Comment, Redditor, Subreddit
 
 from ... import UnitTest
 
@@ -25,6 +26,64 @@ class TestComment(UnitTest):
         assert "dummy1" == comment1
         assert comment2 == "dummy1"
 
+    def test_author_and_subreddit_are_converted_on_access(self):
+        comment = Comment(
+            self.reddit,
+            _data={"author": "spez", "id": "dummy", "subreddit": "redditdev"},
+        )
+        assert comment.__dict__["author"] == "spez"
+        assert comment.author == Redditor(self.reddit, "spez")
+        assert comment.__dict__["author"] is comment.author
+        assert comment.subreddit == Subreddit(self.reddit, "redditdev")
+        deleted = Comment(self.reddit, _data={"author": "[deleted]"})
+        assert deleted.author is None
+
+    def test_compact_models(self):
+        self.reddit.config.compact_models = True
+        data = {"author": "spez", "body": "hi", "id": "a", "replies": ""}
+        comment = Comment(self.reddit, _data=data)
+        other = Comment(self.reddit, _data=dict(data, body="bye", id="b"))
+        assert "body" not in comment.__dict__
+        assert comment._compact_table is other._compact_table
+        assert comment.body == "hi"
+        assert other.body == "bye"
+        assert comment.author == Redditor(self.reddit, "spez")
+        assert comment.id == "a"
+        assert comment._replies == []
+        comment.body = "changed"
+        assert comment.body == "changed"
+        assert other.body == "bye"
+        with pytest.raises(AttributeError):
+            comment._missing
+
+    def test_compact_models__reset_attributes(self):
+        self.reddit.config.compact_models = True
+        comment = Comment(self.reddit, _data={"body": "hi", "id": "a"})
+        comment._reset_attributes("body")
+        assert "_compact_table" not in comment.__dict__
+        assert "body" not in comment.__dict__
+        assert comment.__dict__["id"] == "a"
+
+    def test_compact_models__context(self):
+        self.reddit.config.compact_models = True
+        data = {
+            "context": "/r/a/comments/2gmzqe/title/cklhv0f/?context=3",
+            "id": "cklhv0f",
+        }
+        comment = Comment(self.reddit, _data=data)
+        assert "context" not in comment.__dict__
+        assert comment.submission.id == "2gmzqe"
+        comment.reply_sort = "new"
+        with mock.patch.object(
+            self.reddit, "get", side_effect=ClientException
+        ) as mock_get:
+            with pytest.raises(ClientException):
+                comment.refresh()
+        assert (
+            mock_get.call_args[0][0] == "/r/a/comments/2gmzqe/title/cklhv0f/"
+        )
+        assert mock_get.call_args[1]["params"]["sort"] == "new"
+
     def test_construct_failure(self):
         message = "Exactly one of `id`, `url`, or `_data` must be provided."
         with pytest.raises(TypeError) as excinfo:
@@ -1,5 +1,6 @@
 import pickle
 
+import mock
 import pytest
 from praw.exceptions import ClientException
 from praw.models import Submission
@@ -21,6 +22,16 @@ class TestSubmission(UnitTest):
         assert "dummy1" == submission1
         assert submission2 == "dummy1"
 
+    def test_comments__hydrated(self):
+        submission = Submission(self.reddit, "dummy")
+        submission._hydrate(Submission(self.reddit, _data={"id": "dummy"}))
+        with mock.patch.object(Submission, "_fetch") as mock_fetch:
+            mock_fetch.side_effect = lambda: setattr(
+                submission, "_comments", []
+            )
+            assert submission.comments == []
+        assert mock_fetch.call_count == 1
+
     def test_construct_failure(self):
         message = "Exactly one of `id`, `url`, or `_data` must be provided."
         with pytest.raises(TypeError) as excinfo:
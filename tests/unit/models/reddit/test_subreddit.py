@@ -1,5 +1,6 @@
 import pickle
 
+import mock
 import pytest
 from praw.models import Subreddit, WikiPage
 
@@ -7,6 +8,22 @@ from ... import UnitTest
 
 
 class TestSubreddit(UnitTest):
+    def test_fetch__not_modified(self):
+        subreddit = Subreddit(self.reddit, "redditdev")
+        response = {"kind": "t5", "data": {"display_name": "redditdev"}}
+        response["data"]["subscribers"] = 1
+        requestor = self.reddit._core._requestor
+        with mock.patch.object(self.reddit, "request") as mock_method:
+            mock_method.return_value = response
+            subreddit._fetch()
+            subreddit.subscribers = 2
+            requestor.not_modified = True
+            subreddit._fetch()
+            assert subreddit.subscribers == 2
+            requestor.not_modified = False
+            subreddit._fetch()
+            assert subreddit.subscribers == 1
+
     def test_equality(self):
         subreddit1 = Subreddit(
             self.reddit, _data={"display_name": "dummy1", "n": 1}
@@ -0,0 +1,137 @@
+"""Test praw.models.comment_forest."""
+import threading
+
+import mock
+import pytest
+from praw.models import Comment, MoreComments, Submission
+from praw.models.comment_forest import CommentForest
+
+from .. import UnitTest
+
+
+class TestCommentForest(UnitTest):
+    def comment(self, comment_id, parent_id="t3_sub"):
+        return Comment(
+            self.reddit,
+            _data={
+                "context": "/r/a/comments/sub/title/{}/".format(comment_id),
+                "id": comment_id,
+                "name": "t1_" + comment_id,
+                "parent_id": parent_id,
+                "replies": "",
+            },
+        )
+
+    def more(self, children, parent_id="t3_sub"):
+        return MoreComments(
+            self.reddit,
+            {
+                "children": children,
+                "count": len(children),
+                "id": children[0],
+                "name": "t1_" + children[0],
+                "parent_id": parent_id,
+            },
+        )
+
+    def setup(self):
+        super().setup()
+        self.submission = Submission(self.reddit, _data={"id": "sub"})
+        self.submission._fetched = True
+        self.threads = set()
+
+    def fake_post(self, path, data):
+        self.threads.add(threading.get_ident())
+        comments = []
+        for child in data["children"].split(","):
+            if child == "d":
+                comments.extend([self.comment("d"), self.more(["g"], "t1_d")])
+            elif child != "f":
+                comments.append(self.comment(child))
+        return comments
+
+    def forest(self, *comments):
+        forest = CommentForest(self.submission)
+        forest._update(list(comments))
+        return forest
+
+    def test_replace_more__coalesce(self):
+        more = self.more(["d", "e", "f"])
+        forest = self.forest(
+            self.comment("a"), more, self.more(["b"]), self.more(["c"])
+        )
+        with mock.patch.object(self.reddit, "post") as mock_post:
+            mock_post.side_effect = self.fake_post
+            assert forest.replace_more(limit=None, coalesce=True) == []
+        assert mock_post.call_count == 2
+        requested = [
+            call[1]["data"]["children"] for call in mock_post.call_args_list
+        ]
+        assert requested == ["d,e,f,b,c", "g"]
+        assert [comment.id for comment in more._comments] == ["d", "g", "e"]
+        ids = [comment.id for comment in forest.list()]
+        assert ids == ["a", "d", "e", "b", "c", "g"]
+        assert len(self.submission._comments_by_id) == 6
+
+    def test_replace_more__coalesce_retry(self):
+        forest = self.forest(
+            self.comment("a"), self.more(["b"]), self.more(["c"])
+        )
+        with mock.patch.object(self.reddit, "post") as mock_post:
+            mock_post.side_effect = ConnectionError()
+            with pytest.raises(ConnectionError):
+                forest.replace_more(limit=None, coalesce=True)
+            mock_post.side_effect = self.fake_post
+            assert forest.replace_more(limit=None, coalesce=True) == []
+        assert mock_post.call_count == 2
+        assert [comment.id for comment in forest.list()] == ["a", "b", "c"]
+
+    def test_replace_more__coalesce_respects_children_limit(self):
+        forest = self.forest(
+            self.more(["x{}".format(i) for i in range(60)]),
+            self.more(["y{}".format(i) for i in range(50)]),
+        )
+        with mock.patch.object(self.reddit, "post") as mock_post:
+            mock_post.side_effect = self.fake_post
+            assert forest.replace_more(limit=None, coalesce=True) == []
+        assert mock_post.call_count == 2
+        assert len(forest.list()) == 110
+
+    def test_replace_more__limit_with_workers(self):
+        forest = self.forest(
+            self.comment("a"),
+            self.more(["d", "e", "f"]),
+            self.more(["b"]),
+            self.more(["c"]),
+        )
+        with mock.patch.object(self.reddit, "post") as mock_post:
+            mock_post.side_effect = self.fake_post
+            skipped = forest.replace_more(limit=2, workers=4)
+        assert mock_post.call_count == 2
+        assert len(skipped) == 2
+        assert sorted(x.count for x in skipped) == [1, 1]
+
+    def test_replace_more__invalid_workers(self):
+        forest = self.forest(self.more(["b"]))
+        with mock.patch.object(self.reddit, "post") as mock_post:
+            for workers in (0, -1):
+                with pytest.raises(ValueError):
+                    forest.replace_more(workers=workers)
+        assert mock_post.call_count == 0
+
+    def test_replace_more__workers(self):
+        forest = self.forest(
+            self.comment("a"),
+            self.more(["d", "e", "f"]),
+            self.more(["b"]),
+            self.more(["c"]),
+        )
+        with mock.patch.object(self.reddit, "post") as mock_post:
+            mock_post.side_effect = self.fake_post
+            assert forest.replace_more(limit=None, workers=4) == []
+        assert mock_post.call_count == 4
+        assert self.threads - {threading.get_ident()}
+        ids = [comment.id for comment in forest.list()]
+        assert ids == ["a", "d", "e", "b", "c", "g"]
+        assert all(isinstance(comment, Comment) for comment in forest.list())
+        assert len(self.submission._comments_by_id) == 6
@@ -0,0 +1,101 @@
+"""Test praw.models.firehose."""
+import threading
+
+import mock
+from praw.models.firehose import _to_base36
+
+from .. import UnitTest, listing_child, listing_response
+
+
+class TestFirehose(UnitTest):
+    def setup(self):
+        super().setup()
+        self.deleted = {1005, 1150}
+        self.head = 1349
+        self.lock = threading.Lock()
+        self.requested = []
+
+    def fake_request(self, method, path, params=None, **_kwargs):
+        if "id" not in params:  # The newest item of r/all
+            return listing_response(
+                listing_child("t1", id=_to_base36(self.head))
+            )
+        fullnames = params["id"].split(",")
+        with self.lock:
+            self.requested.append(fullnames)
+        children = []
+        # Reddit does not return the items in the requested order.
+        for fullname in reversed(fullnames):
+            kind, id_ = fullname.split("_")
+            number = int(id_, 36)
+            if number <= self.head and number not in self.deleted:
+                children.append(listing_child(kind, id=id_, name=fullname))
+        return listing_response(*children)
+
+    def test_comments(self):
+        with mock.patch.object(self.reddit, "request") as mock_request:
+            mock_request.side_effect = self.fake_request
+            stream = self.reddit.firehose.comments(
+                start_id=_to_base36(1000), pause_after=0
+            )
+            comments = list(iter(lambda: next(stream), None))
+            self.head = 1360
+            comments.extend(iter(lambda: next(stream), None))
+        numbers = [int(comment.id, 36) for comment in comments]
+        expected = [x for x in range(1000, 1361) if x not in self.deleted]
+        assert numbers == expected
+        assert all(x.startswith("t1_") for y in self.requested for x in y)
+        # Four concurrent requests, then one request at the head.
+        assert len(self.requested) == 4 + 1 + 1 + 1
+
+    def test_comments__from_newest(self):
+        newest = listing_response(listing_child("t1", id=_to_base36(1340)))
+        with mock.patch.object(self.reddit, "request") as mock_request:
+            mock_request.side_effect = lambda *args, **kwargs: (
+                newest
+                if "comments" in args[1]
+                else self.fake_request(*args, **kwargs)
+            )
+            stream = self.reddit.firehose.comments(pause_after=0)
+            comments = list(iter(lambda: next(stream), None))
+        assert [int(x.id, 36) for x in comments] == list(range(1341, 1350))
+
+    def test_comments__skips_unavailable_ranges(self):
+        self.deleted = set(range(1000, 1250))
+        with mock.patch.object(self.reddit, "request") as mock_request:
+            mock_request.side_effect = self.fake_request
+            stream = self.reddit.firehose.comments(
+                start_id=_to_base36(1000), workers=1, pause_after=0
+            )
+            comments = list(iter(lambda: next(stream), None))
+        numbers = [int(comment.id, 36) for comment in comments]
+        assert numbers == list(range(1250, 1350))
+        # The newest ID is requested once, when the first range is empty.
+        assert mock_request.call_count == len(self.requested) + 1
+        assert len(self.requested) == 5
+
+    def test_submissions(self):
+        self.head = 1010
+        with mock.patch.object(self.reddit, "request") as mock_request:
+            mock_request.side_effect = self.fake_request
+            stream = self.reddit.firehose.submissions(
+                start_id=_to_base36(1000), workers=1, pause_after=0
+            )
+            submissions = list(iter(lambda: next(stream), None))
+        assert [int(x.id, 36) for x in submissions] == [
+            1000,
+            1001,
+            1002,
+            1003,
+            1004,
+            1006,
+            1007,
+            1008,
+            1009,
+            1010,
+        ]
+        assert self.requested[0][0] == "t3_" + _to_base36(1000)
+
+    def test_to_base36(self):
+        assert _to_base36(0) == "0"
+        assert _to_base36(int("dkk4qjd", 36)) == "dkk4qjd"
@@ -1,9 +1,36 @@
 """Test praw.models.util."""
-from praw.models.util import ExponentialCounter, permissions_string
+from types import SimpleNamespace
+
+import mock
+import pytest
+from praw.models.util import (
+    AdaptivePollPolicy,
+    BoundedSet,
+    ExponentialCounter,
+    ExponentialPollPolicy,
+    RotatingBloomFilter,
+    StreamPoller,
+    TimeWindowSet,
+    multiplex_generator,
+    permissions_string,
+    stream_generator,
+)
+from praw.util.checkpoint import Checkpoint
 
 from .. import UnitTest
 
 
+class TestBoundedSet(UnitTest):
+    def test_add(self):
+        bounded_set = BoundedSet(3)
+        for item in "abcad":
+            bounded_set.add(item)
+        assert list(bounded_set) == ["b", "c", "d"]
+        assert "a" not in bounded_set
+        assert "d" in bounded_set
+        assert len(bounded_set) == 3
+
+
 class TestExponentialCounter(UnitTest):
     MAX_DELTA = 1.0 / 32
 
@@ -38,6 +65,296 @@ class TestExponentialCounter(UnitTest):
             counter.reset()
 
 
+def created(*timestamps):
+    return [SimpleNamespace(created_utc=x) for x in timestamps]
+
+
+class TestAdaptivePollPolicy(UnitTest):
+    @mock.patch("time.time", return_value=1000)
+    def test_delay(self, _):
+        policy = AdaptivePollPolicy(target_items=10)
+        # One item per second.
+        assert policy.delay(created(*range(900, 950))) == 10
+        # Two items per second since the newest item of the last response.
+        assert policy.delay(created(949.5, 950, 950.5, 951)) == 10 / 1.5
+        assert policy.delay(created(*range(952, 1000))) == 10 / 1.25
+
+    def test_delay__bounds(self):
+        policy = AdaptivePollPolicy(min_delay=2, max_delay=30)
+        with mock.patch("time.time", return_value=1000):
+            timestamps = [900 + x / 100 for x in range(100)]
+            assert policy.delay(created(*timestamps)) == 2
+        policy = AdaptivePollPolicy(min_delay=2, max_delay=30)
+        with mock.patch("time.time", return_value=100000):
+            assert policy.delay(created(0, 1000)) == 30
+
+    @mock.patch("time.time", return_value=1000)
+    def test_delay__quiet_stream(self, _):
+        policy = AdaptivePollPolicy(target_items=1, smoothing=1)
+        assert policy.delay(created(980, 990)) == 10
+        # No new items for 100 seconds lowers the estimated rate.
+        with mock.patch("time.time", return_value=1090):
+            assert policy.delay([]) == 60
+        with mock.patch("time.time", return_value=1091):
+            assert policy.delay(created(1091)) == 60
+
+    def test_delay__without_estimate(self):
+        policy = AdaptivePollPolicy(max_delay=4)
+        assert [policy.delay([]) for _ in range(4)] == [1, 2, 4, 4]
+
+
+class TestExponentialPollPolicy(UnitTest):
+    def test_delay(self):
+        policy = ExponentialPollPolicy(max_delay=4)
+        delays = [policy.delay([]) for _ in range(4)]
+        assert [round(x) for x in delays] == [1, 2, 4, 4]
+        assert policy.delay([object()]) == 0
+        assert round(policy.delay([])) == 1
+        policy.delay([])
+        policy.reset()
+        assert round(policy.delay([])) == 1
+
+
+class TestRotatingBloomFilter(UnitTest):
+    def test_add(self):
+        bloom_filter = RotatingBloomFilter(1000, error_rate=0.01)
+        for item in range(2500):
+            bloom_filter.add("t1_{}".format(item))
+        assert all(
+            "t1_{}".format(x) in bloom_filter for x in range(2000, 2500)
+        )
+        assert all(
+            "t1_{}".format(x) in bloom_filter for x in range(1000, 2000)
+        )
+        false_positives = sum(
+            "t3_{}".format(x) in bloom_filter for x in range(10000)
+        )
+        assert false_positives < 400
+        assert sum("t1_{}".format(x) in bloom_filter for x in range(1000)) < 40
+
+
+class TestTimeWindowSet(UnitTest):
+    def test_add(self):
+        window = TimeWindowSet(60)
+        with mock.patch("time.time", return_value=1000):
+            window.add("a")
+        with mock.patch("time.time", return_value=1030):
+            window.add("b")
+            assert "a" in window
+        with mock.patch("time.time", return_value=1060):
+            assert "a" not in window
+            assert list(window) == ["b"]
+
+    def test_add__max_items(self):
+        window = TimeWindowSet(60, max_items=2)
+        for item in "abc":
+            window.add(item)
+        assert list(window) == ["b", "c"]
+        assert len(window) == 2
+
+
+class FakeListing:
+    """Imitate a listing function supporting ``after`` and ``before``."""
+
+    def __init__(self):
+        self.count = 0
+        self.fullnames = []
+
+    def __call__(self, limit, params=None):
+        params = params or {}
+        if params.get("after"):
+            start = self.fullnames.index(params["after"]) + 1
+            page = self.fullnames[start : start + limit]
+        elif params.get("before"):
+            end = self.fullnames.index(params["before"])
+            page = self.fullnames[max(0, end - limit) : end]
+        else:
+            page = self.fullnames[:limit]
+        return [SimpleNamespace(fullname=x) for x in page]
+
+    def add(self, count):
+        new = ["t1_{}".format(self.count + x) for x in range(count, 0, -1)]
+        self.fullnames[:0] = new
+        self.count += count
+
+
+def listing_function(*pages):
+    """Return a function returning ``pages`` of items, newest first."""
+    pages = list(pages)
+
+    def function(limit, params=None):
+        page = pages.pop(0) if pages else []
+        return [SimpleNamespace(fullname=x) for x in page]
+
+    return function
+
+
+class TestStreamPoller(UnitTest):
+    def test_poll(self):
+        function = mock.Mock(side_effect=listing_function(["b", "a"], ["c"]))
+        poller = StreamPoller(function)
+        assert [x.fullname for x in poller.poll()] == ["a", "b"]
+        assert [x.fullname for x in poller.poll()] == ["c"]
+        assert poller.poll() == []
+        assert function.call_args_list[1][1]["params"] == {"before": "b"}
+        assert function.call_args_list[2][1]["params"] == {"before": "c"}
+
+    def test_poll__backfill(self):
+        listing = FakeListing()
+        listing.add(150)
+        poller = StreamPoller(listing)
+        assert len(poller.poll()) == 100
+        assert poller.poll() == []
+        listing.add(250)
+        items = [item.fullname for item in poller.poll()]
+        assert items == ["t1_{}".format(x) for x in range(151, 401)]
+        assert poller.recovered == 151
+
+    def test_poll__backfill_disabled(self):
+        listing = FakeListing()
+        listing.add(150)
+        poller = StreamPoller(listing, backfill=False)
+        poller.poll()
+        poller.poll()
+        listing.add(250)
+        assert len(poller.poll()) == 99
+        assert poller.recovered == 0
+
+    def test_poll__backfill_partial_page(self):
+        function = mock.Mock(
+            side_effect=listing_function(["b", "a"], [], ["d", "c"])
+        )
+        poller = StreamPoller(function)
+        poller.poll()
+        poller.poll()
+        assert [x.fullname for x in poller.poll()] == ["c", "d"]
+        assert function.call_count == 3
+        assert poller.recovered == 0
+
+    def test_poll__dedup(self):
+        function = listing_function(["a"], ["b", "a"])
+        poller = StreamPoller(function, dedup=lambda: TimeWindowSet(60))
+        assert len(poller.poll()) == 1
+        assert [x.fullname for x in poller.poll()] == ["b"]
+        assert list(poller._seen_attributes) == ["a", "b"]
+
+    def test_poll__dedup_checkpoint(self):
+        with pytest.raises(TypeError):
+            StreamPoller(
+                listing_function(),
+                checkpoint=Checkpoint(),
+                dedup=lambda: RotatingBloomFilter(1000),
+            )
+
+    def test_poll__exclude_before(self):
+        function = mock.Mock(side_effect=listing_function(["a"], ["a"]))
+        poller = StreamPoller(function, exclude_before=True)
+        assert len(poller.poll()) == 1
+        assert poller.poll() == []
+        assert "params" not in function.call_args[1]
+
+
+@mock.patch("time.sleep")
+class TestMultiplexGenerator(UnitTest):
+    def test_multiplex_generator(self, mock_sleep):
+        first = listing_function(["b", "a"], [], ["e"])
+        second = listing_function(["d", "c"])
+        stream = multiplex_generator([first, second], pause_after=1)
+        items = []
+        for result in stream:
+            if result is None:
+                break
+            items.append((result[0], result[1].fullname))
+        assert items == [
+            (first, "a"),
+            (first, "b"),
+            (second, "c"),
+            (second, "d"),
+        ]
+
+    def test_multiplex_generator__sleeps_until_deadline(self, mock_sleep):
+        stream = multiplex_generator(
+            [listing_function(), listing_function()], pause_after=3
+        )
+        assert next(stream) is None
+        # The second function is due immediately after the first poll, and
+        # each later poll waits for the deadline of the other function.
+        assert mock_sleep.call_count == 2
+        assert all(0 < x[0][0] <= 1.1 for x in mock_sleep.call_args_list)
+
+    def test_multiplex_generator__checkpoint(self, _):
+        with pytest.raises(TypeError):
+            next(multiplex_generator([], checkpoint=Checkpoint()))
+
+    def test_multiplex_generator__skip_existing(self, mock_sleep):
+        function = listing_function(["a"], ["b"])
+        stream = multiplex_generator([function], skip_existing=True)
+        assert next(stream)[1].fullname == "b"
+        assert mock_sleep.call_count == 0
+
+
+def until_paused(stream):
+    return [item.fullname for item in iter(lambda: next(stream), None)]
+
+
+class TestStreamGenerator(UnitTest):
+    @mock.patch("time.sleep")
+    def test_stream_generator__checkpoint(self, _):
+        checkpoint = Checkpoint()
+        listing = FakeListing()
+        listing.add(150)
+        stream = stream_generator(
+            listing, pause_after=0, checkpoint=checkpoint
+        )
+        assert len(until_paused(stream)) == 100
+        assert checkpoint.load()["last"] == "t1_150"
+
+        listing.add(250)
+        stream = stream_generator(
+            listing, pause_after=0, skip_existing=True, checkpoint=checkpoint
+        )
+        expected = ["t1_{}".format(x) for x in range(151, 401)]
+        assert until_paused(stream) == expected
+        assert checkpoint.load()["last"] == "t1_400"
+
+    @mock.patch("time.sleep")
+    def test_stream_generator__poll_policy(self, mock_sleep):
+        class FixedPollPolicy(ExponentialPollPolicy):
+            def delay(self, items):
+                return 5
+
+        function = listing_function(["b", "a"], [], ["c"])
+        stream = stream_generator(function, poll_policy=FixedPollPolicy)
+        assert [next(stream).fullname for _ in range(3)] == ["a", "b", "c"]
+        assert mock_sleep.call_args_list == [mock.call(5)] * 2
+
+    @mock.patch("time.sleep")
+    def test_stream_generator__on_recovered(self, _):
+        listing = FakeListing()
+        listing.add(150)
+        recovered = []
+        stream = stream_generator(
+            listing, pause_after=0, on_recovered=recovered.append
+        )
+        assert len(until_paused(stream)) == 100
+        assert recovered == []
+        listing.add(250)
+        assert len(until_paused(stream)) == 250
+        assert recovered == [151]
+
+    def test_stream_generator__raw(self):
+        pages = [["b", "a"], ["c", "b"]]
+
+        def function(limit, params=None, raw=False):
+            assert raw
+            return [{"kind": "t1", "data": {"name": x}} for x in pages.pop(0)]
+
+        stream = stream_generator(function, pause_after=-1, raw=True)
+        names = [x["data"]["name"] for x in iter(lambda: next(stream), None)]
+        assert names == ["a", "b"]
+        assert next(stream)["data"]["name"] == "c"
+
+
 class TestUtil(UnitTest):
     PERMISSIONS = {"a", "b", "c"}
 
@@ -0,0 +1,134 @@
+import asyncio
+
+import mock
+from praw import AsyncReddit
+from praw.models import Comment, Subreddit
+from praw.models.util import PollPolicy
+
+from . import UnitTest, listing_response
+
+
+def run(coroutine):
+    return asyncio.get_event_loop().run_until_complete(coroutine)
+
+
+class TestAsyncReddit(UnitTest):
+    def setup(self):
+        super().setup()
+        self.async_reddit = AsyncReddit(reddit=self.reddit)
+
+    def teardown(self):
+        self.async_reddit.close()
+
+    def test_call(self):
+        assert run(self.async_reddit.call(sum, [1, 2, 3])) == 6
+
+    def test_delete(self):
+        with mock.patch.object(self.reddit, "request") as mock_method:
+            mock_method.return_value = None
+            assert run(self.async_reddit.delete("path")) is None
+        mock_method.assert_called_with(
+            "DELETE", "path", data=None, params=None
+        )
+
+    def test_fetch(self):
+        subreddit = Subreddit(self.reddit, "redditdev")
+        response = {"kind": "t5", "data": {"display_name": "redditdev"}}
+        response["data"]["subscribers"] = 10
+        with mock.patch.object(self.reddit, "request") as mock_method:
+            mock_method.return_value = response
+            assert run(self.async_reddit.fetch(subreddit)) is subreddit
+        assert subreddit._fetched
+        assert subreddit.subscribers == 10
+
+    def test_get(self):
+        with mock.patch.object(self.reddit, "request") as mock_method:
+            mock_method.return_value = listing_response("a", "b")
+            listing = run(self.async_reddit.get("path"))
+        assert [comment.id for comment in listing] == ["a", "b"]
+
+    def test_listing(self):
+        async def collect(generator):
+            items = []
+            async for item in self.async_reddit.listing(generator):
+                items.append(item)
+            return items
+
+        responses = [listing_response("a", "b", after="t1_b")]
+        responses.append(listing_response("c"))
+        generator = Subreddit(self.reddit, "redditdev").comments(limit=None)
+        with mock.patch.object(self.reddit, "request") as mock_method:
+            mock_method.side_effect = responses
+            comments = run(collect(generator))
+        assert all(isinstance(comment, Comment) for comment in comments)
+        assert [comment.id for comment in comments] == ["a", "b", "c"]
+        assert mock_method.call_count == 2
+
+    def test_stream__pause_after(self):
+        async def collect(stream):
+            items = []
+            async for item in stream:
+                items.append(item)
+                if item is None:
+                    return items
+
+        subreddit = Subreddit(self.reddit, "redditdev")
+        stream = self.async_reddit.stream(subreddit.comments, pause_after=0)
+        with mock.patch.object(self.reddit, "request") as mock_method:
+            mock_method.side_effect = [
+                listing_response("b", "a"),
+                listing_response("b", "a"),
+            ]
+            items = run(collect(stream))
+        assert [getattr(item, "id", None) for item in items] == [
+            "a",
+            "b",
+            None,
+        ]
+
+    @mock.patch("asyncio.sleep")
+    def test_stream__sleeps_without_blocking(self, mock_sleep):
+        async def no_sleep(_seconds):
+            pass
+
+        async def collect(stream):
+            items = []
+            async for item in stream:
+                items.append(item)
+                if item is None:
+                    return items
+
+        mock_sleep.side_effect = no_sleep
+        subreddit = Subreddit(self.reddit, "redditdev")
+        stream = self.async_reddit.stream(subreddit.comments, pause_after=1)
+        with mock.patch.object(self.reddit, "request") as mock_method:
+            mock_method.side_effect = [listing_response()] * 2
+            assert run(collect(stream)) == [None]
+        assert mock_sleep.call_count == 1
+
+    @mock.patch("asyncio.sleep")
+    def test_stream__poll_policy(self, mock_sleep):
+        class ConstantPollPolicy(PollPolicy):
+            def delay(self, items):
+                return 7
+
+        async def collect(stream):
+            return [await stream.__anext__() for _ in range(2)]
+
+        async def no_sleep(_seconds):
+            pass
+
+        mock_sleep.side_effect = no_sleep
+        subreddit = Subreddit(self.reddit, "redditdev")
+        stream = self.async_reddit.stream(
+            subreddit.comments, poll_policy=ConstantPollPolicy
+        )
+        with mock.patch.object(self.reddit, "request") as mock_method:
+            mock_method.side_effect = [
+                listing_response("a"),
+                listing_response(),
+                listing_response("b", "a"),
+            ]
+            items = run(collect(stream))
+        assert [item.id for item in items] == ["a", "b"]
+        assert mock_sleep.call_args_list == [mock.call(7)] * 2
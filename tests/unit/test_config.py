@@ -53,6 +53,11 @@ class TestConfig:
         config = Config("DEFAULT")
         assert config.custom == {}
 
+    def test_compact_models(self):
+        assert Config("DEFAULT").compact_models is False
+        config = Config("DEFAULT", compact_models="on")
+        assert config.compact_models is True
+
     def test_check_for_updates__true(self):
         for value in [True, "1", "true", "YES", "on"]:
             config = Config("DEFAULT", check_for_updates=value)
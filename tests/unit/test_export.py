@@ -0,0 +1,198 @@
+"""Test praw.export."""
+import gzip
+import json
+import os
+
+import mock
+import pytest
+from praw.export import NDJSONWriter, ParquetWriter, to_ndjson, to_parquet
+from praw.models import Redditor, Submission, Subreddit
+from praw.models.listing.generator import ListingGenerator
+from praw.util.checkpoint import Checkpoint
+
+from . import UnitTest, listing_child, listing_response
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+def child(number):
+    return listing_child("t3", name="t3_{}".format(number))
+
+
+def read(paths, opener=open):
+    lines = []
+    for path in paths:
+        with opener(path, "rt") as fp:
+            lines.extend(json.loads(line) for line in fp)
+    return lines
+
+
+class TestNDJSONWriter(UnitTest):
+    @pytest.fixture(autouse=True)
+    def directory(self, tmpdir):
+        self.directory = str(tmpdir)
+
+    def path(self, name="export-{index}.ndjson"):
+        return os.path.join(self.directory, name)
+
+    def test_init__invalid(self):
+        with pytest.raises(ValueError):
+            NDJSONWriter(self.path(), fsync="sometimes")
+        with pytest.raises(ValueError):
+            NDJSONWriter(self.path(), compress="zip")
+        with pytest.raises(ValueError):
+            NDJSONWriter(self.path("export.ndjson"), rotate_bytes=1024)
+        with pytest.raises(ValueError):
+            NDJSONWriter(self.path("export.ndjson"), cursor=Checkpoint())
+
+    def test_write(self):
+        with NDJSONWriter(self.path("export.ndjson")) as writer:
+            for number in range(3):
+                writer.write(child(number))
+        assert writer.count == 3
+        assert writer.after == "t3_2"
+        assert read(writer.paths) == [
+            {"name": "t3_{}".format(x)} for x in range(3)
+        ]
+
+    def test_write__error(self):
+        writer = NDJSONWriter(self.path("missing/export.ndjson"))
+        writer.write(child(0))
+        with pytest.raises(FileNotFoundError):
+            writer.close()
+
+    @mock.patch("os.fsync")
+    def test_write__fsync(self, mock_fsync):
+        with NDJSONWriter(self.path(), batch_size=2, fsync="batch") as writer:
+            for number in range(3):
+                writer.write(child(number))
+        assert mock_fsync.call_count == 3
+        mock_fsync.reset_mock()
+        with NDJSONWriter(self.path(), batch_size=2) as writer:
+            for number in range(3):
+                writer.write(child(number))
+        assert mock_fsync.call_count == 1
+        mock_fsync.reset_mock()
+        with NDJSONWriter(self.path(), fsync="never") as writer:
+            writer.write(child(0))
+        assert mock_fsync.call_count == 0
+
+    def test_write__models(self):
+        submission = Submission(
+            self.reddit,
+            _data={
+                "author": Redditor(self.reddit, "spez"),
+                "id": "a",
+                "name": "t3_a",
+                "subreddit": Subreddit(self.reddit, "redditdev"),
+                "title": "Title",
+            },
+        )
+        with NDJSONWriter(self.path("export.ndjson")) as writer:
+            writer.write(submission)
+            writer.write(None)
+        record = read(writer.paths)[0]
+        assert record["author"] == "spez"
+        assert record["subreddit"] == "redditdev"
+        assert record["title"] == "Title"
+        assert writer.after == "t3_a"
+
+    def test_write__rotate(self):
+        size = len(json.dumps(child(10)["data"])) + 1
+        writer = NDJSONWriter(
+            self.path("export-{index}.ndjson.gz"),
+            batch_size=3,
+            compress="gzip",
+            rotate_bytes=size * 4,
+        )
+        with writer:
+            for number in range(10, 20):
+                writer.write(child(number))
+        assert len(writer.paths) == 3
+        assert writer.index == 2
+        lines = read(writer.paths, opener=gzip.open)
+        assert [x["name"] for x in lines] == [
+            "t3_{}".format(x) for x in range(10, 20)
+        ]
+
+
+class TestToNDJSON(UnitTest):
+    @pytest.fixture(autouse=True)
+    def directory(self, tmpdir):
+        self.path = os.path.join(str(tmpdir), "export-{index:02d}.ndjson")
+
+    def test_to_ndjson__resume(self):
+        cursor = Checkpoint()
+        generator = ListingGenerator(self.reddit, "/new", limit=None, raw=True)
+        with mock.patch.object(self.reddit, "request") as mock_method:
+            mock_method.side_effect = [
+                listing_response(child(1), child(2), child(3), after="t3_3"),
+                ConnectionError(),
+            ]
+            with pytest.raises(ConnectionError):
+                to_ndjson(generator, self.path, batch_size=2, cursor=cursor)
+        assert cursor.load() == {"after": "t3_3", "count": 3, "index": 0}
+
+        generator = ListingGenerator(self.reddit, "/new", limit=None, raw=True)
+        with mock.patch.object(self.reddit, "request") as mock_method:
+            mock_method.return_value = listing_response(child(4), child(5))
+            writer = to_ndjson(generator, self.path, cursor=cursor)
+        assert mock_method.call_args[1]["params"]["after"] == "t3_3"
+        assert writer.count == 5
+        assert [os.path.basename(x) for x in writer.paths] == [
+            "export-01.ndjson"
+        ]
+        assert read(writer.paths) == [{"name": "t3_4"}, {"name": "t3_5"}]
+        assert cursor.load() == {"after": "t3_5", "count": 5, "index": 1}
+
+    def test_to_ndjson__resume_limit(self):
+        cursor = Checkpoint()
+        cursor.save({"after": "t3_3", "count": 3, "index": 0})
+        generator = ListingGenerator(self.reddit, "/new", limit=5, raw=True)
+        with mock.patch.object(self.reddit, "request") as mock_method:
+            mock_method.return_value = listing_response(
+                child(4), child(5), child(6)
+            )
+            writer = to_ndjson(generator, self.path, cursor=cursor)
+        assert mock_method.call_args[1]["params"]["limit"] == 2
+        assert writer.count == 5
+        assert read(writer.paths) == [{"name": "t3_4"}, {"name": "t3_5"}]
+
+        generator = ListingGenerator(self.reddit, "/new", limit=5, raw=True)
+        with mock.patch.object(self.reddit, "request") as mock_method:
+            writer = to_ndjson(generator, self.path, cursor=cursor)
+        assert mock_method.call_count == 0
+        assert writer.count == 5
+
+
+@pytest.mark.skipif(pyarrow is not None, reason="pyarrow is installed")
+class TestParquetWriterWithoutPyarrow(UnitTest):
+    def test_init(self):
+        with pytest.raises(ImportError):
+            ParquetWriter("export.parquet")
+
+
+@pytest.mark.skipif(pyarrow is None, reason="pyarrow is not installed")
+class TestToParquet(UnitTest):
+    @pytest.fixture(autouse=True)
+    def directory(self, tmpdir):
+        self.path = os.path.join(str(tmpdir), "export-{index}.parquet")
+
+    def test_to_parquet(self):
+        import pyarrow.parquet
+
+        items = [
+            {"kind": "t1", "data": {"name": "t1_a", "edited": None}},
+            {"kind": "t1", "data": {"name": "t1_b", "edited": 1.5}},
+            {"kind": "t1", "data": {"name": "t1_c", "awards": [1]}},
+        ]
+        writer = to_parquet(items, self.path, batch_size=1)
+        table = pyarrow.parquet.read_table(writer.paths[0])
+        assert table.to_pylist() == [
+            {"name": "t1_a", "edited": None},
+            {"name": "t1_b", "edited": "1.5"},
+            {"name": "t1_c", "edited": None},
+        ]
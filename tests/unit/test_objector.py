@@ -1,11 +1,32 @@
 import pytest
 
 from praw.exceptions import APIException, ClientException
+from praw.models import Button, Comment, MenuLink, Redditor
 
 from . import UnitTest
 
 
 class TestObjector(UnitTest):
+    def test_objectify__dict_rules(self):
+        objector = self.reddit._objector
+        link = {"text": "a", "url": "https://a"}
+        assert isinstance(objector.objectify(link), MenuLink)
+        assert isinstance(objector.objectify(dict(link, color="")), Button)
+        assert isinstance(objector.objectify(dict(link, height=1)), MenuLink)
+        comment = objector.objectify({"id": "a", "parent_id": "t3_b"})
+        assert isinstance(comment, Comment)
+        data = objector.objectify({"user": "spez", "other": 1})
+        assert data["user"] == Redditor(self.reddit, "spez")
+        assert objector.objectify({"other": 1}) == {"other": 1}
+
+    def test_objectify__dict_rules_are_cached_by_signature(self):
+        objector = self.reddit._objector
+        objector.objectify({"id": "a", "parent_id": "t3_b", "body": ""})
+        objector.objectify({"id": "c", "parent_id": "t1_a", "score": 1})
+        signature = frozenset(["id", "parent_id"])
+        assert list(objector._rules_by_signature) == [signature]
+        assert objector._rules_by_signature[signature] == objector._comment
+
     def test_objectify_returns_None_for_None(self):
         assert self.reddit._objector.objectify(None) is None
 
@@ -0,0 +1,151 @@
+import mock
+import pytest
+from praw import RedditPool
+from praw.exceptions import MissingRequiredAttributeException
+from praw.util.cache import ResponseCache
+
+from . import UnitTest
+
+
+class TestRedditPool(UnitTest):
+    def setup(self):
+        super().setup()
+        self.pool = RedditPool(
+            [
+                {"client_id": "owner", "client_secret": "dummy"},
+                {"client_id": "second", "client_secret": "dummy"},
+                {"client_id": "third", "client_secret": None},
+            ],
+            user_agent="dummy",
+        )
+        self.pool._core._requestor._http = None
+        self.owner, self.second, self.third = (
+            credential.core for credential in self.pool._credentials
+        )
+
+    @staticmethod
+    def set_remaining(core, remaining):
+        core._rate_limiter.remaining = remaining
+        core._rate_limiter.reset_timestamp = 1000
+        core._rate_limiter.used = 600 - remaining
+
+    def test_init(self):
+        assert self.pool.config.client_id == "owner"
+        requestors = {core._requestor for core in (self.owner, self.second)}
+        assert requestors == {self.pool._core._requestor}
+
+    def test_init__missing_client_id(self):
+        with pytest.raises(MissingRequiredAttributeException):
+            RedditPool(
+                [{"client_id": "owner", "client_secret": "dummy"}, {}],
+                user_agent="dummy",
+            )
+
+    def test_init__no_sites(self):
+        with pytest.raises(ValueError):
+            RedditPool([])
+
+    def test_request_core(self):
+        assert self.pool._request_core("GET", "r/redditdev/new") is self.owner
+        self.pool._request_sent(self.owner)
+        assert self.pool._request_core("GET", "api/info") is self.second
+        self.pool._request_sent(self.second)
+        assert self.pool._request_core("GET", "api/info") is self.third
+        self.set_remaining(self.owner, 100)
+        self.set_remaining(self.second, 300)
+        self.set_remaining(self.third, 200)
+        assert self.pool._request_core("GET", "api/info") is self.second
+        assert self.pool._request_core("POST", "api/comment") is self.owner
+        assert self.pool._request_core("GET", "api/v1/me") is self.owner
+        assert (
+            self.pool._request_core("GET", "r/redditdev/about/modqueue")
+            is self.owner
+        )
+        with self.pool.pinned():
+            assert self.pool._request_core("GET", "api/info") is self.owner
+        assert self.pool._request_core("GET", "api/info") is self.second
+
+    def test_request_core__authenticated(self):
+        pool = RedditPool(
+            [
+                {
+                    "client_id": "owner",
+                    "client_secret": "dummy",
+                    "password": "dummy",
+                    "username": "dummy",
+                },
+                {"client_id": "second", "client_secret": "dummy"},
+            ],
+            shared_endpoints=["submission"],
+            user_agent="dummy",
+        )
+        owner, second = (credential.core for credential in pool._credentials)
+        self.set_remaining(owner, 100)
+        self.set_remaining(second, 300)
+        assert not pool.read_only
+        assert pool._request_core("GET", "api/info") is owner
+        assert pool._request_core("GET", "comments/abc") is second
+        with pool.shared():
+            assert pool._request_core("GET", "api/info") is second
+            assert pool._request_core("GET", "api/v1/me") is owner
+            with pool.pinned():
+                assert pool._request_core("GET", "api/info") is owner
+        assert pool._request_core("GET", "api/info") is owner
+
+    def test_request(self):
+        self.set_remaining(self.owner, 100)
+        self.set_remaining(self.second, 300)
+        self.set_remaining(self.third, 200)
+        with mock.patch.object(
+            self.second, "request", return_value={}
+        ) as mock_second, mock.patch.object(
+            self.owner, "request", return_value={}
+        ) as mock_owner:
+            self.pool.get("r/redditdev/new")
+            self.pool.post("api/comment")
+        assert mock_second.call_count == 1
+        assert mock_owner.call_count == 1
+
+    def test_request__cached(self):
+        self.pool.response_cache = ResponseCache()
+        self.set_remaining(self.owner, 100)
+        self.set_remaining(self.second, 300)
+        self.set_remaining(self.third, 200)
+        with mock.patch.object(
+            self.second, "request", return_value={}
+        ) as mock_second:
+            self.pool.get("r/redditdev/about/rules")
+            self.pool.get("r/redditdev/about/rules")
+        assert mock_second.call_count == 1
+        assert [x["requests"] for x in self.pool.utilization()] == [0, 1, 0]
+
+    def test_utilization(self):
+        self.set_remaining(self.second, 300)
+        with mock.patch.object(
+            self.second, "request", return_value={}
+        ), mock.patch.object(self.owner, "request", return_value={}):
+            self.pool.get("api/info")
+            self.pool.post("api/comment")
+        assert self.pool.utilization() == [
+            {
+                "remaining": None,
+                "requests": 2,
+                "reset_timestamp": None,
+                "site": "DEFAULT",
+                "used": None,
+            },
+            {
+                "remaining": 300,
+                "requests": 0,
+                "reset_timestamp": 1000,
+                "site": "second",
+                "used": 300,
+            },
+            {
+                "remaining": None,
+                "requests": 0,
+                "reset_timestamp": None,
+                "site": "third",
+                "used": None,
+            },
+        ]
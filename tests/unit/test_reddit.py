@@ -1,4 +1,5 @@
 import configparser
+import time
 import types
 
 import mock
@@ -6,9 +7,12 @@ import pytest
 from praw import __version__, Reddit
 from praw.config import Config
 from praw.exceptions import ClientException
-from prawcore import Requestor
+from praw.util.cache import ResponseCache
+from praw.util.jsonbackend import JSONBackend
+from praw.util.scheduler import RequestScheduler
+from prawcore import NotFound, Requestor
 
-from . import UnitTest
+from . import UnitTest, listing_child, listing_response
 
 
 class TestReddit(UnitTest):
@@ -168,6 +172,193 @@ class TestReddit(UnitTest):
         assert self.reddit.subreddit("redditdev").display_name == "redditdev"
 
 
+class TestRedditHydrate(UnitTest):
+    def test_hydrate(self):
+        submissions = [self.reddit.submission(x) for x in ("a", "b", "c")]
+        submissions[0].comment_sort = "new"
+        comment = self.reddit.comment("d")
+        subreddit = self.reddit.subreddit("RedditDev")
+        response = listing_response(
+            listing_child("t1", id="d", name="t1_d", body="Body"),
+            listing_child("t3", id="a", name="t3_a", title="A"),
+            listing_child("t3", id="b", name="t3_b", title="B"),
+        )
+        subreddit_response = listing_response(
+            listing_child("t5", display_name="redditdev", subscribers=10)
+        )
+        with mock.patch.object(self.reddit, "request") as mock_method:
+            mock_method.side_effect = [response, subreddit_response]
+            missing = self.reddit.hydrate(submissions + [comment, subreddit])
+        assert missing == [submissions[2]]
+        assert mock_method.call_count == 2
+        params = [call[1]["params"] for call in mock_method.call_args_list]
+        assert params == [
+            {"id": "t3_a,t3_b,t3_c,t1_d"},
+            {"sr_name": "redditdev"},
+        ]
+        assert [x._fetched for x in submissions] == [True, True, False]
+        assert submissions[1].title == "B"
+        assert submissions[0].comment_sort == "new"
+        assert comment.body == "Body"
+        assert subreddit.subscribers == 10
+
+    def test_hydrate__batches(self):
+        submissions = [self.reddit.submission(str(x)) for x in range(150)]
+        with mock.patch.object(self.reddit, "request") as mock_method:
+            mock_method.return_value = listing_response()
+            self.reddit.hydrate(submissions + [submissions[0]])
+        assert mock_method.call_count == 2
+
+    def test_hydrate__skips_fetched(self):
+        submission = self.reddit.submission("a")
+        submission._fetched = True
+        with mock.patch.object(self.reddit, "request") as mock_method:
+            assert self.reddit.hydrate([submission, "text"]) == []
+        assert mock_method.call_count == 0
+
+    def test_lazy_batch(self):
+        response = listing_response(
+            listing_child("t3", id="a", name="t3_a", title="A"),
+            listing_child("t3", id="b", name="t3_b", title="B"),
+        )
+        with mock.patch.object(self.reddit, "request") as mock_method:
+            mock_method.return_value = response
+            with self.reddit.lazy_batch():
+                first = self.reddit.submission("a")
+                second = self.reddit.submission("b")
+                assert first.title == "A"
+                assert second.title == "B"
+            assert self.reddit._lazy_batch is None
+        assert mock_method.call_count == 1
+
+
+class TestRedditResponseCache(UnitTest):
+    def setup(self):
+        super().setup()
+        self.reddit.response_cache = ResponseCache()
+
+    def test_identity(self):
+        def me(username, returned):
+            reddit = Reddit(
+                client_id="dummy",
+                client_secret="dummy",
+                password="dummy",
+                response_cache=self.reddit.response_cache,
+                user_agent="dummy",
+                username=username,
+            )
+            with mock.patch.object(reddit._core, "request") as mock_method:
+                mock_method.return_value = {"name": returned}
+                return reddit.request("GET", "api/v1/me")
+
+        assert me("a", "a") == {"name": "a"}
+        assert me("b", "b") == {"name": "b"}
+        assert me("A", "other") == {"name": "a"}
+        token = self.reddit._cache_identity(
+            mock.Mock(_authorizer=mock.Mock(refresh_token="secret"))
+        )
+        assert token.startswith("token:") and "secret" not in token
+        authorizer = mock.Mock(refresh_token=None, access_token=None)
+        assert (
+            self.reddit._cache_identity(mock.Mock(_authorizer=authorizer))
+            is None
+        )
+
+    def test_invalidate(self):
+        subreddit = self.reddit.subreddit("redditdev")
+        with mock.patch.object(self.reddit._core, "request") as mock_method:
+            mock_method.return_value = {"data": {}}
+            self.reddit.request("GET", "r/redditdev/about/")
+            subreddit.subscribe()
+            self.reddit.request("GET", "r/redditdev/about/")
+        assert mock_method.call_count == 3
+
+    def test_request(self):
+        with mock.patch.object(self.reddit._core, "request") as mock_method:
+            mock_method.return_value = {"rules": []}
+            for _ in range(2):
+                self.reddit.get("r/redditdev/about/rules")
+                self.reddit.get("r/redditdev/new")
+            self.reddit.post("r/redditdev/about/rules")
+        assert mock_method.call_count == 4
+
+
+class TestRedditRequestObservers(UnitTest):
+    def setup(self):
+        super().setup()
+        self.observed = []
+        self.reddit.request_observers.append(self.observed.append)
+
+    def test_get(self):
+        requestor = self.reddit._core._requestor
+
+        def request(*_args, **_kwargs):
+            requestor.metrics.network = 0.25
+            requestor.metrics.status = 200
+            return listing_response()
+
+        with mock.patch.object(
+            self.reddit._core, "request", side_effect=request
+        ):
+            self.reddit.get("api/info", params={"id": "t3_a"})
+        assert len(self.observed) == 1
+        metrics = self.observed[0]
+        assert metrics.endpoint == "info"
+        assert metrics.method == "GET"
+        assert metrics.network == 0.25
+        assert metrics.status == 200
+        assert metrics.objectify > 0
+        assert requestor.metrics is None
+
+    def test_request__cached(self):
+        self.reddit.response_cache = ResponseCache()
+        with mock.patch.object(self.reddit._core, "request") as mock_method:
+            mock_method.return_value = {"rules": []}
+            self.reddit.request("GET", "r/redditdev/about/rules")
+            self.reddit.request("GET", "r/redditdev/about/rules")
+        assert [metrics.cached for metrics in self.observed] == [False, True]
+        assert self.observed[0].endpoint == "rules"
+
+    def test_request__error(self):
+        response = mock.Mock(status_code=404)
+        with mock.patch.object(
+            self.reddit._core, "request", side_effect=NotFound(response)
+        ):
+            with pytest.raises(NotFound):
+                self.reddit.post("api/comment")
+        assert len(self.observed) == 1
+        assert self.observed[0].status == 404
+        assert isinstance(self.observed[0].error, NotFound)
+
+
+class TestRedditRequestScheduler(UnitTest):
+    def test_priority__without_scheduler(self):
+        with self.reddit.priority("bulk"):
+            pass
+
+    def test_request(self):
+        self.reddit.request_scheduler = RequestScheduler()
+        limiter = self.reddit._core._rate_limiter
+        priorities = []
+
+        def request(*_args, **_kwargs):
+            priorities.append(self.reddit.request_scheduler.current_priority)
+            limiter.remaining = 30
+            limiter.reset_timestamp = time.time() + 60
+            return {}
+
+        with mock.patch.object(
+            self.reddit._core, "request", side_effect=request
+        ):
+            with self.reddit.priority("bulk"):
+                self.reddit.request("GET", "r/redditdev/new")
+            self.reddit.request("GET", "r/redditdev/new")
+        assert priorities == ["bulk", "interactive"]
+        assert self.reddit.request_scheduler._rate == pytest.approx(
+            0.5, rel=0.01
+        )
+
+
 class TestRedditCustomRequestor(UnitTest):
     def test_requestor_class(self):
         class CustomRequestor(Requestor):
@@ -203,3 +394,40 @@ class TestRedditCustomRequestor(UnitTest):
         )
 
         assert reddit._core._requestor._http is session
+
+
+class TestRedditGetRaw(UnitTest):
+    def test_get_raw(self):
+        data = listing_response()
+        with mock.patch.object(self.reddit, "request", return_value=data):
+            assert self.reddit.get_raw("/new", params={"limit": 1}) is data
+            self.reddit.request.assert_called_with(
+                "GET", "/new", params={"limit": 1}
+            )
+
+
+class TestRedditJSONBackend(UnitTest):
+    def test_default(self):
+        assert type(self.reddit.json_backend) is JSONBackend
+        requestor = self.reddit._core._requestor
+        assert requestor.json_backend is self.reddit.json_backend
+
+    def test_instance(self):
+        backend = JSONBackend()
+        reddit = Reddit(
+            client_id="dummy",
+            client_secret="dummy",
+            json_backend=backend,
+            user_agent="dummy",
+        )
+        assert reddit.json_backend is backend
+        assert reddit._core._requestor.json_backend is backend
+
+    def test_unknown(self):
+        with pytest.raises(ValueError):
+            Reddit(
+                client_id="dummy",
+                client_secret="dummy",
+                json_backend="unknown",
+                user_agent="dummy",
+            )
@@ -0,0 +1,161 @@
+import pickle
+
+import mock
+import pytest
+from praw.requestor import Requestor
+from praw.util.jsonbackend import JSONBackend
+from praw.util.metrics import RequestMetrics
+from prawcore import RequestException
+
+from . import UnitTest, http_response as response
+
+
+class TestRequestor(UnitTest):
+    def setup(self):
+        super().setup()
+        self.session = mock.Mock(headers={})
+        self.requestor = Requestor(
+            "praw:test", max_validators=256, session=self.session
+        )
+
+    def request(self, url="https://oauth.reddit.com/r/a/about"):
+        return self.requestor.request(
+            "GET",
+            url,
+            headers={"Authorization": "bearer token"},
+            params={"raw_json": 1},
+        )
+
+    def sent_headers(self):
+        return self.session.request.call_args[1]["headers"]
+
+    def test_request__not_modified(self):
+        self.session.request.side_effect = [
+            response(
+                200, b'{"a": 1}', ETag='"1"', **{"x-ratelimit-used": "1"}
+            ),
+            response(304, **{"content-length": "0", "x-ratelimit-used": "2"}),
+        ]
+        assert self.request().json() == {"a": 1}
+        assert not self.requestor.not_modified
+        result = self.request()
+        assert self.sent_headers()["If-None-Match"] == '"1"'
+        assert self.requestor.not_modified
+        assert result.status_code == 200
+        assert result.json() == {"a": 1}
+        assert result.headers["x-ratelimit-used"] == "2"
+        assert "content-length" not in result.headers
+        assert self.requestor._validators[
+            self.requestor._key(
+                "https://oauth.reddit.com/r/a/about",
+                {"raw_json": 1},
+                {"Authorization": "bearer token"},
+            )
+        ] == ({"If-None-Match": '"1"'}, {"a": 1})
+
+    def test_request__not_modified_copies_body(self):
+        self.session.request.side_effect = [
+            response(200, b'{"a": [1]}', ETag='"1"'),
+            response(304),
+            response(304),
+        ]
+        self.request().json()["a"].append(2)
+        self.request().json()["a"].append(3)
+        assert self.request().json() == {"a": [1]}
+
+    def test_request__disabled_by_default(self):
+        requestor = Requestor("praw:test", session=self.session)
+        self.session.request.return_value = response(200, b"{}", ETag='"1"')
+        requestor.request("GET", "https://oauth.reddit.com/r/a/about")
+        requestor.request("GET", "https://oauth.reddit.com/r/a/about")
+        assert "If-None-Match" not in (
+            self.session.request.call_args[1].get("headers") or {}
+        )
+        assert not requestor._validators
+
+    def test_request__modified(self):
+        self.session.request.side_effect = [
+            response(200, b"1", **{"Last-Modified": "yesterday"}),
+            response(200, b"2", **{"Last-Modified": "today"}),
+            response(304),
+        ]
+        self.request()
+        assert self.request().json() == 2
+        assert self.sent_headers()["If-Modified-Since"] == "yesterday"
+        assert not self.requestor.not_modified
+        assert self.request().json() == 2
+        assert self.sent_headers()["If-Modified-Since"] == "today"
+
+    def test_request__without_validators(self):
+        self.session.request.side_effect = [response(200), response(200)]
+        self.request()
+        self.request()
+        assert "If-None-Match" not in self.sent_headers()
+        assert not self.requestor._validators
+
+    def test_request__max_validators(self):
+        self.requestor.max_validators = 1
+        self.session.request.return_value = response(200, b"{}", ETag='"1"')
+        self.request("https://oauth.reddit.com/a")
+        self.request("https://oauth.reddit.com/b")
+        assert len(self.requestor._validators) == 1
+        self.request("https://oauth.reddit.com/a")
+        assert "If-None-Match" not in self.sent_headers()
+
+    def test_init__pool(self):
+        requestor = Requestor("praw:test", pool_block=True, pool_maxsize=64)
+        adapter = requestor._http.get_adapter("https://oauth.reddit.com")
+        assert adapter._pool_block
+        assert adapter._pool_maxsize == 64
+        assert requestor._http.get_adapter("http://i.redd.it") is adapter
+
+    def test_request__json_backend(self):
+        backend = mock.Mock(spec=JSONBackend)
+        backend.loads.return_value = {"a": 1}
+        self.requestor.json_backend = backend
+        self.session.request.return_value = response(200, b'{"a": 2}')
+        assert self.request().json() == {"a": 1}
+        backend.loads.assert_called_with(b'{"a": 2}')
+
+    def test_request__metrics(self):
+        self.session.request.return_value = response(200, b"1234")
+        self.requestor.metrics = RequestMetrics("GET", "r/a/about", None)
+        self.request()
+        self.request()
+        metrics = self.requestor.metrics
+        assert metrics.attempts == 2
+        assert metrics.network > 0
+        assert metrics.response_bytes == 8
+        assert metrics.status == 200
+
+    def test_request__timeout(self):
+        requestor = Requestor("praw:test", session=self.session, timeout=3)
+        self.session.request.return_value = response(200)
+        requestor.request("POST", "https://oauth.reddit.com/api/comment")
+        assert self.session.request.call_args[1]["timeout"] == 3
+
+    def test_request__timeout_argument(self):
+        requestor = Requestor("praw:test", session=self.session, timeout=3)
+        self.session.request.return_value = response(200)
+        requestor.request(
+            "POST", "https://oauth.reddit.com/api/comment", timeout=5
+        )
+        assert self.session.request.call_args[1]["timeout"] == 5
+
+    def test_request__error(self):
+        self.session.request.side_effect = ConnectionError()
+        with pytest.raises(RequestException):
+            self.request()
+
+    def test_upload(self):
+        requestor = Requestor("praw:test", session=self.session, timeout=3)
+        requestor.upload("https://s3.amazonaws.com", {"key": "a"}, {})
+        self.session.post.assert_called_with(
+            "https://s3.amazonaws.com", data={"key": "a"}, files={}, timeout=3
+        )
+
+    def test_pickle(self):
+        self.requestor._validators["key"] = ({}, {})
+        other = pickle.loads(pickle.dumps(Requestor("praw:test")))
+        assert other._validators == {}
+        assert not other.not_modified
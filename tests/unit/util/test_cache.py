@@ -1,8 +1,15 @@
 """Test praw.util.cache."""
+import mock
+import pytest
 
 from .. import UnitTest
 
-from praw.util.cache import cachedproperty
+from praw.util.cache import (
+    FileResponseCache,
+    ResponseCache,
+    cachedconversion,
+    cachedproperty,
+)
 
 
 class TestCachedProperty(UnitTest):
@@ -41,3 +48,113 @@ class TestCachedProperty(UnitTest):
     def test_doc(self):
         assert self.Klass.nine.__doc__ == "Return 9."
         assert self.Klass.ten.__doc__ == "Return 10."
+
+
+class TestCachedConversion(UnitTest):
+    class Klass:
+        number = cachedconversion("number", lambda self, value: int(value))
+
+    def test_get(self):
+        klass = self.Klass()
+        klass.number = "9"
+        assert klass.__dict__["number"] == "9"
+        assert klass.number == 9
+        assert klass.__dict__["number"] == 9
+
+    def test_get__not_set(self):
+        with pytest.raises(AttributeError):
+            self.Klass().number
+
+    def test_get__other_type(self):
+        klass = self.Klass()
+        klass.number = None
+        assert klass.number is None
+
+    def test_repr(self):
+        assert repr(self.Klass.number) == "<cachedconversion number>"
+
+
+class TestResponseCache(UnitTest):
+    def cache(self):
+        return ResponseCache(ttls={"rules": 10}, max_entries=2)
+
+    @mock.patch("time.time", return_value=0)
+    def test_expiration(self, mock_time):
+        cache = self.cache()
+        assert cache.set("r/a/about/rules", None, {"rules": []})
+        mock_time.return_value = 9.9
+        assert cache.get("r/a/about/rules") == {"rules": []}
+        mock_time.return_value = 10
+        assert cache.get("r/a/about/rules") is None
+        assert len(cache) == 0
+
+    def test_get__returns_copies(self):
+        cache = self.cache()
+        cache.set("r/a/about/rules", None, {"rules": []})
+        cache.get("r/a/about/rules")["rules"].append(1)
+        assert cache.get("r/a/about/rules") == {"rules": []}
+
+    def test_identity(self):
+        cache = self.cache()
+        cache.set("r/a/about/rules", None, {"rules": [1]}, "user:a")
+        cache.set("r/a/about/rules", None, {"rules": [2]}, "user:b")
+        assert cache.get("r/a/about/rules", None, "user:a") == {"rules": [1]}
+        assert cache.get("r/a/about/rules", None, "user:b") == {"rules": [2]}
+        assert cache.get("r/a/about/rules") is None
+        cache.invalidate("r/a/about/rules")
+        assert cache.get("r/a/about/rules", None, "user:a") is None
+
+    def test_invalidate(self):
+        cache = self.cache()
+        cache.set("r/a/about/rules", {"raw_json": 1}, {"rules": []})
+        cache.set("r/b/about/rules", None, {"rules": []})
+        cache.invalidate("/r/A/about/rules/")
+        assert cache.get("r/a/about/rules", {"raw_json": 1}) is None
+        assert cache.get("r/b/about/rules") == {"rules": []}
+
+    def test_max_entries(self):
+        cache = self.cache()
+        for subreddit in "abc":
+            cache.set("r/{}/about/rules".format(subreddit), None, {})
+            cache.get("r/a/about/rules")
+        assert len(cache) == 2
+        assert cache.get("r/a/about/rules") == {}
+        assert cache.get("r/b/about/rules") is None
+
+    def test_params(self):
+        cache = self.cache()
+        cache.set("r/a/about/rules", {"b": "2", "a": "1"}, {"rules": []})
+        assert cache.get("r/a/about/rules", {"a": "1", "b": "2"})
+        assert cache.get("r/a/about/rules", "a=1&b=2")
+        assert cache.get("r/a/about/rules") is None
+
+    def test_set__without_ttl(self):
+        cache = self.cache()
+        assert not cache.set("r/a/new", None, {})
+        assert not cache.set("r/a/about/rules", None, None)
+        assert len(cache) == 0
+
+
+class TestFileResponseCache(TestResponseCache):
+    @pytest.fixture(autouse=True)
+    def directory(self, tmpdir):
+        self.directory = str(tmpdir)
+
+    def cache(self):
+        return FileResponseCache(self.directory, ttls={"rules": 10})
+
+    def test_clear(self):
+        cache = self.cache()
+        cache.set("r/a/about/rules", None, {})
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_max_entries(self):
+        cache = self.cache()
+        for subreddit in "abc":
+            cache.set("r/{}/about/rules".format(subreddit), None, {})
+        assert len(cache) == 3
+
+    def test_shared_between_instances(self):
+        self.cache().set("r/a/about/rules", None, {"rules": []})
+        assert self.cache().get("r/a/about/rules") == {"rules": []}
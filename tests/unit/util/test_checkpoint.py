@@ -0,0 +1,54 @@
+"""Test praw.util.checkpoint."""
+import os
+
+import pytest
+
+from .. import UnitTest
+
+from praw.util.checkpoint import Checkpoint, FileCheckpoint, SQLiteCheckpoint
+
+
+class TestCheckpoint(UnitTest):
+    def test_save(self):
+        checkpoint = Checkpoint()
+        assert checkpoint.load() is None
+        state = {"last": "t1_b", "seen": ["t1_a", "t1_b"]}
+        checkpoint.save(state)
+        state["seen"].append("t1_c")
+        assert checkpoint.load() == {"last": "t1_b", "seen": ["t1_a", "t1_b"]}
+
+
+class TestFileCheckpoint(UnitTest):
+    @pytest.fixture(autouse=True)
+    def path(self, tmpdir):
+        self.path = os.path.join(str(tmpdir), "checkpoint.json")
+
+    def test_save(self):
+        checkpoint = FileCheckpoint(self.path)
+        assert checkpoint.load() is None
+        checkpoint.save({"last": "t1_a", "seen": ["t1_a"]})
+        checkpoint.save({"last": "t1_b", "seen": ["t1_a", "t1_b"]})
+        assert FileCheckpoint(self.path).load() == {
+            "last": "t1_b",
+            "seen": ["t1_a", "t1_b"],
+        }
+        assert os.listdir(os.path.dirname(self.path)) == ["checkpoint.json"]
+
+
+class TestSQLiteCheckpoint(UnitTest):
+    @pytest.fixture(autouse=True)
+    def path(self, tmpdir):
+        self.path = os.path.join(str(tmpdir), "checkpoints.db")
+
+    def test_save(self):
+        first = SQLiteCheckpoint(self.path)
+        second = SQLiteCheckpoint(self.path, "second")
+        assert first.load() is None
+        first.save({"last": "t1_a", "seen": ["t1_a"]})
+        first.save({"last": "t1_b", "seen": ["t1_a", "t1_b"]})
+        second.save({"last": "t3_a", "seen": []})
+        assert SQLiteCheckpoint(self.path).load() == {
+            "last": "t1_b",
+            "seen": ["t1_a", "t1_b"],
+        }
+        assert second.load() == {"last": "t3_a", "seen": []}
@@ -0,0 +1,20 @@
+"""Test praw.util.endpoints."""
+from praw.util.endpoints import endpoint_name, normalize_path
+
+from .. import UnitTest
+
+
+class TestEndpoints(UnitTest):
+    def test_endpoint_name(self):
+        assert endpoint_name("r/redditdev/about/rules") == "rules"
+        assert endpoint_name("/r/redditdev/about/") == "subreddit_about"
+        assert endpoint_name("api/v1/me") == "me"
+        assert endpoint_name("api/v1/me/prefs") == "preferences"
+        assert endpoint_name("r/redditdev/wiki/a/b") == "wiki_page"
+        assert endpoint_name("R/RedditDev/api/widgets?x=1") == "widgets"
+
+    def test_endpoint_name__unknown(self):
+        assert endpoint_name("r/redditdev/new") is None
+
+    def test_normalize_path(self):
+        assert normalize_path("/api/info/?id=t3_a") == "api/info"
@@ -0,0 +1,76 @@
+"""Test praw.util.jsonbackend."""
+import json
+
+import pytest
+
+from praw.util.jsonbackend import (
+    JSONBackend,
+    OrjsonBackend,
+    UjsonBackend,
+    json_backend,
+    orjson,
+    ujson,
+)
+
+from .. import UnitTest
+
+
+class SetEncoder(json.JSONEncoder):
+    def default(self, o):
+        if isinstance(o, set):
+            return sorted(o)
+        return super().default(o)
+
+
+class TestJSONBackend(UnitTest):
+    def test_dumps(self):
+        assert json.loads(JSONBackend().dumps({"a": [1, "é"]})) == {
+            "a": [1, "é"]
+        }
+        assert JSONBackend().dumps({2, 1}, cls=SetEncoder) == "[1, 2]"
+
+    def test_loads(self):
+        backend = JSONBackend()
+        assert backend.loads(b'{"a": "\xc3\xa9"}') == {"a": "é"}
+        assert backend.loads('{"a": null}') == {"a": None}
+        with pytest.raises(ValueError):
+            backend.loads(b"<html>")
+
+    def test_repr(self):
+        assert repr(JSONBackend()) == "JSONBackend()"
+
+
+@pytest.mark.skipif(orjson is None, reason="orjson is not installed")
+class TestOrjsonBackend(UnitTest):
+    def test_dumps(self):
+        backend = OrjsonBackend()
+        assert json.loads(backend.dumps({"a": [1, "é"]})) == {"a": [1, "é"]}
+        assert backend.dumps({2, 1}, cls=SetEncoder) == "[1,2]"
+
+    def test_loads(self):
+        backend = OrjsonBackend()
+        assert backend.loads(b'{"a": "\xc3\xa9"}') == {"a": "é"}
+        assert backend.loads('{"a": null}') == {"a": None}
+        with pytest.raises(ValueError):
+            backend.loads(b"<html>")
+
+
+class TestJSONBackendByName(UnitTest):
+    def test_auto(self):
+        expected = OrjsonBackend if orjson is not None else JSONBackend
+        assert isinstance(json_backend("auto"), expected)
+
+    def test_default(self):
+        assert type(json_backend()) is JSONBackend
+
+    @pytest.mark.skipif(ujson is not None, reason="ujson is installed")
+    def test_not_installed(self):
+        with pytest.raises(ImportError):
+            json_backend("ujson")
+        with pytest.raises(ImportError):
+            UjsonBackend()
+
+    def test_unknown(self):
+        with pytest.raises(ValueError) as excinfo:
+            json_backend("simplejson")
+        assert "auto, json, orjson, ujson" in str(excinfo.value)
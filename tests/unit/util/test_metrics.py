@@ -0,0 +1,66 @@
+"""Test praw.util.metrics."""
+import pickle
+
+from .. import UnitTest
+
+from praw.util.metrics import MetricsAggregator, RequestMetrics
+
+
+def request_metrics(endpoint="info", status=200, network=0.02, **kwargs):
+    metrics = RequestMetrics("GET", "api/info", endpoint)
+    metrics.network = network
+    metrics.response_bytes = 100
+    metrics.status = status
+    for attribute, value in kwargs.items():
+        setattr(metrics, attribute, value)
+    return metrics
+
+
+class TestRequestMetrics(UnitTest):
+    def test_total(self):
+        metrics = request_metrics(decode=0.005, queue=1, ratelimit=0.5)
+        assert metrics.total == 1.525
+        assert repr(metrics) == (
+            "RequestMetrics('GET', 'api/info', status=200, total=1.525)"
+        )
+
+
+class TestMetricsAggregator(UnitTest):
+    def test_pickle(self):
+        aggregator = MetricsAggregator()
+        aggregator(request_metrics())
+        other = pickle.loads(pickle.dumps(aggregator))
+        assert other.prometheus() == aggregator.prometheus()
+
+    def test_prometheus(self):
+        aggregator = MetricsAggregator(buckets=[0.01, 0.1])
+        aggregator(request_metrics(remaining=599.0))
+        aggregator(request_metrics(network=0.5))
+        aggregator(request_metrics(endpoint=None, status=None, cached=True))
+        aggregator(request_metrics(endpoint=None, status=None))
+        lines = aggregator.prometheus().splitlines()
+        assert (
+            'praw_requests_total{endpoint="info",method="GET",'
+            'status="200"} 2' in lines
+        )
+        assert (
+            'praw_requests_total{endpoint="other",method="GET",'
+            'status="cached"} 1' in lines
+        )
+        assert (
+            'praw_requests_total{endpoint="other",method="GET",'
+            'status="error"} 1' in lines
+        )
+        assert (
+            'praw_response_bytes_total{endpoint="info",method="GET"} '
+            "200" in lines
+        )
+        labels = 'endpoint="info",method="GET",phase="network"'
+        assert [line for line in lines if labels in line] == [
+            'praw_request_duration_seconds_bucket{%s,le="0.01"} 0' % labels,
+            'praw_request_duration_seconds_bucket{%s,le="0.1"} 1' % labels,
+            'praw_request_duration_seconds_bucket{%s,le="+Inf"} 2' % labels,
+            "praw_request_duration_seconds_sum{%s} 0.52" % labels,
+            "praw_request_duration_seconds_count{%s} 2" % labels,
+        ]
+        assert "praw_ratelimit_remaining 599.0" in lines
@@ -0,0 +1,106 @@
+"""Test praw.util.scheduler."""
+import pickle
+import time
+from threading import Event, Thread
+
+import pytest
+
+from .. import UnitTest
+
+from praw.util.scheduler import RequestScheduler
+
+
+class TestRequestScheduler(UnitTest):
+    @staticmethod
+    def start(scheduler, priority, order):
+        def acquire():
+            scheduler.acquire(priority)
+            order.append(priority)
+
+        waiting = len(scheduler._queue)
+        thread = Thread(target=acquire)
+        thread.start()
+        while len(scheduler._queue) == waiting:
+            Event().wait(0.001)
+        return thread
+
+    @staticmethod
+    def exhaust(scheduler):
+        scheduler.update(remaining=0, reset_timestamp=time.time() + 60)
+
+    def test_acquire__before_rate_limit(self):
+        scheduler = RequestScheduler()
+        start = time.time()
+        for _ in range(10):
+            scheduler.acquire()
+        assert time.time() - start < 1
+
+    def test_acquire__fairness(self):
+        scheduler = RequestScheduler(
+            priorities={"bulk": 0.01, "fast": 0}, default_priority="fast"
+        )
+        self.exhaust(scheduler)
+        order = []
+        threads = [self.start(scheduler, "bulk", order)]
+        Event().wait(0.05)
+        threads.append(self.start(scheduler, "fast", order))
+        scheduler.update(remaining=100, reset_timestamp=time.time() + 1)
+        for thread in threads:
+            thread.join()
+        assert order == ["bulk", "fast"]
+
+    def test_acquire__priority_order(self):
+        scheduler = RequestScheduler()
+        self.exhaust(scheduler)
+        order = []
+        threads = [
+            self.start(scheduler, priority, order)
+            for priority in ("bulk", "moderation", "bulk", "interactive")
+        ]
+        scheduler.update(remaining=100, reset_timestamp=time.time() + 1)
+        for thread in threads:
+            thread.join()
+        assert order == ["interactive", "moderation", "bulk", "bulk"]
+
+    def test_pickle(self):
+        scheduler = RequestScheduler()
+        self.exhaust(scheduler)
+        other = pickle.loads(pickle.dumps(scheduler))
+        assert other._queue == []
+        assert other._rate == scheduler._rate
+        with other.priority("bulk"):
+            assert other.current_priority == "bulk"
+
+    def test_priority(self):
+        scheduler = RequestScheduler()
+        assert scheduler.current_priority == "interactive"
+        with scheduler.priority("bulk"):
+            assert scheduler.current_priority == "bulk"
+            with scheduler.priority("moderation"):
+                assert scheduler.current_priority == "moderation"
+            assert scheduler.current_priority == "bulk"
+        assert scheduler.current_priority == "interactive"
+
+    def test_priority__unknown(self):
+        with pytest.raises(ValueError):
+            RequestScheduler(default_priority="urgent")
+        with pytest.raises(ValueError):
+            with RequestScheduler().priority("urgent"):
+                pass
+
+    def test_update(self):
+        scheduler = RequestScheduler(burst=5)
+        now = time.time()
+        scheduler.update(remaining=300, reset_timestamp=now + 600)
+        assert scheduler._rate == pytest.approx(0.5, rel=0.01)
+        assert scheduler._tokens == 5
+        scheduler.update(remaining=2, reset_timestamp=now + 600)
+        assert scheduler._tokens == 2
+        self.exhaust(scheduler)
+        assert scheduler._tokens == 0
+        assert scheduler._seconds_until_token(time.time()) == pytest.approx(
+            60, rel=0.01
+        )
+        rate = scheduler._rate
+        scheduler.update()
+        assert scheduler._rate == rate
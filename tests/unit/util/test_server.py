@@ -0,0 +1,123 @@
+"""Test praw.util.server."""
+import mock
+import requests
+
+from .. import UnitTest
+
+from praw import Reddit
+from praw.util.server import RedditServer, SyntheticDataset
+
+
+class TestRedditServer(UnitTest):
+    def run(self, dataset=None, **kwargs):
+        kwargs.setdefault("ratelimit_requests", None)
+        self.server = RedditServer(dataset or self.dataset, **kwargs)
+        self.server.start()
+        self.client = Reddit(
+            client_id="dummy",
+            client_secret="dummy",
+            oauth_url=self.server.url,
+            password="dummy",
+            reddit_url=self.server.url,
+            user_agent="dummy",
+            username="user0",
+        )
+
+    def setup(self):
+        super().setup()
+        self.dataset = SyntheticDataset(
+            subreddits=2, users=5, submissions=250, comments=500
+        )
+        self.server = None
+
+    def teardown(self):
+        if self.server is not None:
+            self.server.stop()
+
+    def test_comments(self):
+        dataset = SyntheticDataset(submissions=1, comments=300)
+        self.run(dataset)
+        name = dataset.listing("r/all").names[0]
+        submission = self.client.submission(name[3:])
+        submission.comment_limit = 50
+        assert len(submission.comments.list()) < 300
+        assert submission.comments.replace_more(limit=None) == []
+        comments = submission.comments.list()
+        assert len({comment.id for comment in comments}) == 300
+
+    @mock.patch.object(RedditServer, "_me", side_effect=RuntimeError)
+    def test_handler_error(self, _):
+        self.run()
+        response = requests.get(self.server.url + "/api/v1/me")
+        assert response.status_code == 500
+        assert response.json()["error"] == 500
+
+    def test_info(self):
+        self.run()
+        names = self.dataset.listing("r/all").names[:2]
+        items = list(self.client.info(names + ["t3_zzzzzz"]))
+        assert [item.fullname for item in items] == names
+
+    def test_listing(self):
+        self.run()
+        names = self.dataset.listing("r/subreddit0").names
+        submissions = list(self.client.subreddit("subreddit0").new(limit=None))
+        assert [item.fullname for item in submissions] == names[::-1]
+        assert self.server.requests == -(-len(names) // 100)
+
+    def test_modmail(self):
+        self.run()
+        modmail = self.client.subreddit("all").modmail
+        conversation = next(modmail.conversations())
+        assert len(modmail(conversation.id).messages) == 3
+        message = conversation.reply("Reply")
+        assert message.body_markdown == "Reply"
+        assert len(modmail(conversation.id).messages) == 4
+
+    def test_ratelimit(self):
+        self.run(ratelimit_requests=2, ratelimit_window=600)
+        url = self.server.url + "/api/v1/me"
+        response = requests.get(url)
+        assert response.status_code == 200
+        assert response.headers["x-ratelimit-remaining"] == "1.0"
+        assert response.headers["x-ratelimit-used"] == "1"
+        assert 0 < int(response.headers["x-ratelimit-reset"]) <= 600
+        assert requests.get(url).status_code == 200
+        assert requests.get(url).status_code == 429
+
+    def test_error_rate(self):
+        self.run(error_rate=1, error_status=503)
+        assert requests.get(self.server.url + "/api/v1/me").status_code == 503
+        response = requests.post(self.server.url + "/api/v1/access_token")
+        assert response.json()["access_token"]
+
+    def test_submit_and_reply(self):
+        self.run()
+        stream = self.client.subreddit("subreddit1").stream.submissions(
+            pause_after=-1
+        )
+        assert len(list(iter(lambda: next(stream), None))) == 100
+        submission = self.client.subreddit("subreddit1").submit(
+            "Title", selftext=""
+        )
+        assert list(iter(lambda: next(stream), None)) == [submission]
+        comment = submission.reply("Body")
+        assert comment.parent_id == submission.fullname
+        assert comment.author == "user0"
+        assert self.dataset.children(submission.fullname) == [comment.fullname]
+
+    def test_unknown_path(self):
+        self.run()
+        url = self.server.url + "/api/unknown/endpoint"
+        assert requests.get(url).status_code == 404
+        assert requests.post(url).json() == {}
+
+    def test_unknown_thing(self):
+        self.run()
+        url = self.server.url + "/api/comment"
+        response = requests.post(url, data={"thing_id": "t3_zzzzzz"})
+        assert response.status_code == 200
+        assert response.json()["json"]["errors"][0][0] == "NO_THING_ID"
+        url = self.server.url + "/api/mod/conversations/zzzzzz"
+        assert requests.get(url).status_code == 404
+        assert requests.post(url, data={"body": "Body"}).status_code == 404